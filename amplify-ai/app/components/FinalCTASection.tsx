@@ -4,6 +4,7 @@ import React, { useState } from "react";
 import { motion } from "framer-motion";
 import { useRouter } from "next/navigation";
 import { ArrowRight, Sparkles, Loader2 } from "lucide-react";
+import { readAnalysisResult } from "../lib/analyzeStream";
 
 export default function FinalCTASection() {
   const [url, setUrl] = useState("");
@@ -21,7 +22,7 @@ export default function FinalCTASection() {
       // ✅ Environment Switcher (Matches HeroSection)
       const API_BASE = process.env.NEXT_PUBLIC_API_URL || "http://localhost:8000";
       
-      const response = await fetch(`${API_BASE}/analyze`, {
+      const response = await fetch(`${API_BASE}/analyze/stream`, {
         method: "POST",
         headers: { "Content-Type": "application/json" },
         body: JSON.stringify({ url: cleanUrl }), 
@@ -38,7 +39,7 @@ export default function FinalCTASection() {
         throw new Error("Analysis failed");
       }
       
-      const data = await response.json();
+      const data = await readAnalysisResult(response);
       const resultWithUrl = { ...data, url: cleanUrl };
       
       // Save data for the Dashboard to pick up
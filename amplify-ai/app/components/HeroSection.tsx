@@ -4,6 +4,7 @@ import React, { useState, useEffect } from "react";
 import { motion, AnimatePresence, Variants } from "framer-motion";
 import { useRouter } from 'next/navigation';
 import { Search, Cpu, ArrowRight, Check, Zap, ShieldCheck, Users } from "lucide-react";
+import { readAnalysisResult } from "../lib/analyzeStream";
 
 // ✅ STRATEGY UPDATE: FORENSIC LOADING STEPS
 // Replaced generic "Connecting..." with specific "Value Calculation" steps.
@@ -61,7 +62,7 @@ export default function HeroSection() {
     try {
       const API_BASE = process.env.NEXT_PUBLIC_API_URL || "http://localhost:8000";
       
-      const response = await fetch(`${API_BASE}/analyze`, {
+      const response = await fetch(`${API_BASE}/analyze/stream`, {
         method: "POST",
         headers: { "Content-Type": "application/json" },
         body: JSON.stringify({ url: cleanUrl }), 
@@ -77,7 +78,7 @@ export default function HeroSection() {
         throw new Error("Analysis failed");
       }
       
-      const data = await response.json();
+      const data = await readAnalysisResult(response);
       const resultWithUrl = { ...data, url: cleanUrl };
       
       localStorage.setItem('amplifyAnalysis', JSON.stringify(resultWithUrl));
@@ -631,13 +631,20 @@ export default function DashboardPage() {
       const API_BASE = process.env.NEXT_PUBLIC_API_URL || "http://localhost:8000";
       const cleanUrl = url.toLowerCase().replace('https://', '').replace('http://', '').replace('www.', '').split('/')[0];
       
-      // Wait for backend generation
-      await new Promise(resolve => setTimeout(resolve, 3000));
-
-      const response = await fetch(`${API_BASE}/persona/${cleanUrl}`);
+      // Backend pushes one "persona" event as soon as generation finishes (no fixed wait)
+      const data = await new Promise<any>((resolve) => {
+        const source = new EventSource(`${API_BASE}/persona/${cleanUrl}/stream`);
+        source.addEventListener('persona', (event) => {
+          source.close();
+          resolve(JSON.parse((event as MessageEvent).data));
+        });
+        source.onerror = () => {
+          source.close();
+          resolve(null);
+        };
+      });
 
-      if (response.ok) {
-        const data = await response.json();
+      if (data) {
         if (data.status === "ready" && data.data) {
           setPersonaData(data.data);
           
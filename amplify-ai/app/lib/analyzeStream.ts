@@ -0,0 +1,41 @@
+// POST /analyze/stream reader (Server-Sent Events over fetch; EventSource cannot POST)
+// The backend sends cache -> scrape -> math -> ai_judgment -> result -> persona -> done
+// ("joined" first when another visitor is already scanning the same site). The scan result is
+// all the landing page needs: the dashboard picks the persona up from /persona/{url}/stream.
+
+export type AnalysisResult = Record<string, unknown>;
+
+export async function readAnalysisResult(response: Response): Promise<AnalysisResult> {
+  if (!response.body) throw new Error("Analysis stream unavailable");
+  const reader = response.body.getReader();
+  const decoder = new TextDecoder();
+  let buffer = "";
+
+  try {
+    while (true) {
+      const { value, done } = await reader.read();
+      if (done) break;
+      buffer += decoder.decode(value, { stream: true });
+
+      let boundary;
+      while ((boundary = buffer.indexOf("\n\n")) !== -1) {
+        const block = buffer.slice(0, boundary);
+        buffer = buffer.slice(boundary + 2);
+
+        let event = "message";
+        let data = "";
+        for (const line of block.split("\n")) {
+          if (line.startsWith("event:")) event = line.slice(6).trim();
+          else if (line.startsWith("data:")) data += line.slice(5).trim();
+        }
+        const payload = data ? JSON.parse(data) : null;
+
+        if (event === "result") return payload as AnalysisResult;
+        if (event === "error") throw new Error(payload?.detail || "Analysis failed");
+      }
+    }
+  } finally {
+    reader.cancel().catch(() => {});
+  }
+  throw new Error("Analysis stream ended without a result");
+}
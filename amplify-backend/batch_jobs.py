@@ -0,0 +1,182 @@
+# batch_jobs.py
+# Building blocks for /analyze-batch: job records, per-host + global scrape limits
+# and grouping of sites into shared LLM prompts (math scoring runs on score_pool).
+# The scan pipeline itself lives in main.py (run_batch), which owns the clients and caches.
+
+import os
+import time
+import uuid
+import asyncio
+from urllib.parse import urlparse
+
+BATCH_MAX_URLS = int(os.getenv("BATCH_MAX_URLS", "2000"))
+
+
+class BatchJob:
+    """
+    One submitted URL list. `results` fills in completion order (each item carries its
+    input `index`); `wait_for(n)` lets a stream wait until more than n results exist.
+    """
+
+    def __init__(self, urls: list, email: str):
+        self.id = uuid.uuid4().hex
+        self.urls = urls
+        self.email = email
+        self.results = []
+        self.status = "queued"
+        self.failed = 0
+        self.created_at = time.time()
+        self.started_at = None
+        self.finished_at = None
+        self._changed = asyncio.Event()
+
+    def add(self, index: int, url: str, result: dict = None, error: str = None):
+        if error: self.failed += 1
+        self.results.append({"index": index, "url": url, "result": result, "error": error})
+        self._notify()
+
+    def finish(self, status: str = "done"):
+        self.status = status
+        self.finished_at = time.time()
+        self._notify()
+
+    @property
+    def done(self) -> bool:
+        return self.finished_at is not None
+
+    def _notify(self):
+        changed, self._changed = self._changed, asyncio.Event()
+        changed.set()
+
+    async def wait_for(self, seen: int, timeout: float = 15.0):
+        """Returns once more than `seen` results exist, the job finished, or `timeout` passed."""
+        changed = self._changed
+        if len(self.results) > seen or self.done: return
+        try: await asyncio.wait_for(changed.wait(), timeout)
+        except asyncio.TimeoutError: pass
+
+    def progress(self) -> dict:
+        elapsed = ((self.finished_at or time.time()) - self.started_at) if self.started_at else 0.0
+        completed = len(self.results)
+        return {
+            "job_id": self.id, "status": self.status,
+            "total": len(self.urls), "completed": completed, "failed": self.failed,
+            "elapsed_s": round(elapsed, 2),
+            "urls_per_minute": round(completed / elapsed * 60, 1) if elapsed > 0 else 0.0,
+        }
+
+
+class HostLimiter:
+    """`async with limiter.slot(url):` - at most `per_host` scrapes per host and `total` overall."""
+
+    def __init__(self, total: int = None, per_host: int = None):
+        self.total = total or int(os.getenv("BATCH_SCRAPE_CONCURRENCY", "32"))
+        self.per_host = per_host or int(os.getenv("BATCH_PER_HOST", "2"))
+        self._global = asyncio.Semaphore(self.total)
+        self._hosts = {}  # host -> [semaphore, users]
+
+    def slot(self, url: str):
+        return _HostSlot(self, urlparse(url if "://" in url else "https://" + url).netloc.lower())
+
+
+class _HostSlot:
+    def __init__(self, limiter: HostLimiter, host: str):
+        self.limiter = limiter
+        self.host = host
+
+    async def __aenter__(self):
+        entry = self.limiter._hosts.setdefault(self.host, [asyncio.Semaphore(self.limiter.per_host), 0])
+        entry[1] += 1
+        self.entry = entry
+        # Per-host first, so a crowded host does not hold global slots while it waits
+        await entry[0].acquire()
+        try:
+            await self.limiter._global.acquire()
+        except BaseException:
+            self._release_host()
+            raise
+
+    async def __aexit__(self, *exc):
+        self.limiter._global.release()
+        self._release_host()
+
+    def _release_host(self):
+        self.entry[0].release()
+        self.entry[1] -= 1
+        if self.entry[1] == 0: self.limiter._hosts.pop(self.host, None)
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# GROUPED LLM JUDGMENTS
+# ═══════════════════════════════════════════════════════════════════════════
+
+def build_group_prompt(items: list) -> str:
+    """One judgment prompt for several sites; `items` are dicts with url, title, text, math_total."""
+    sites = "\n".join(
+        f'[{i}] URL: {item["url"]} | Title: {item["title"]} | Math Score: {item["math_total"]}/60\n'
+        f'    Content: "{item["text"][:1500]}"'
+        for i, item in enumerate(items)
+    )
+    return f"""
+    You are an AI Visibility Analyst. Evaluate EACH website below independently.
+    {sites}
+    For every site evaluate 3 Dimensions (0-35 points total):
+    1. BRAND CLARITY (0-15): Value prop clear?
+    2. TRUST (0-15): Evidence/Social proof?
+    3. SENTIMENT (0-5): Positive recommendation?
+    RETURN JSON: {{"sites": [{{"id": <number in brackets>, "ai_judgment_score": {{"total": 0, "breakdown": {{}}}}, "industry": "", "company_tier": "", "detected_issues": [], "fix_list": []}}]}}
+    """
+
+
+def split_group_answer(data, count: int) -> list:
+    """Per-site judgment dicts in input order; None where the answer is missing or malformed."""
+    judged = [None] * count
+    sites = data.get("sites") if isinstance(data, dict) else None
+    for site in sites if isinstance(sites, list) else []:
+        try: idx = int(site.get("id"))
+        except (AttributeError, TypeError, ValueError): continue
+        if 0 <= idx < count and isinstance(site.get("ai_judgment_score"), dict):
+            judged[idx] = site
+    return judged
+
+
+class JudgmentGrouper:
+    """
+    Collects judgment requests and sends them `group_size` at a time through `judge_group`
+    (a coroutine taking a list of items, returning one result per item). A partial group
+    is sent after `linger` seconds; `concurrency` groups run at once.
+    """
+
+    def __init__(self, judge_group, group_size: int = None, linger: float = None, concurrency: int = None):
+        self.judge_group = judge_group
+        self.group_size = group_size or int(os.getenv("BATCH_LLM_GROUP", "5"))
+        self.linger = linger if linger is not None else float(os.getenv("BATCH_LLM_LINGER", "0.5"))
+        self._queue = asyncio.Queue()
+        self._workers = [asyncio.create_task(self._run()) for _ in range(concurrency or int(os.getenv("BATCH_LLM_CONCURRENCY", "4")))]
+        self.groups = 0
+
+    async def judge(self, item: dict) -> dict:
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((item, future))
+        return await future
+
+    async def _run(self):
+        while True:
+            group = [await self._queue.get()]
+            deadline = asyncio.get_running_loop().time() + self.linger
+            while len(group) < self.group_size:
+                remaining = deadline - asyncio.get_running_loop().time()
+                if remaining <= 0: break
+                try: group.append(await asyncio.wait_for(self._queue.get(), remaining))
+                except asyncio.TimeoutError: break
+            self.groups += 1
+            try:
+                results = await self.judge_group([item for item, _ in group])
+                for (_, future), result in zip(group, results):
+                    if not future.done(): future.set_result(result)
+            except Exception as e:
+                for _, future in group:
+                    if not future.done(): future.set_exception(e)
+
+    def close(self):
+        for worker in self._workers: worker.cancel()
@@ -0,0 +1,82 @@
+# benchmarks/bench_batch.py
+# Throughput for a list of URLs spread over HOSTS local sites
+#   sequential: one POST /analyze per URL, one after another (what agencies do today)
+#   batch: POST /analyze-batch, then read /analyze-batch/{id}/stream until done
+# The stub LLM answers both single and grouped judgment prompts. Supabase is disabled.
+#
+#   python benchmarks/bench_batch.py
+
+import io
+import os
+import json
+import time
+import asyncio
+import contextlib
+
+from harness import StaticSite, StubLLM, DEFAULT_JUDGMENT
+
+SITE_DELAY = 0.2
+LLM_DELAY = 0.3
+HOSTS = 10
+URLS = (50, 200)
+
+for key in ("GROQ_API_KEY", "GOOGLE_API_KEY", "NEXT_PUBLIC_SUPABASE_URL", "NEXT_PUBLIC_SUPABASE_ANON_KEY"):
+    os.environ[key] = ""
+os.environ["LLM_CACHE_PATH"] = "off"  # every run must reach the stub LLM
+
+GROUP_PAYLOAD = {**DEFAULT_JUDGMENT, "sites": [{"id": i, **DEFAULT_JUDGMENT} for i in range(int(os.getenv("BATCH_LLM_GROUP", "5")))]}
+
+
+async def _sequential(app, urls: list) -> float:
+    import httpx
+    transport = httpx.ASGITransport(app=app, client=("127.0.0.1", 5000))
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=120) as client:
+        t0 = time.perf_counter()
+        for url in urls:
+            (await client.post("/analyze", json={"url": url})).raise_for_status()
+        return time.perf_counter() - t0
+
+
+async def _batch(app, urls: list) -> tuple:
+    import httpx
+    transport = httpx.ASGITransport(app=app, client=("127.0.0.1", 5000))
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=600) as client:
+        t0 = time.perf_counter()
+        job = (await client.post("/analyze-batch", json={"urls": urls})).json()
+        progress = None
+        async with client.stream("GET", job["stream_url"]) as resp:
+            async for line in resp.aiter_lines():
+                if line and "progress" in json.loads(line): progress = json.loads(line)["progress"]
+        return time.perf_counter() - t0, progress
+
+
+def run(quick: bool = False) -> dict:
+    from groq import Groq
+    import main
+
+    results = {}
+    sites = [StaticSite(delay=SITE_DELAY) for _ in range(HOSTS)]
+    with contextlib.ExitStack() as stack, StubLLM(payload=GROUP_PAYLOAD, delay=LLM_DELAY) as llm:
+        for site in sites: stack.enter_context(site)
+        main.groq_client = Groq(api_key="stub", base_url=llm.groq_base_url, max_retries=0)
+        main.supabase = None
+        with contextlib.redirect_stdout(io.StringIO()):
+            for n in URLS[:1] if quick else URLS:
+                urls = [f"{sites[i % HOSTS].url}/?page={n}-{i}" for i in range(n)]
+                main.result_cache.clear()
+                llm.calls = 0
+                seq_s = asyncio.run(_sequential(main.app, urls[:20]))
+                seq_calls = llm.calls
+                main.result_cache.clear()
+                llm.calls = 0
+                batch_s, progress = asyncio.run(_batch(main.app, urls))
+                results[f"urls_{n}"] = {
+                    "sequential": {"urls": 20, "urls_per_minute": round(20 / seq_s * 60, 1), "llm_calls": seq_calls},
+                    "batch": {"urls": n, "wall_s": round(batch_s, 2), "urls_per_minute": round(n / batch_s * 60, 1),
+                              "llm_calls": llm.calls, "failed": progress["failed"] if progress else None},
+                }
+    return {"site_delay_ms": SITE_DELAY * 1000, "llm_delay_ms": LLM_DELAY * 1000, "hosts": HOSTS, "results": results}
+
+
+if __name__ == "__main__":
+    print(json.dumps(run(), indent=2))
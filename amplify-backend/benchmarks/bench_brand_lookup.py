@@ -0,0 +1,81 @@
+# benchmarks/bench_brand_lookup.py
+# get_brand_tier cost as the brand list grows (built-in tables + N synthetic domains)
+#   linear_scan: dict lookups, then endswith() over every TIER_1 entry (pre-index flow)
+#   domain_index: label-reversed trie (uncached) and the LRU-memoized get_brand_tier
+# Lookups mix exact hits, subdomain hits and misses; also counts linear_scan false positives.
+#
+#   python benchmarks/bench_brand_lookup.py
+
+import json
+import random
+from urllib.parse import urlparse
+
+from harness import time_call
+
+import famous_brands
+from domain_index import DomainIndex
+
+SIZES = (1_000, 10_000, 100_000)
+LOOKUPS = 2_000
+
+
+def _linear_scan(url: str, giants: dict, blocked: dict):
+    parsed = urlparse(url if url.startswith('http') else f'https://{url}')
+    domain = parsed.netloc.lower().replace('www.', '')
+    if domain in giants: return giants[domain]
+    if domain in blocked: return blocked[domain]
+    for known_domain, info in giants.items():
+        if domain.endswith(f'.{known_domain}') or domain.endswith(known_domain):
+            return info
+    return None
+
+
+def _brand_table(n: int, rng: random.Random) -> dict:
+    info = {"industry": "SaaS", "tier": "growth", "min_score": 75}
+    tlds = ("com", "io", "co.uk", "app", "net")
+    return {f"brand{i}x{rng.randrange(10**6)}.{tlds[i % len(tlds)]}": info for i in range(n)}
+
+
+def _urls(table: dict, rng: random.Random) -> list:
+    domains = list(table)
+    urls = []
+    for i in range(LOOKUPS):
+        kind = i % 3
+        if kind == 0: urls.append(f"https://www.{rng.choice(domains)}/")
+        elif kind == 1: urls.append(f"https://shop.{rng.choice(domains)}/pricing")
+        else: urls.append(f"https://unknown-site-{rng.randrange(10**6)}.com/")
+    return urls
+
+
+def run(quick: bool = False) -> dict:
+    rng = random.Random(21)
+    results = {}
+    for n in SIZES[:2] if quick else SIZES:
+        giants = {**famous_brands.TIER_1_GIANTS, **_brand_table(n, rng)}
+        urls = _urls(giants, rng)
+        index = DomainIndex()
+        for domain, info in giants.items(): index.add(domain, info)
+        repeat = 1 if n >= 100_000 else 3
+        linear = time_call(lambda: [_linear_scan(u, giants, famous_brands.KNOWN_BLOCKED_DOMAINS) for u in urls], repeat=repeat)
+        trie = time_call(lambda: [index.lookup(urlparse(u).netloc) for u in urls], repeat=repeat)
+        results[f"domains_{n}"] = {
+            "linear_scan_us_per_lookup": round(linear["p50_ms"] * 1000 / len(urls), 2),
+            "domain_index_us_per_lookup": round(trie["p50_ms"] * 1000 / len(urls), 2),
+        }
+
+    famous_brands._lookup_host.cache_clear()
+    hot = [f"https://{d}/" for d in list(famous_brands.TIER_1_GIANTS)[:20]] * (LOOKUPS // 20)
+    memo = time_call(lambda: [famous_brands.get_brand_tier(u) for u in hot], repeat=3)
+    probes = ["notamazon.com", "myapple.com", "fakegoogle.com", "amazon.com.evil.net"]
+    return {
+        "lookups": LOOKUPS, "results": results,
+        "get_brand_tier_hot_us_per_lookup": round(memo["p50_ms"] * 1000 / len(hot), 2),
+        "false_positives": {
+            "linear_scan": [p for p in probes if _linear_scan(p, famous_brands.TIER_1_GIANTS, famous_brands.KNOWN_BLOCKED_DOMAINS)],
+            "domain_index": [p for p in probes if famous_brands.get_brand_tier(p)],
+        },
+    }
+
+
+if __name__ == "__main__":
+    print(json.dumps(run(), indent=2))
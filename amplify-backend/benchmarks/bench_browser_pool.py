@@ -0,0 +1,121 @@
+# benchmarks/bench_browser_pool.py
+# Playwright fallback scrape against a local static site:
+#   launch_per_scan: new async_playwright + Chromium for every scan (old fallback path)
+#   pooled: browser_pool.BrowserPool shared across scans
+# Reports latency and peak Chromium RSS (summed over browser processes, Linux /proc).
+#
+# Only a failed Chromium launch counts as "skipped" (exit status 2); errors past that point
+# are real failures and propagate.
+#
+#   python benchmarks/bench_browser_pool.py     (needs `playwright install chromium`)
+
+import os
+import sys
+import json
+import time
+import asyncio
+
+from harness import StaticSite, summarize_ms
+
+SCANS = 20
+CONCURRENCY = 4
+
+
+def chromium_rss_mb() -> float:
+    total_kb = 0
+    for pid in filter(str.isdigit, os.listdir("/proc")):
+        try:
+            with open(f"/proc/{pid}/cmdline", "rb") as f:
+                cmd = f.read()
+            if b"chrom" not in cmd and b"headless_shell" not in cmd: continue
+            with open(f"/proc/{pid}/status") as f:
+                for line in f:
+                    if line.startswith("VmRSS:"):
+                        total_kb += int(line.split()[1])
+        except OSError:
+            continue
+    return total_kb / 1024
+
+
+async def _measure(scan_fn, url: str, scans: int) -> dict:
+    samples, peak = [], [0.0]
+    done = asyncio.Event()
+
+    async def sampler():
+        while not done.is_set():
+            peak[0] = max(peak[0], chromium_rss_mb())
+            await asyncio.sleep(0.05)
+
+    sem = asyncio.Semaphore(CONCURRENCY)
+
+    async def one(i):
+        async with sem:
+            t0 = time.perf_counter()
+            html = await scan_fn(f"{url}/?scan={i}")
+            assert "Acme" in html
+            samples.append(time.perf_counter() - t0)
+
+    task = asyncio.create_task(sampler())
+    results = await asyncio.gather(*(one(i) for i in range(scans)), return_exceptions=True)
+    done.set()
+    await task
+    errors = [r for r in results if isinstance(r, Exception)]
+    if errors: raise errors[0]
+    summary = summarize_ms(samples)
+    summary["peak_chromium_rss_mb"] = round(peak[0], 1)
+    return summary
+
+
+async def _launch_per_scan(url: str) -> str:
+    from playwright.async_api import async_playwright
+    async with async_playwright() as p:
+        browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
+        page = await browser.new_page()
+        await page.goto(url, timeout=15000)
+        html = await page.content()
+        await browser.close()
+        return html
+
+
+async def _unavailable():
+    """Why Chromium cannot be launched here, or None when it can."""
+    try:
+        from playwright.async_api import async_playwright
+        async with async_playwright() as p:
+            browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
+            await browser.close()
+    except Exception as e:
+        return f"Playwright/Chromium unavailable: {str(e).splitlines()[0][:120]}"
+    return None
+
+
+async def _run(scans: int) -> dict:
+    from browser_pool import BrowserPool
+    reason = await _unavailable()
+    if reason: return {"skipped": reason}
+    with StaticSite() as site:
+        before = await _measure(_launch_per_scan, site.url, scans)
+        pool = BrowserPool(max_pages=CONCURRENCY)
+        await pool.start()
+
+        async def pooled(url):
+            async with pool.page() as page:
+                await page.goto(url, timeout=15000)
+                return await page.content()
+
+        try:
+            after = await _measure(pooled, site.url, scans)
+        finally:
+            stats = dict(pool.stats)
+            await pool.stop()
+    return {"scans": scans, "concurrency": CONCURRENCY, "launch_per_scan": before, "pooled": after, "pool_stats": stats}
+
+
+def run(quick: bool = False) -> dict:
+    return asyncio.run(_run(5 if quick else SCANS))
+
+
+if __name__ == "__main__":
+    report = run()
+    print(json.dumps(report, indent=2))
+    sys.exit(2 if "skipped" in report else 0)
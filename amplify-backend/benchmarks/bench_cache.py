@@ -0,0 +1,107 @@
+# benchmarks/bench_cache.py
+# Cache-hit latency of the scan-result cache
+#   ilike_supabase: old get_cached_result query (url ILIKE '%url%') over the network
+#   url_hash_supabase: tier 2 exact lookup on scan_results.url_hash
+#   memory: tier 1 in-process hit
+# Supabase is a local FakePostgREST with a fixed round-trip delay; it cannot model
+# Postgres' seq scan vs index cost, only the round trip tier 1 removes.
+# Also checks ILIKE's wrong-site matches ("shop.com" matching "myshop.com").
+#
+#   python benchmarks/bench_cache.py
+
+import io
+import os
+import json
+import time
+import asyncio
+import contextlib
+from datetime import datetime, timedelta, timezone
+
+from harness import FakePostgREST, summarize_ms
+
+DB_DELAY = 0.03
+ROWS = 2000
+
+for key in ("GROQ_API_KEY", "GOOGLE_API_KEY", "NEXT_PUBLIC_SUPABASE_URL", "NEXT_PUBLIC_SUPABASE_ANON_KEY"):
+    os.environ[key] = ""
+os.environ["LLM_CACHE_PATH"] = "off"  # every run must reach the stub LLM
+
+
+def _seed(db: FakePostgREST):
+    from persona_engine import generate_url_hash
+    now = datetime.now(timezone.utc).isoformat()
+    rows = []
+    for i, site in enumerate([f"site{i}.com" for i in range(ROWS - 2)] + ["myshop.com", "shop.com"]):
+        result = {"score": 40 + i % 50, "archetype": "Ghost", "industry": "SaaS/Tech", "breakdown": {}, "fix_list": []}
+        rows.append({"id": i + 1, "url": f"https://{site}", "url_hash": generate_url_hash(site), "total_score": result["score"],
+                     "archetype": "Ghost", "industry": "SaaS/Tech", "raw_analysis_json": result, "created_at": now})
+    db.tables["scan_results"] = rows
+
+
+def _ilike_lookup(supabase, url: str):
+    clean_url = url.lower().replace('https://', '').replace('http://', '').replace('www.', '').rstrip('/')
+    cutoff = (datetime.now(timezone.utc) - timedelta(hours=24)).isoformat()
+    result = supabase.table("scan_results").select("*").ilike("url", f"%{clean_url}%").gte("created_at", cutoff).order("created_at", desc=True).limit(1).execute()
+    return result.data
+
+
+def _time(fn, repeat: int) -> dict:
+    samples = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - t0)
+    return summarize_ms(samples)
+
+
+async def _analyze_hits(app, url: str, repeat: int, before=None) -> dict:
+    import httpx
+    transport = httpx.ASGITransport(app=app, client=("127.0.0.1", 5000))
+    samples = []
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=60) as client:
+        for _ in range(repeat):
+            if before: before()
+            t0 = time.perf_counter()
+            resp = await client.post("/analyze", json={"url": url})
+            assert resp.json().get("cached")
+            samples.append(time.perf_counter() - t0)
+    return summarize_ms(samples)
+
+
+def run(quick: bool = False) -> dict:
+    import main
+    from persona_engine import generate_url_hash
+
+    repeat = 20 if quick else 100
+    with FakePostgREST(delay=DB_DELAY) as db, contextlib.redirect_stdout(io.StringIO()):
+        _seed(db)
+        main.supabase = db.client()
+        url_hash = generate_url_hash("shop.com")
+        main.result_cache.clear()
+
+        wrong = _ilike_lookup(main.supabase, "shop.com")
+        functions = {
+            "ilike_supabase": _time(lambda: _ilike_lookup(main.supabase, "https://shop.com"), repeat),
+            "url_hash_supabase": _time(lambda: main.get_cached_result(url_hash), repeat),
+        }
+        main.result_cache.set(url_hash, main.get_cached_result(url_hash))
+        functions["memory"] = _time(lambda: main.result_cache.get(url_hash), repeat)
+
+        endpoint = {
+            "supabase_hit": asyncio.run(_analyze_hits(main.app, "https://shop.com", repeat, before=main.result_cache.clear)),
+            "memory_hit": asyncio.run(_analyze_hits(main.app, "https://shop.com", repeat)),
+        }
+        stats = {"memory": main.result_cache.stats, "supabase": dict(main.db_cache_stats)}
+    main.supabase = None
+    return {
+        "db_delay_ms": DB_DELAY * 1000,
+        "rows": ROWS,
+        "ilike_shop_com_matched": wrong[0]["url"] if wrong else None,
+        "lookup": functions,
+        "analyze_cache_hit": endpoint,
+        "cache_stats": stats,
+    }
+
+
+if __name__ == "__main__":
+    print(json.dumps(run(), indent=2))
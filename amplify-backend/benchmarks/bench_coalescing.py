@@ -0,0 +1,80 @@
+# benchmarks/bench_coalescing.py
+# N concurrent scans of the same URL
+#   independent: every caller runs its own scan (old /analyze flow)
+#   coalesced: POST /analyze, callers share one in-flight scan via single_flight
+# Reports upstream fetches, LLM calls and latency. Supabase is disabled.
+#
+#   python benchmarks/bench_coalescing.py
+
+import io
+import os
+import json
+import time
+import asyncio
+import contextlib
+
+from harness import StaticSite, StubLLM, summarize_ms
+
+SITE_DELAY = 0.2
+LLM_DELAY = 0.3
+CALLERS = (5, 20)
+
+for key in ("GROQ_API_KEY", "GOOGLE_API_KEY", "NEXT_PUBLIC_SUPABASE_URL", "NEXT_PUBLIC_SUPABASE_ANON_KEY"):
+    os.environ[key] = ""
+os.environ["LLM_CACHE_PATH"] = "off"  # every run must reach the stub LLM
+
+
+async def _independent(main, url: str, callers: int) -> list:
+    samples = []
+
+    async def one():
+        t0 = time.perf_counter()
+        await main.run_scan(url, "bench@example.com")
+        samples.append(time.perf_counter() - t0)
+
+    await asyncio.gather(*(one() for _ in range(callers)))
+    return samples
+
+
+async def _coalesced(main, url: str, callers: int) -> list:
+    import httpx
+    transport = httpx.ASGITransport(app=main.app, client=("127.0.0.1", 5000))
+    samples = []
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=120) as client:
+        async def one():
+            t0 = time.perf_counter()
+            resp = await client.post("/analyze", json={"url": url})
+            resp.raise_for_status()
+            assert resp.json()["coalesced_callers"] == callers
+            samples.append(time.perf_counter() - t0)
+
+        await asyncio.gather(*(one() for _ in range(callers)))
+    return samples
+
+
+def _measure(flow, main, site, llm, url: str, callers: int) -> dict:
+    site.hits = llm.calls = 0
+    main.result_cache.clear()
+    samples = asyncio.run(flow(main, url, callers))
+    return {"fetches": site.hits, "llm_calls": llm.calls, **summarize_ms(samples)}
+
+
+def run(quick: bool = False) -> dict:
+    from groq import Groq
+    import main
+
+    results = {}
+    with StaticSite(delay=SITE_DELAY) as site, StubLLM(delay=LLM_DELAY) as llm:
+        main.groq_client = Groq(api_key="stub", base_url=llm.groq_base_url, max_retries=0)
+        main.supabase = None
+        with contextlib.redirect_stdout(io.StringIO()):
+            for n in CALLERS[:1] if quick else CALLERS:
+                results[f"callers_{n}"] = {
+                    "independent": _measure(_independent, main, site, llm, f"{site.url}/?n={n}", n),
+                    "coalesced": _measure(_coalesced, main, site, llm, f"{site.url}/?n={n}", n),
+                }
+    return {"site_delay_ms": SITE_DELAY * 1000, "llm_delay_ms": LLM_DELAY * 1000, "results": results}
+
+
+if __name__ == "__main__":
+    print(json.dumps(run(), indent=2))
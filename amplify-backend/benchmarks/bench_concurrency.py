@@ -0,0 +1,61 @@
+# benchmarks/bench_concurrency.py
+# p50/p99 latency of POST /analyze at 1, 10 and 50 concurrent scans
+# Scrape target and LLM are local stubs with fixed latency; Supabase is disabled.
+#
+#   python benchmarks/bench_concurrency.py
+
+import io
+import os
+import json
+import time
+import asyncio
+import contextlib
+
+from harness import StaticSite, StubLLM, summarize_ms
+
+SITE_DELAY = 0.2
+LLM_DELAY = 0.3
+LEVELS = (1, 10, 50)
+
+for key in ("GROQ_API_KEY", "GOOGLE_API_KEY", "NEXT_PUBLIC_SUPABASE_URL", "NEXT_PUBLIC_SUPABASE_ANON_KEY"):
+    os.environ[key] = ""
+os.environ["LLM_CACHE_PATH"] = "off"  # every run must reach the stub LLM
+
+
+async def _drive(app, site_url: str, concurrency: int, rounds: int) -> dict:
+    import httpx
+    transport = httpx.ASGITransport(app=app, client=("127.0.0.1", 5000))
+    samples = []
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=120) as client:
+        async def one(i):
+            t0 = time.perf_counter()
+            resp = await client.post("/analyze", json={"url": f"{site_url}/?scan={concurrency}-{i}"})
+            resp.raise_for_status()
+            samples.append(time.perf_counter() - t0)
+
+        wall0 = time.perf_counter()
+        for r in range(rounds):
+            await asyncio.gather(*(one(r * concurrency + i) for i in range(concurrency)))
+        wall = time.perf_counter() - wall0
+    summary = summarize_ms(samples)
+    summary["scans_per_sec"] = round(len(samples) / wall, 2)
+    return summary
+
+
+def run(quick: bool = False) -> dict:
+    from groq import Groq
+    import main
+
+    results = {}
+    with StaticSite(delay=SITE_DELAY) as site, StubLLM(delay=LLM_DELAY) as llm:
+        main.groq_client = Groq(api_key="stub", base_url=llm.groq_base_url, max_retries=0)
+        main.supabase = None
+        with contextlib.redirect_stdout(io.StringIO()):
+            for level in LEVELS:
+                rounds = 1 if quick else 3
+                results[f"concurrency_{level}"] = asyncio.run(_drive(main.app, site.url, level, rounds))
+    return {"site_delay_ms": SITE_DELAY * 1000, "llm_delay_ms": LLM_DELAY * 1000, "levels": results}
+
+
+if __name__ == "__main__":
+    print(json.dumps(run(), indent=2))
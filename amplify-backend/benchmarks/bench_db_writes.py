@@ -0,0 +1,78 @@
+# benchmarks/bench_db_writes.py
+# Database time on the response path per scan, against a local fake PostgREST with RTT delay
+#   legacy: upsert lead, select lead id, insert scan, insert scan_log (four blocking round trips)
+#   rpc: save_scan RPC; scan_logs go to the write-behind buffer (flushed in batches)
+#   no_rpc: same, before migrations/002 is applied (upsert returning id + insert)
+#
+#   python benchmarks/bench_db_writes.py
+
+import io
+import os
+import json
+import time
+import asyncio
+import contextlib
+
+from harness import FakePostgREST, summarize_ms
+
+RTT = 0.03
+SCANS = 40
+
+for key in ("GROQ_API_KEY", "GOOGLE_API_KEY", "NEXT_PUBLIC_SUPABASE_URL", "NEXT_PUBLIC_SUPABASE_ANON_KEY"):
+    os.environ[key] = ""
+
+RESULT = {"score": 61, "archetype": "The Contender", "industry": "SaaS/Tech", "benchmark": 88,
+          "breakdown": {"technical": 12, "content": 10, "authority": 9, "ai_judgment": 24}, "fix_list": []}
+
+
+def _legacy(main, client, url: str):
+    client.table("leads").upsert({"email": "bench@example.com", "marketing_source": "web_scan"}, on_conflict="email").execute()
+    lead = client.table("leads").select("id").eq("email", "bench@example.com").execute()
+    client.table("scan_results").insert({"lead_id": lead.data[0]["id"], **main.build_scan_payload(url, RESULT)}).execute()
+    client.table("scan_logs").insert({"url": url, "total_duration_ms": 1, "cache_status": "miss"}).execute()
+
+
+async def _current(main, url: str):
+    await main.run_io(main.save_analysis_to_db, "bench@example.com", url, RESULT)
+    main.log_scan_metrics(url, 0.001, "curl-cffi", "groq", "miss", RESULT["score"])
+
+
+def _measure(fake: FakePostgREST, fn) -> dict:
+    fake.requests.clear()
+    samples = []
+    for i in range(SCANS):
+        t0 = time.perf_counter()
+        fn(f"https://site{i}.example")
+        samples.append(time.perf_counter() - t0)
+    return {**summarize_ms(samples), "round_trips_per_scan": round(sum(fake.requests.values()) / SCANS, 2)}
+
+
+def run(quick: bool = False) -> dict:
+    import main
+
+    results = {}
+    with contextlib.redirect_stdout(io.StringIO()):
+        for label, rpc in (("legacy", True), ("rpc", True), ("no_rpc", False)):
+            with FakePostgREST(delay=RTT, rpc=rpc) as fake:
+                client = fake.client()
+                main.supabase = client
+                main.save_scan_rpc_available = True
+                if label == "legacy":
+                    results[label] = _measure(fake, lambda url: _legacy(main, client, url))
+                    continue
+
+                async def drive():
+                    loop = asyncio.get_running_loop()
+                    flusher = asyncio.create_task(main.scan_log_buffer.run())
+                    summary = await loop.run_in_executor(None, _measure, fake, lambda url: asyncio.run_coroutine_threadsafe(_current(main, url), loop).result())
+                    await main.scan_log_buffer.close()
+                    flusher.cancel()
+                    return summary
+
+                results[label] = asyncio.run(drive())
+                results[label]["scan_logs_rows"] = len(fake.tables.get("scan_logs", []))
+    return {"rtt_ms": RTT * 1000, "scans": SCANS, "results": results}
+
+
+if __name__ == "__main__":
+    print(json.dumps(run(), indent=2))
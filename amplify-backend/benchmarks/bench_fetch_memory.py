@@ -0,0 +1,88 @@
+# benchmarks/bench_fetch_memory.py
+# Peak Python memory and time for one scrape (fetch + decode + PageDocument) of multi-MB pages
+#   full_body: cffi_requests.get, resp.text, parse everything, truncate text to 6000 chars (old flow)
+#   capped_stream: html_fetch.fetch_html (SCRAPE_MAX_BYTES budget) + text extraction that stops early
+# Peak is measured with tracemalloc, so it covers Python-side buffers (body, str, parse tree);
+# the in-process StaticSite encodes each page before the measured requests.
+# --check: exit 1 unless the capped peak stays flat as the page grows (the transfer is aborted at
+# the budget instead of buffering the rest).
+#
+#   python benchmarks/bench_fetch_memory.py [--check]
+
+import io
+import sys
+import json
+import time
+import tracemalloc
+import contextlib
+import urllib.request
+
+from harness import StaticSite, sample_page
+
+SIZES_MB = (1, 4, 16)
+
+# Tolerance for --check: capped peak at the largest page vs the smallest
+MAX_CAPPED_PEAK_GROWTH = 1.25
+
+
+def _big_page(mb: int) -> str:
+    page = sample_page(3000)
+    head, body = page.split("<body>", 1)
+    body, tail = body.rsplit("</body>", 1)
+    return head + "<body>" + body * max(1, (mb * 1_000_000) // len(body)) + "</body>" + tail
+
+
+def _full_body(url: str):
+    from curl_cffi import requests as cffi_requests
+    from page_document import PageDocument
+    resp = cffi_requests.get(url, impersonate="chrome110", timeout=30)
+    doc = PageDocument(resp.text, text_limit=6000)
+    return len(resp.content), doc
+
+
+def _capped_stream(url: str):
+    from curl_cffi import requests as cffi_requests
+    from html_fetch import fetch_html
+    from page_document import PageDocument
+    page = fetch_html(cffi_requests.get, url, impersonate="chrome110", timeout=30)
+    return page["bytes"], PageDocument(page["html"], text_limit=6000)
+
+
+def _measure(fn, url: str) -> tuple:
+    tracemalloc.start()
+    t0 = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        read, doc = fn(url)
+    elapsed = time.perf_counter() - t0
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {"bytes_read": read, "peak_mb": round(peak / 1e6, 2), "wall_ms": round(elapsed * 1000, 1)}, doc.text
+
+
+def run(quick: bool = False) -> dict:
+    from html_fetch import SCRAPE_MAX_BYTES
+    results = {}
+    for mb in SIZES_MB[:2] if quick else SIZES_MB:
+        with StaticSite(default_page=_big_page(mb)) as site:
+            urllib.request.urlopen(site.url + "/warm-up").read()  # encodes the page outside the measurement
+            before, before_text = _measure(_full_body, site.url + "/")
+            after, after_text = _measure(_capped_stream, site.url + "/")
+        results[f"{mb}mb"] = {"full_body": before, "capped_stream": after, "same_text": before_text == after_text}
+    return {"scrape_max_bytes": SCRAPE_MAX_BYTES, "results": results}
+
+
+def check(report: dict) -> list:
+    """Failures: capped peak growing with page size."""
+    peaks = [r["capped_stream"]["peak_mb"] for r in report["results"].values()]
+    if peaks[-1] > peaks[0] * MAX_CAPPED_PEAK_GROWTH:
+        return [f"capped peak grows with page size: {peaks} MB (allowed x{MAX_CAPPED_PEAK_GROWTH})"]
+    return []
+
+
+if __name__ == "__main__":
+    report = run()
+    print(json.dumps(report, indent=2))
+    if "--check" in sys.argv:
+        failures = check(report)
+        for failure in failures: print(f"FAIL {failure}", file=sys.stderr)
+        sys.exit(1 if failures else 0)
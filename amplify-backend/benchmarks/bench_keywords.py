@@ -0,0 +1,51 @@
+# benchmarks/bench_keywords.py
+# Keyword signal matching on a 6 KB scraped text
+#   per_phrase_scans: every consumer lowercases the text and runs `phrase in text` per phrase (old flow)
+#   single_pass: one shared keyword_matcher scan, every category read from its result
+#
+#   python benchmarks/bench_keywords.py
+
+import json
+
+from harness import sample_page, time_call
+
+import persona_engine, industry_config, famous_brands, scoring_engine  # noqa: F401 (register dictionaries)
+import keyword_matcher
+from page_document import PageDocument
+
+
+def _per_phrase_scans(text: str):
+    namespaces = {}
+    for key, phrases in keyword_matcher.SIGNAL_DICTIONARIES.items():
+        namespaces.setdefault(key.split(":")[0], []).append(phrases)
+    for groups in namespaces.values():
+        text_lower = text.lower()
+        for phrases in groups:
+            [p for p in phrases if p in text_lower]
+
+
+def _single_pass(text: str):
+    keyword_matcher.match_signals.cache_clear()
+    hits = keyword_matcher.match_signals(text)
+    for key in keyword_matcher.SIGNAL_DICTIONARIES:
+        hits.found(key)
+
+
+def run(quick: bool = False) -> dict:
+    text = PageDocument(sample_page(1500), text_limit=6000).text
+    repeat = 50 if quick else 500
+    keyword_matcher.build_signal_matcher()
+    before = time_call(_per_phrase_scans, text, repeat=repeat)
+    after = time_call(_single_pass, text, repeat=repeat)
+    return {
+        "text_chars": len(text),
+        "phrases": sum(len(v) for v in keyword_matcher.SIGNAL_DICTIONARIES.values()),
+        "backend": "ahocorasick" if keyword_matcher.HAS_AHOCORASICK else "trie_regex",
+        "per_phrase_scans": before,
+        "single_pass": after,
+        "speedup": round(before["mean_ms"] / max(after["mean_ms"], 1e-9), 2),
+    }
+
+
+if __name__ == "__main__":
+    print(json.dumps(run(), indent=2))
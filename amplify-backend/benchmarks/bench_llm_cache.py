@@ -0,0 +1,67 @@
+# benchmarks/bench_llm_cache.py
+# Repeat judgments of unchanged pages through llm_cache.cached_llm_call (SQLite file in a temp dir)
+#   miss: prompt not cached yet, the local StubLLM answers after LLM_DELAY
+#   hit: same prompt again (whitespace re-indented), served from disk
+# Also times eviction once the store is over its byte cap.
+#
+#   python benchmarks/bench_llm_cache.py
+
+import os
+import json
+import time
+import tempfile
+import urllib.request
+
+from harness import StubLLM, summarize_ms
+from llm_cache import LLMCache
+
+LLM_DELAY = 0.3
+PAGES = 40
+
+
+def _ask(stub: StubLLM, prompt: str):
+    body = json.dumps({"model": "stub", "messages": [{"role": "user", "content": prompt}]}).encode()
+    req = urllib.request.Request(f"{stub.url}/chat/completions", data=body, headers={"Content-Type": "application/json"})
+    with urllib.request.urlopen(req, timeout=10) as resp:
+        return json.loads(json.loads(resp.read())["choices"][0]["message"]["content"])
+
+
+def _judge(cache: LLMCache, stub: StubLLM, prompt: str):
+    value = cache.get("stub", 0.1, prompt)
+    if value is None:
+        value = _ask(stub, prompt)
+        cache.set("stub", 0.1, prompt, value)
+    return value
+
+
+def run(quick: bool = False) -> dict:
+    pages = 10 if quick else PAGES
+    prompts = [f"""
+    You are an AI Visibility Analyst.
+    Target URL: https://site{i}.example | Title: Site {i}
+    Website Content: "{'platform pricing customers ' * 200}"
+    Math Score: {30 + i % 20}/60
+    """ for i in range(pages)]
+    with tempfile.TemporaryDirectory() as tmp, StubLLM(delay=LLM_DELAY) as stub:
+        cache = LLMCache(os.path.join(tmp, "llm.sqlite3"), max_bytes=10_000_000)
+        results = {}
+        for label, batch in (("miss", prompts), ("hit", [p.replace("    ", "\t") for p in prompts])):
+            samples = []
+            for prompt in batch:
+                t0 = time.perf_counter()
+                _judge(cache, stub, prompt)
+                samples.append(time.perf_counter() - t0)
+            results[label] = summarize_ms(samples)
+        results["llm_calls"] = stub.calls
+        results["stats"] = cache.stats
+
+        cache.max_bytes = cache.stats["bytes"] // 2
+        t0 = time.perf_counter()
+        evicted = cache.evict()
+        results["evict"] = {"removed": evicted, "ms": round((time.perf_counter() - t0) * 1000, 2), "left": cache.stats["entries"]}
+        cache.close()
+    return {"llm_delay_ms": LLM_DELAY * 1000, "pages": pages, "results": results}
+
+
+if __name__ == "__main__":
+    print(json.dumps(run(), indent=2))
@@ -0,0 +1,64 @@
+# benchmarks/bench_llm_hedge.py
+# Tail latency of one LLM judgment when the primary provider is sometimes slow
+#   sequential: wait for the primary (or its timeout), then the backup (old call_ai_with_fallback)
+#   hedged: llm_hedge.HedgedCaller starts the backup after the primary's observed p90
+# Both providers are local StubLLM servers spoken to over HTTP; the primary answers in
+# FAST_DELAY, except SLOW_SHARE of calls take SLOW_DELAY (past PRIMARY_TIMEOUT).
+#
+#   python benchmarks/bench_llm_hedge.py
+
+import json
+import time
+import random
+import urllib.request
+
+from harness import StubLLM, summarize_ms
+from llm_hedge import HedgedCaller
+
+FAST_DELAY = 0.05
+SLOW_DELAY = 2.0
+SLOW_SHARE = 0.08
+BACKUP_DELAY = 0.12
+PRIMARY_TIMEOUT = 1.0
+CALLS = 200
+
+
+def _provider(stub: StubLLM, timeout: float):
+    def ask():
+        body = json.dumps({"model": "stub", "messages": [{"role": "user", "content": "judge"}]}).encode()
+        req = urllib.request.Request(f"{stub.url}/chat/completions", data=body, headers={"Content-Type": "application/json"})
+        with urllib.request.urlopen(req, timeout=timeout) as resp:
+            return json.loads(json.loads(resp.read())["choices"][0]["message"]["content"])
+    return ask
+
+
+def _measure(mode: str, primary: StubLLM, backup: StubLLM, calls: int) -> dict:
+    hedge = HedgedCaller(mode=mode, initial_delay=PRIMARY_TIMEOUT)
+    providers = [("primary", _provider(primary, PRIMARY_TIMEOUT)), ("backup", _provider(backup, 5))]
+    primary.calls = backup.calls = 0
+    samples = []
+    for _ in range(calls):
+        t0 = time.perf_counter()
+        source, data = hedge.call(providers, timeout=10)
+        assert data is not None, "every call should get an answer"
+        samples.append(time.perf_counter() - t0)
+    stats = hedge.stats
+    hedge.shutdown()
+    return {**summarize_ms(samples), "primary_calls": primary.calls, "backup_calls": backup.calls,
+            "wins": stats["wins"], "hedge_delay_ms": stats["hedge_delay_ms"].get("primary")}
+
+
+def run(quick: bool = False) -> dict:
+    calls = 60 if quick else CALLS
+    results = {}
+    for mode in ("sequential", "hedged"):
+        rng = random.Random(11)  # same slow-call pattern for both modes
+        delay = lambda: SLOW_DELAY if rng.random() < SLOW_SHARE else FAST_DELAY
+        with StubLLM(delay=delay) as primary, StubLLM(delay=BACKUP_DELAY) as backup:
+            results[mode] = _measure(mode, primary, backup, calls)
+    return {"fast_ms": FAST_DELAY * 1000, "slow_ms": SLOW_DELAY * 1000, "slow_share": SLOW_SHARE,
+            "backup_ms": BACKUP_DELAY * 1000, "primary_timeout_ms": PRIMARY_TIMEOUT * 1000, "results": results}
+
+
+if __name__ == "__main__":
+    print(json.dumps(run(), indent=2))
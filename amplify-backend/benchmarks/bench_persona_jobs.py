@@ -0,0 +1,83 @@
+# benchmarks/bench_persona_jobs.py
+# Burst of persona generations (BURST submissions over UNIQUE_URLS pages, every job sleeps WORK_DELAY)
+#   thread_per_scan: one threading.Thread per submission (old fire_persona_generation_async)
+#   job_queue: persona_jobs.PersonaJobQueue (fixed workers, dedup by url hash)
+# Reports peak live threads, jobs actually run and time to drain.
+#
+#   python benchmarks/bench_persona_jobs.py
+
+import json
+import time
+import threading
+
+import harness  # noqa: F401  (puts the backend on sys.path)
+from persona_jobs import PersonaJobQueue
+
+WORK_DELAY = 0.05
+BURSTS = ((200, 50), (1000, 100))  # (submissions, unique urls)
+
+
+class _Probe:
+    def __init__(self):
+        self.peak_threads = threading.active_count()
+        self.runs = 0
+        self.lock = threading.Lock()
+
+    def work(self, context):
+        with self.lock:
+            self.runs += 1
+            self.peak_threads = max(self.peak_threads, threading.active_count())
+        time.sleep(WORK_DELAY)
+        return {"messaging": {}, "for": context["url"]}
+
+
+def _thread_per_scan(burst: int, unique: int) -> dict:
+    probe = _Probe()
+    done = threading.Semaphore(0)
+
+    def task(context):
+        probe.work(context)
+        done.release()
+
+    t0 = time.perf_counter()
+    for i in range(burst):
+        threading.Thread(target=task, args=({"url": f"site{i % unique}.com"},)).start()
+    for _ in range(burst): done.acquire()
+    return {"peak_threads": probe.peak_threads, "jobs_run": probe.runs, "drain_s": round(time.perf_counter() - t0, 3)}
+
+
+def _job_queue(burst: int, unique: int) -> dict:
+    probe = _Probe()
+    finished = threading.Event()
+    delivered = set()
+
+    def on_result(key, result):
+        delivered.add(key)
+        if len(delivered) == unique: finished.set()
+
+    jobs = PersonaJobQueue(work=probe.work, on_result=on_result, on_error=lambda k, e: None,
+                           workers=8, max_queue=burst, max_wait=60)
+    t0 = time.perf_counter()
+    for i in range(burst):
+        jobs.submit(f"site{i % unique}.com", {"url": f"site{i % unique}.com"})
+    finished.wait(60)
+    elapsed = time.perf_counter() - t0
+    stats = jobs.stats
+    jobs.stop()
+    return {"peak_threads": probe.peak_threads, "jobs_run": probe.runs, "drain_s": round(elapsed, 3),
+            "deduplicated": stats["deduplicated"], "superseded": stats["superseded"],
+            "wait": stats["wait"], "run": stats["run"]}
+
+
+def run(quick: bool = False) -> dict:
+    results = {}
+    for burst, unique in BURSTS[:1] if quick else BURSTS:
+        results[f"burst_{burst}_unique_{unique}"] = {
+            "thread_per_scan": _thread_per_scan(burst, unique),
+            "job_queue": _job_queue(burst, unique),
+        }
+    return {"work_delay_ms": WORK_DELAY * 1000, "results": results}
+
+
+if __name__ == "__main__":
+    print(json.dumps(run(), indent=2))
@@ -0,0 +1,97 @@
+# benchmarks/bench_rate_limiter.py
+# Rate-limit checks on one core
+#   timestamp_lists: old check_rate_limit (per-IP timestamp list, rebuilt every call, never evicted)
+#   sliding_window: rate_limiter.RateLimiter with the in-process backend
+#   sliding_window_redis: same algorithm through FakeRedis (in-process, so no network cost)
+# Reports checks/sec and memory held after many unique IPs (tracemalloc).
+# `--check` exits 1 if the in-process limiter does not sustain 100k checks/sec.
+#
+#   python benchmarks/bench_rate_limiter.py [--check]
+
+import sys
+import json
+import time
+import tracemalloc
+
+from harness import FakeRedis
+
+from rate_limiter import RateLimiter, MemoryBackend, RedisBackend
+
+LIMIT_COUNT = 5
+LIMIT_WINDOW = 3600
+TARGET_CHECKS_PER_SEC = 100_000
+
+
+class TimestampLists:
+    """The old main.py check_rate_limit."""
+
+    def __init__(self):
+        self.request_history = {}
+
+    def allow(self, ip_address: str) -> bool:
+        current_time = time.time()
+        history = self.request_history.get(ip_address, [])
+        clean_history = [t for t in history if (current_time - t) < LIMIT_WINDOW]
+        if len(clean_history) >= LIMIT_COUNT:
+            return False
+        clean_history.append(current_time)
+        self.request_history[ip_address] = clean_history
+        return True
+
+
+def _ips(n: int) -> list:
+    return [f"10.{(i >> 16) & 255}.{(i >> 8) & 255}.{i & 255}" for i in range(n)]
+
+
+def _throughput(limiter, ips: list, checks: int) -> dict:
+    n = len(ips)
+    t0 = time.perf_counter()
+    for i in range(checks):
+        limiter.allow(ips[i % n])
+    elapsed = time.perf_counter() - t0
+    return {"checks": checks, "checks_per_sec": int(checks / elapsed), "us_per_check": round(elapsed / checks * 1e6, 3)}
+
+
+def _memory_mb(limiter, ips: list) -> float:
+    tracemalloc.start()
+    for ip in ips: limiter.allow(ip)
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return round(current / 1e6, 2)
+
+
+def _swept_after_idle(unique: int) -> dict:
+    backend = MemoryBackend()
+    limiter = RateLimiter(LIMIT_COUNT, LIMIT_WINDOW, backend=backend)
+    now = time.time()
+    for ip in _ips(unique): backend.hit(ip, LIMIT_COUNT, LIMIT_WINDOW, now - 3 * LIMIT_WINDOW)
+    removed = backend.sweep(LIMIT_WINDOW, now)
+    return {"keys_before": unique, "removed": removed, "keys_after": len(limiter.backend)}
+
+
+def run(quick: bool = False) -> dict:
+    checks = 100_000 if quick else 1_000_000
+    hot = _ips(1000)
+    unique = _ips(20_000 if quick else 200_000)
+    return {
+        "throughput_1000_ips": {
+            "timestamp_lists": _throughput(TimestampLists(), hot, checks),
+            "sliding_window": _throughput(RateLimiter(LIMIT_COUNT, LIMIT_WINDOW), hot, checks),
+            "sliding_window_redis": _throughput(RateLimiter(LIMIT_COUNT, LIMIT_WINDOW, backend=RedisBackend(FakeRedis())), hot, checks // 10),
+        },
+        f"memory_mb_{len(unique)}_unique_ips": {
+            "timestamp_lists": _memory_mb(TimestampLists(), unique),
+            "sliding_window": _memory_mb(RateLimiter(LIMIT_COUNT, LIMIT_WINDOW), unique),
+        },
+        "idle_sweep": _swept_after_idle(len(unique)),
+    }
+
+
+if __name__ == "__main__":
+    result = run()
+    print(json.dumps(result, indent=2))
+    if "--check" in sys.argv:
+        rate = result["throughput_1000_ips"]["sliding_window"]["checks_per_sec"]
+        if rate < TARGET_CHECKS_PER_SEC:
+            print(f"FAILED: {rate} checks/sec < {TARGET_CHECKS_PER_SEC}")
+            sys.exit(1)
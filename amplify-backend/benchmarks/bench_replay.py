@@ -0,0 +1,189 @@
+# benchmarks/bench_replay.py
+# Offline load test of POST /analyze from a recorded scan archive (see scan_recorder.py)
+#   record: scans the fixture corpus (fixtures/pages) against the local stand-ins with
+#           SCAN_RECORDER=record - or record real traffic: run the API with
+#           SCAN_RECORDER=record SCAN_ARCHIVE_PATH=scans.sqlite3 LLM_CACHE_PATH=off
+#   replay: thousands of concurrent scans whose page fetches, LLM calls (judgment and persona)
+#           and Supabase requests are answered from the archive after their recorded latency.
+#           Scans cycle over the recorded URLs, each made distinct with a "#replay-N" fragment
+#           (new url hash, so no result-cache hits) unless --repeat. The app runs with its
+#           lifespan (persona workers, scan-log flusher); persona jobs are drained after each level.
+#
+#   python benchmarks/bench_replay.py record scans.sqlite3
+#   python benchmarks/bench_replay.py replay scans.sqlite3 [--scans 2000] [--concurrency 50,200,1000] [--speed 1] [--repeat]
+
+import io
+import os
+import sys
+import json
+import time
+import asyncio
+import argparse
+import contextlib
+from collections import Counter
+
+from harness import StaticSite, StubLLM, FakePostgREST, summarize_ms
+
+SITE_DELAY = 0.15
+LLM_DELAY = 0.6
+DB_DELAY = 0.03
+DRAIN_TIMEOUT = 300
+
+
+def _env(mode: str, archive: str, **extra):
+    for key in ("GROQ_API_KEY", "GOOGLE_API_KEY", "NEXT_PUBLIC_SUPABASE_URL", "NEXT_PUBLIC_SUPABASE_ANON_KEY"):
+        os.environ[key] = ""
+    os.environ.update({"SCAN_RECORDER": mode, "SCAN_ARCHIVE_PATH": archive, "PAGE_VERSIONS_PATH": "off", **extra})
+    os.environ.setdefault("LLM_CACHE_PATH", "off")  # record every upstream call / make every scan reach the LLM stand-in
+
+
+async def _drain_personas(main) -> float:
+    t0 = time.perf_counter()
+    while time.perf_counter() - t0 < DRAIN_TIMEOUT:
+        stats = main.persona_jobs.stats
+        if stats["queue_depth"] == 0 and stats["running"] == 0: break
+        await asyncio.sleep(0.05)
+    return time.perf_counter() - t0
+
+
+async def _scan(client, url: str) -> tuple:
+    t0 = time.perf_counter()
+    try:
+        resp = await client.post("/analyze", json={"url": url, "email": "replay@example.com"})
+        status = resp.status_code
+    except Exception as e:
+        status = type(e).__name__
+    return time.perf_counter() - t0, status
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# RECORD
+# ═══════════════════════════════════════════════════════════════════════════
+
+def record(archive: str) -> dict:
+    """Scans the fixture corpus twice (full, then cached) through the stand-ins, recording everything."""
+    import httpx
+    from bench_suite import load_corpus
+
+    corpus = load_corpus()
+    pages = {"/" + page["file"]: page["html"] for page in corpus}
+    with StaticSite(pages=pages, delay=SITE_DELAY) as site, StubLLM(delay=LLM_DELAY) as llm, FakePostgREST(delay=DB_DELAY) as db:
+        # GROQ_BASE_URL points every Groq client (judgment and persona) at the stub
+        _env("record", archive, GROQ_API_KEY="stub", GROQ_BASE_URL=llm.groq_base_url)
+        import main
+        main.supabase = db.client()  # the lifespan wraps it for recording
+        urls = [site.url + path for path in pages]
+
+        async def go():
+            transport = httpx.ASGITransport(app=main.app, client=("127.0.0.1", 5000))
+            async with main.lifespan(main.app), httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=120) as client:
+                for _ in range(2):
+                    await asyncio.gather(*(_scan(client, url) for url in urls))
+                await _drain_personas(main)
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            asyncio.run(go())
+        return {"archive": archive, "urls": urls, "recorder": main.get_scan_recorder().info(), **main.get_scan_recorder().archive.summary()}
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# REPLAY
+# ═══════════════════════════════════════════════════════════════════════════
+
+def _recorded(archive: str) -> tuple:
+    """(recorded page URLs, LLM pools) - decides which provider keys the replay must configure."""
+    from scan_recorder import ScanArchive
+    store = ScanArchive(archive)
+    calls = store.calls()
+    store.close()
+    urls = list(dict.fromkeys(key for kind, _, key, *_ in calls if kind in ("fetch", "render")))
+    pools = {pool for kind, pool, *_ in calls if kind == "llm"}
+    return urls, pools
+
+
+def replay(archive: str, scans: int, levels: tuple, speed: float = 1.0, repeat: bool = False) -> dict:
+    import httpx
+
+    if not os.path.exists(archive): raise SystemExit(f"no archive at {archive} (run `record` first)")
+    urls, pools = _recorded(archive)
+    if not urls: raise SystemExit(f"{archive} has no recorded page fetches")
+    # Placeholder keys only select the recorded code paths; the clients are never built
+    _env("replay", archive, SCAN_REPLAY_SPEED=str(speed),
+         GROQ_API_KEY="replay" if any("groq" in p for p in pools) else "",
+         GOOGLE_API_KEY="replay" if any("gemini" in p for p in pools) else "")
+    import main
+
+    results = {}
+
+    async def go():
+        transport = httpx.ASGITransport(app=main.app, client=("127.0.0.1", 5000))
+        limits = httpx.Limits(max_connections=None, max_keepalive_connections=None)
+        async with main.lifespan(main.app), httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=600, limits=limits) as client:
+            n = 0
+            for concurrency in levels:
+                gate = asyncio.Semaphore(concurrency)
+
+                async def one(i):
+                    url = urls[i % len(urls)] if repeat else f"{urls[i % len(urls)]}#replay-{i}"
+                    async with gate:
+                        return await _scan(client, url)
+
+                wall0 = time.perf_counter()
+                outcomes = await asyncio.gather(*(one(n + i) for i in range(scans)))
+                wall = time.perf_counter() - wall0
+                drain = await _drain_personas(main)
+                n += scans
+                results[f"c{concurrency}"] = {
+                    "scans": scans, "wall_s": round(wall, 2), "scans_per_s": round(scans / wall, 1),
+                    **summarize_ms([t for t, _ in outcomes]),
+                    "status": dict(Counter(str(s) for _, s in outcomes)),
+                    "persona_drain_s": round(drain, 2),
+                }
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        asyncio.run(go())
+    return {
+        "archive": archive, "recorded_urls": len(urls), "speed": speed, "distinct_urls": not repeat,
+        "results": results, "recorder": main.get_scan_recorder().info(),
+        "persona_jobs": {k: v for k, v in main.persona_jobs.stats.items() if k != "alive_workers"},
+        "result_cache": main.result_cache.stats, "scan_flight": dict(main.scan_flight.stats),
+    }
+
+
+def run(quick: bool = False) -> dict:
+    """Records the fixture corpus into a temporary archive, then replays it (separate processes)."""
+    import tempfile
+    import subprocess
+    with tempfile.TemporaryDirectory() as tmp:
+        archive = os.path.join(tmp, "scans.sqlite3")
+        script = os.path.abspath(__file__)
+        subprocess.run([sys.executable, script, "record", archive], check=True, stdout=subprocess.DEVNULL)
+        args = ["--scans", "200", "--concurrency", "20,100"] if quick else []
+        out = subprocess.run([sys.executable, script, "replay", archive, *args], check=True, capture_output=True, text=True)
+        return json.loads(out.stdout)
+
+
+def main_cli(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Record / replay load test for /analyze")
+    sub = parser.add_subparsers(dest="command", required=True)
+    rec = sub.add_parser("record", help="record the fixture corpus against the local stand-ins")
+    rec.add_argument("archive")
+    rep = sub.add_parser("replay", help="drive concurrent scans from an archive")
+    rep.add_argument("archive")
+    rep.add_argument("--scans", type=int, default=2000, help="scans per concurrency level (default 2000)")
+    rep.add_argument("--concurrency", default="50,200,1000", help="comma-separated levels (default 50,200,1000)")
+    rep.add_argument("--speed", type=float, default=1.0, help="divide recorded latencies by this (default 1)")
+    rep.add_argument("--repeat", action="store_true", help="reuse recorded URLs as-is (cache hits, coalescing)")
+    args = parser.parse_args(argv)
+
+    if args.command == "record":
+        report = record(args.archive)
+    else:
+        levels = tuple(int(c) for c in args.concurrency.split(","))
+        report = replay(args.archive, args.scans, levels, args.speed, args.repeat)
+    print(json.dumps(report, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main_cli())
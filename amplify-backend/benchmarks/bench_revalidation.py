@@ -0,0 +1,82 @@
+# benchmarks/bench_revalidation.py
+# Re-scan cost once a page has been fully scanned (result cache cleared between rounds):
+#   full: first scan, no page version known
+#   etag_304: unchanged page, server honours If-None-Match (no body, no scoring, no LLM)
+#   boilerplate: server sends no validators, only a <script> changed (fingerprint match)
+#   changed: visible text changed, full pipeline again
+# Supabase is disabled; page versions live in a temporary SQLite file.
+#
+#   python benchmarks/bench_revalidation.py
+
+import io
+import os
+import json
+import time
+import asyncio
+import tempfile
+import contextlib
+
+from harness import StaticSite, StubLLM, sample_page, summarize_ms
+
+SITE_DELAY = 0.05
+LLM_DELAY = 0.3
+PAGES = 20
+
+for key in ("GROQ_API_KEY", "GOOGLE_API_KEY", "NEXT_PUBLIC_SUPABASE_URL", "NEXT_PUBLIC_SUPABASE_ANON_KEY"):
+    os.environ[key] = ""
+os.environ["LLM_CACHE_PATH"] = "off"  # every full scan must reach the stub LLM
+os.environ["PAGE_VERSIONS_PATH"] = os.path.join(tempfile.mkdtemp(prefix="bench_revalidation_"), "page_versions.sqlite3")
+
+
+async def _round(app, urls: list) -> tuple:
+    import httpx
+    transport = httpx.ASGITransport(app=app, client=("127.0.0.1", 5000))
+    timings, statuses = [], []
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=120) as client:
+        for url in urls:
+            t0 = time.perf_counter()
+            resp = await client.post("/analyze", json={"url": url})
+            resp.raise_for_status()
+            timings.append(time.perf_counter() - t0)
+            statuses.append(resp.json().get("revalidated_via", "full"))
+    return timings, statuses
+
+
+def run(quick: bool = False) -> dict:
+    from groq import Groq
+    import main
+
+    pages = PAGES // 4 if quick else PAGES
+    paths = {f"/p{i}": sample_page(seed=i) for i in range(pages)}
+    results = {}
+    with StaticSite(pages=dict(paths), delay=SITE_DELAY, etag=True) as etag_site, \
+            StaticSite(pages=dict(paths), delay=SITE_DELAY) as plain_site, \
+            StubLLM(delay=LLM_DELAY) as llm:
+        main.groq_client = Groq(api_key="stub", base_url=llm.groq_base_url, max_retries=0)
+        main.supabase = None
+        etag_urls = [etag_site.url + path for path in paths]
+        plain_urls = [plain_site.url + path for path in paths]
+
+        def measure(name: str, urls: list, site: StaticSite):
+            main.result_cache.clear()
+            llm.calls, site.bytes_sent, site.not_modified = 0, 0, 0
+            with contextlib.redirect_stdout(io.StringIO()):
+                timings, statuses = asyncio.run(_round(main.app, urls))
+            results[name] = {**summarize_ms(timings), "llm_calls": llm.calls, "bytes_downloaded": site.bytes_sent,
+                             "not_modified": site.not_modified, "reused": sum(s != "full" for s in statuses)}
+
+        measure("full", etag_urls, etag_site)
+        measure("etag_304", etag_urls, etag_site)
+        measure("full_no_validators", plain_urls, plain_site)
+        for path in paths:
+            plain_site.pages[path] = paths[path].replace("</body>", "<script>window.build='%d'</script></body>" % time.time_ns())
+        measure("boilerplate", plain_urls, plain_site)
+        for path in paths:
+            plain_site.pages[path] = paths[path].replace("<p>", "<p>Updated pricing and new customer stories. ", 1)
+        measure("changed", plain_urls, plain_site)
+    return {"pages": pages, "site_delay_ms": SITE_DELAY * 1000, "llm_delay_ms": LLM_DELAY * 1000,
+            "results": results, "revalidation": main.get_page_versions().stats}
+
+
+if __name__ == "__main__":
+    print(json.dumps(run(), indent=2))
@@ -0,0 +1,58 @@
+# benchmarks/bench_score_pool.py
+# Math-scoring throughput for PAGES concurrent ~50 KB pages
+#   inline: calculate_math_score on the event loop thread (one core)
+#   pool_N: score_pool with N warmed worker processes
+# Also reports the packed payload size sent to a child vs the raw page.
+#
+#   python benchmarks/bench_score_pool.py
+
+import io
+import os
+import json
+import time
+import pickle
+import asyncio
+import contextlib
+
+from harness import sample_page
+
+PAGES = 64
+URL = "https://acme.example.com"
+
+
+async def _throughput(pages: list, workers: int) -> dict:
+    import score_pool
+    score_pool.SCORE_POOL_WORKERS = workers
+    score_pool.shutdown_score_pool()
+    t0 = time.perf_counter()
+    await score_pool.start_score_pool()
+    warm_s = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    await asyncio.gather(*(score_pool.score_page(html, text, URL) for html, text in pages))
+    elapsed = time.perf_counter() - t0
+    score_pool.shutdown_score_pool()
+    return {"pages_per_sec": round(len(pages) / elapsed, 1), "warm_up_ms": round(warm_s * 1000, 1)}
+
+
+def run(quick: bool = False) -> dict:
+    from page_document import PageDocument
+    import score_pool
+
+    count = 16 if quick else PAGES
+    pages = []
+    for i in range(count):
+        html = sample_page(6500, seed=i)
+        pages.append((html, PageDocument(html, text_limit=6000).text))
+
+    html, text = pages[0]
+    results = {"payload": {"pickled_str_bytes": len(pickle.dumps((html, text, URL))),
+                           "packed_bytes": len(score_pool.pack_page(html, text, URL))}}
+    levels = [0] + [n for n in (1, 2, 4, 8) if n <= (os.cpu_count() or 1) * 2]
+    with contextlib.redirect_stdout(io.StringIO()):
+        for workers in levels[:2] if quick else levels:
+            results["inline" if workers == 0 else f"pool_{workers}"] = asyncio.run(_throughput(pages, workers))
+    return {"cpus": os.cpu_count(), "pages": count, "results": results}
+
+
+if __name__ == "__main__":
+    print(json.dumps(run(), indent=2))
@@ -0,0 +1,51 @@
+# benchmarks/bench_scoring.py
+# Math-scoring CPU time on a ~50 KB page
+#   separate_parses: scrape parse + every scorer building its own html.parser tree (pre-PageDocument flow)
+#   shared_document: one PageDocument (lxml when installed) reused by the scrape and all scorers
+#
+#   python benchmarks/bench_scoring.py
+
+import io
+import json
+import contextlib
+
+from harness import sample_page, time_call
+
+import scoring_engine
+from page_document import PageDocument, PAGE_PARSER
+
+URL = "https://acme.example.com"
+
+
+def _separate_parses(html: str):
+    scrape_doc = PageDocument(html, parser="html.parser", text_limit=6000)
+    text = scrape_doc.text
+    scoring_engine.calculate_technical_score(html, URL, doc=PageDocument(html, parser="html.parser"))
+    scoring_engine.calculate_content_score(text)
+    scoring_engine.calculate_authority_score(html, text)
+    scoring_engine.calculate_ai_discoverability_score(html, text, doc=PageDocument(html, text=text, parser="html.parser"))
+    scoring_engine.calculate_answerability_score(text)
+
+
+def _shared_document(html: str):
+    doc = PageDocument(html, text_limit=6000)
+    scoring_engine.calculate_math_score(html, doc.text, URL, doc=doc)
+
+
+def run(quick: bool = False) -> dict:
+    html = sample_page(6500)
+    repeat = 5 if quick else 30
+    with contextlib.redirect_stdout(io.StringIO()):
+        before = time_call(_separate_parses, html, repeat=repeat)
+        after = time_call(_shared_document, html, repeat=repeat)
+    return {
+        "page_bytes": len(html.encode()),
+        "parser": PAGE_PARSER,
+        "separate_parses": before,
+        "shared_document": after,
+        "speedup": round(before["mean_ms"] / max(after["mean_ms"], 1e-9), 2),
+    }
+
+
+if __name__ == "__main__":
+    print(json.dumps(run(), indent=2))
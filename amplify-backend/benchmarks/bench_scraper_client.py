@@ -0,0 +1,72 @@
+# benchmarks/bench_scraper_client.py
+# Fetching REQUESTS pages from HOSTS local sites with CONCURRENCY threads
+#   per_request: module-level cffi_requests.get per fetch (new connection every time, the old flow)
+#   pooled: one ScraperClient (keep-alive sessions reused across fetches)
+# Each new connection costs CONNECT_DELAY on the server, standing in for the TCP + TLS
+# handshake that plain http to 127.0.0.1 does not have.
+#
+#   python benchmarks/bench_scraper_client.py
+
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from harness import StaticSite, summarize_ms
+
+HOSTS = 4
+REQUESTS = 400
+CONCURRENCY = 16
+CONNECT_DELAY = 0.03
+
+
+def _per_request(url: str) -> int:
+    from curl_cffi import requests as cffi_requests
+    from html_fetch import fetch_html
+    return fetch_html(cffi_requests.get, url, impersonate="chrome110", timeout=8)["status_code"]
+
+
+def _drive(fetch, urls: list) -> dict:
+    timings = []
+
+    def one(url):
+        t0 = time.perf_counter()
+        status = fetch(url)
+        timings.append(time.perf_counter() - t0)
+        return status
+
+    t0 = time.perf_counter()
+    with ThreadPoolExecutor(CONCURRENCY) as pool:
+        statuses = list(pool.map(one, urls))
+    wall = time.perf_counter() - t0
+    return {**summarize_ms(timings), "wall_s": round(wall, 2), "pages_per_s": round(len(urls) / wall, 1),
+            "ok": sum(s == 200 for s in statuses)}
+
+
+def run(quick: bool = False) -> dict:
+    from scraper_client import ScraperClient
+
+    n = REQUESTS // 4 if quick else REQUESTS
+    results = {}
+    sites = [StaticSite(connect_delay=CONNECT_DELAY) for _ in range(HOSTS)]
+    for site in sites: site.__enter__()
+    try:
+        urls = [f"{sites[i % HOSTS].url}/page/{i}" for i in range(n)]
+
+        results["per_request"] = _drive(_per_request, urls)
+        results["per_request"]["connections"] = sum(site.connections for site in sites)
+
+        for site in sites: site.connections = 0
+        client = ScraperClient(max_sessions=CONCURRENCY, per_host=CONCURRENCY)
+        try:
+            results["pooled"] = _drive(lambda url: client.fetch(url)["status_code"], urls)
+        finally:
+            client.close()
+        results["pooled"]["connections"] = sum(site.connections for site in sites)
+        results["pooled"]["client"] = client.info()
+    finally:
+        for site in sites: site.__exit__(None, None, None)
+    return {"hosts": HOSTS, "concurrency": CONCURRENCY, "connect_delay_ms": CONNECT_DELAY * 1000, "results": results}
+
+
+if __name__ == "__main__":
+    print(json.dumps(run(), indent=2))
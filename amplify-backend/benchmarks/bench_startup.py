@@ -0,0 +1,94 @@
+# benchmarks/bench_startup.py
+# Cold start of the API process, per STARTUP_MODE (eager = pre-lazy behaviour)
+#   import_report: `python -X importtime -c "import main"`, cumulative time per top-level package
+#   first_request: spawn uvicorn, poll GET /health until it answers (time-to-first-request)
+# All clients are "configured" with dummy credentials so eager mode really builds them;
+# nothing is contacted over the network.
+#
+#   python benchmarks/bench_startup.py
+
+import os
+import sys
+import json
+import time
+import socket
+import subprocess
+import urllib.request
+from collections import defaultdict
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+RUNS = 3
+TOP = 15
+
+ENV = {
+    "GROQ_API_KEY": "bench", "GOOGLE_API_KEY": "bench",
+    "NEXT_PUBLIC_SUPABASE_URL": "http://127.0.0.1:9",
+    "NEXT_PUBLIC_SUPABASE_ANON_KEY": "eyJhbGciOiJIUzI1NiJ9.eyJyb2xlIjoiYW5vbiJ9.bench",
+    "LLM_CACHE_PATH": "off", "PAGE_VERSIONS_PATH": "off", "PYTHONDONTWRITEBYTECODE": "1",
+}
+
+
+def _env(mode: str) -> dict:
+    return {**os.environ, **ENV, "STARTUP_MODE": mode}
+
+
+def import_report(mode: str) -> dict:
+    """Parses -X importtime output: `import main` total, and cumulative ms per package main pulls in."""
+    proc = subprocess.run([sys.executable, "-X", "importtime", "-c", "import main"], cwd=BACKEND_DIR,
+                          env=_env(mode), capture_output=True, text=True, timeout=300)
+    packages = defaultdict(float)
+    children = []  # importtime prints children before their parent
+    total = 0.0
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line: continue
+        _, cumulative, raw = line[len("import time:"):].split("|")
+        level = (len(raw) - len(raw.lstrip()) - 1) // 2
+        if level == 1:
+            children.append((raw.strip(), int(cumulative) / 1000))
+        elif level == 0:
+            if raw.strip() == "main":
+                total = int(cumulative) / 1000
+                for name, ms in children: packages[name.split(".")[0]] += ms
+            children = []
+    top = sorted(packages.items(), key=lambda kv: kv[1], reverse=True)[:TOP]
+    return {"import_ms": round(total, 1), "ok": proc.returncode == 0,
+            "top_packages_ms": {name: round(ms, 1) for name, ms in top}}
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def first_request(mode: str) -> float:
+    port = _free_port()
+    t0 = time.perf_counter()
+    proc = subprocess.Popen([sys.executable, "-c", f"import uvicorn, main; uvicorn.run(main.app, host='127.0.0.1', port={port}, log_level='warning')"],
+                            cwd=BACKEND_DIR, env=_env(mode), stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    try:
+        while time.perf_counter() - t0 < 120:
+            if proc.poll() is not None: raise RuntimeError(f"server exited with {proc.returncode}")
+            try:
+                with urllib.request.urlopen(f"http://127.0.0.1:{port}/health", timeout=1) as resp:
+                    if resp.status == 200: return time.perf_counter() - t0
+            except OSError:
+                time.sleep(0.02)
+        raise TimeoutError("no response within 120 s")
+    finally:
+        proc.terminate()
+        try: proc.wait(10)
+        except subprocess.TimeoutExpired: proc.kill()
+
+
+def run(quick: bool = False) -> dict:
+    results = {}
+    for mode in ("eager", "lazy"):
+        samples = sorted(first_request(mode) for _ in range(1 if quick else RUNS))
+        results[mode] = {"first_request_ms": round(samples[len(samples) // 2] * 1000, 1), **import_report(mode)}
+    eager, lazy = results["eager"]["first_request_ms"], results["lazy"]["first_request_ms"]
+    return {"runs": 1 if quick else RUNS, "results": results, "speedup": round(eager / lazy, 2) if lazy else None}
+
+
+if __name__ == "__main__":
+    print(json.dumps(run(), indent=2))
@@ -0,0 +1,59 @@
+# benchmarks/bench_streaming.py
+# Time to first useful paint: POST /analyze (whole result at once) vs POST /analyze/stream
+# (time until the `math` and `result` events arrive). Local stubs, Supabase disabled.
+#
+#   python benchmarks/bench_streaming.py
+
+import io
+import os
+import json
+import time
+import asyncio
+import contextlib
+
+from harness import StaticSite, StubLLM, summarize_ms
+
+SITE_DELAY = 0.2
+LLM_DELAY = 0.8
+SCANS = 10
+
+for key in ("GROQ_API_KEY", "GOOGLE_API_KEY", "NEXT_PUBLIC_SUPABASE_URL", "NEXT_PUBLIC_SUPABASE_ANON_KEY"):
+    os.environ[key] = ""
+os.environ["LLM_CACHE_PATH"] = "off"  # every run must reach the stub LLM
+
+
+async def _drive(app, site_url: str, scans: int) -> dict:
+    import httpx
+    transport = httpx.ASGITransport(app=app, client=("127.0.0.1", 5000))
+    plain, first_math, first_result = [], [], []
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=120) as client:
+        for i in range(scans):
+            t0 = time.perf_counter()
+            (await client.post("/analyze", json={"url": f"{site_url}/?plain={i}"})).raise_for_status()
+            plain.append(time.perf_counter() - t0)
+
+            t0 = time.perf_counter()
+            async with client.stream("POST", "/analyze/stream", json={"url": f"{site_url}/?stream={i}"}) as resp:
+                async for line in resp.aiter_lines():
+                    if line == "event: math": first_math.append(time.perf_counter() - t0)
+                    if line == "event: result":
+                        first_result.append(time.perf_counter() - t0)
+                        break
+    return {"analyze_full_response": summarize_ms(plain), "stream_math_event": summarize_ms(first_math),
+            "stream_result_event": summarize_ms(first_result)}
+
+
+def run(quick: bool = False) -> dict:
+    from groq import Groq
+    import main
+
+    with StaticSite(delay=SITE_DELAY) as site, StubLLM(delay=LLM_DELAY) as llm:
+        main.groq_client = Groq(api_key="stub", base_url=llm.groq_base_url, max_retries=0)
+        main.supabase = None
+        with contextlib.redirect_stdout(io.StringIO()):
+            results = asyncio.run(_drive(main.app, site.url, 3 if quick else SCANS))
+    return {"site_delay_ms": SITE_DELAY * 1000, "llm_delay_ms": LLM_DELAY * 1000, "results": results}
+
+
+if __name__ == "__main__":
+    print(json.dumps(run(), indent=2))
@@ -0,0 +1,217 @@
+# benchmarks/bench_suite.py
+# Reproducible benchmark suite over the checked-in HTML corpus (fixtures/pages, see manifest.json)
+#   micro: PageDocument parse, each calculate_*_score, calculate_math_score (shared document and
+#          re-parse), get_persona_context, validate_industry and get_brand_tier, per corpus page
+#   e2e: POST /analyze for every corpus page against local StaticSite pages, the stub LLM and a
+#        fake PostgREST standing in for Supabase (full scan, then cached), plus per-stage means
+#        from the /metrics histograms
+# Memoization (text analysis, signal matching, brand lookups) is cleared before every timed call,
+# so each sample costs what a first scan of that page costs. Results are one flat JSON object;
+# `compare` flags metrics whose time regressed by more than --threshold against a baseline.
+#
+#   python benchmarks/bench_suite.py run [--quick] [--skip-e2e] [--out results.json]
+#   python benchmarks/bench_suite.py compare baseline.json results.json [--threshold 0.15]
+
+import io
+import os
+import sys
+import json
+import time
+import asyncio
+import argparse
+import platform
+import contextlib
+
+from harness import StaticSite, StubLLM, FakePostgREST, summarize_ms
+
+PAGES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures", "pages")
+REPEAT = 20
+E2E_REPEAT = 3
+MIN_DELTA_MS = 0.05  # differences below this are timer noise, never a regression
+
+for key in ("GROQ_API_KEY", "GOOGLE_API_KEY", "NEXT_PUBLIC_SUPABASE_URL", "NEXT_PUBLIC_SUPABASE_ANON_KEY"):
+    os.environ[key] = ""
+os.environ["LLM_CACHE_PATH"] = "off"       # every full scan reaches the stub LLM
+os.environ["PAGE_VERSIONS_PATH"] = "off"   # and is never revalidated
+os.environ.setdefault("SCORE_POOL_WORKERS", "0")  # score inline: no process start-up in the numbers
+
+
+def load_corpus() -> list:
+    with open(os.path.join(PAGES_DIR, "manifest.json"), encoding="utf-8") as f:
+        manifest = json.load(f)
+    for entry in manifest:
+        with open(os.path.join(PAGES_DIR, entry["file"]), encoding="utf-8") as f:
+            entry["html"] = f.read()
+        entry["name"] = entry["file"].rsplit(".", 1)[0]
+    return manifest
+
+
+def _clear_memos():
+    import famous_brands
+    from keyword_matcher import match_signals
+    from text_analysis import _analyze_cached
+    match_signals.cache_clear()
+    _analyze_cached.cache_clear()
+    famous_brands._lookup_host.cache_clear()
+
+
+def _time(fn, repeat: int) -> dict:
+    samples = []
+    for _ in range(repeat):
+        _clear_memos()
+        t0 = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - t0)
+    return summarize_ms(samples)
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# MICRO BENCHMARKS
+# ═══════════════════════════════════════════════════════════════════════════
+
+def run_micro(corpus: list, repeat: int) -> dict:
+    import scoring_engine as se
+    from page_document import PageDocument
+    from persona_engine import get_persona_context
+    from industry_config import validate_industry
+    from famous_brands import get_brand_tier
+
+    metrics = {}
+    for page in corpus:
+        html, url, name = page["html"], page["url"], page["name"]
+        doc = PageDocument(html, text_limit=6000)
+        text = doc.text
+        math = se.calculate_math_score(html, text, url, doc=doc)
+        breakdown = {k: v["score"] for k, v in math["breakdown"].items()}
+        cases = {
+            "page_document_parse": lambda: PageDocument(html, text_limit=6000),
+            "calculate_technical_score": lambda: se.calculate_technical_score(html, url, doc=doc),
+            "calculate_content_score": lambda: se.calculate_content_score(text, doc=doc),
+            "calculate_authority_score": lambda: se.calculate_authority_score(html, text, doc=doc),
+            "calculate_ai_discoverability_score": lambda: se.calculate_ai_discoverability_score(html, text, doc=doc),
+            "calculate_answerability_score": lambda: se.calculate_answerability_score(text, doc=doc),
+            "calculate_math_score.shared_doc": lambda: se.calculate_math_score(html, text, url, doc=doc),
+            "calculate_math_score.reparse": lambda: se.calculate_math_score(html, text, url),
+            "get_persona_context": lambda: get_persona_context(url=url, text=text, industry=page["industry"], company_tier="growth",
+                                                               score=math["total"], breakdown=breakdown, detected_issues=["Missing FAQ schema"], benchmark=80),
+            "validate_industry": lambda: validate_industry(page["industry"], text),
+            "get_brand_tier": lambda: get_brand_tier(url),
+        }
+        with contextlib.redirect_stdout(io.StringIO()):
+            for case, fn in cases.items():
+                metrics[f"micro.{case}.{name}"] = _time(fn, repeat)
+    return metrics
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# END TO END
+# ═══════════════════════════════════════════════════════════════════════════
+
+async def _analyze(app, urls: list) -> list:
+    import httpx
+    transport = httpx.ASGITransport(app=app, client=("127.0.0.1", 5000))
+    samples = []
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=120) as client:
+        for url in urls:
+            t0 = time.perf_counter()
+            (await client.post("/analyze", json={"url": url, "email": "bench@example.com"})).raise_for_status()
+            samples.append(time.perf_counter() - t0)
+    return samples
+
+
+def run_e2e(corpus: list, repeat: int) -> dict:
+    from groq import Groq
+    import main
+
+    metrics = {}
+    pages = {"/" + page["file"]: page["html"] for page in corpus}
+    with StaticSite(pages=pages) as site, StubLLM() as llm, FakePostgREST() as db:
+        main.groq_client = Groq(api_key="stub", base_url=llm.groq_base_url, max_retries=0)
+        main.supabase = db.client()
+        urls = [site.url + path for path in pages]
+        full, cached = [], []
+        with contextlib.redirect_stdout(io.StringIO()):
+            for _ in range(repeat):
+                main.result_cache.clear()
+                db.tables.clear()
+                full += asyncio.run(_analyze(main.app, urls))
+                cached += asyncio.run(_analyze(main.app, urls))
+        metrics["e2e.analyze_full"] = summarize_ms(full)
+        metrics["e2e.analyze_cached"] = summarize_ms(cached)
+        for (stage,), series in sorted(main.stage_seconds._series.items()):
+            metrics[f"e2e.stage.{stage}"] = {"n": series[-1], "mean_ms": round(series[-2] / series[-1] * 1000, 3)}
+    return metrics
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# RUN / COMPARE
+# ═══════════════════════════════════════════════════════════════════════════
+
+def run(quick: bool = False, skip_e2e: bool = False) -> dict:
+    from page_document import PAGE_PARSER
+    from text_analysis import TEXT_ANALYZER
+
+    corpus = load_corpus()
+    metrics = run_micro(corpus, 3 if quick else REPEAT)
+    if not skip_e2e: metrics.update(run_e2e(corpus, 1 if quick else E2E_REPEAT))
+    return {
+        "meta": {"python": platform.python_version(), "platform": platform.platform(), "parser": PAGE_PARSER,
+                 "text_analyzer": TEXT_ANALYZER, "quick": quick, "pages": [page["file"] for page in corpus],
+                 "created_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())},
+        "metrics": metrics,
+    }
+
+
+def _value(metric: dict):
+    return metric.get("p50_ms", metric.get("mean_ms"))
+
+
+def compare(baseline: dict, current: dict, threshold: float = 0.15) -> dict:
+    """Metrics present in both runs whose time grew by more than `threshold` (and MIN_DELTA_MS)."""
+    regressions, improvements = {}, {}
+    base, cur = baseline["metrics"], current["metrics"]
+    for key in sorted(set(base) & set(cur)):
+        before, after = _value(base[key]), _value(cur[key])
+        if not before or after is None: continue
+        change = (after - before) / before
+        entry = {"baseline_ms": before, "current_ms": after, "change": round(change, 3)}
+        if change > threshold and after - before > MIN_DELTA_MS: regressions[key] = entry
+        elif change < -threshold and before - after > MIN_DELTA_MS: improvements[key] = entry
+    for field in ("parser", "text_analyzer", "python"):
+        before, after = baseline["meta"].get(field), current["meta"].get(field)
+        if before != after: print(f"   ⚠️ Runs differ in {field} ({before} vs {after}); timings may not be comparable", file=sys.stderr)
+    return {"threshold": threshold, "compared": len(set(base) & set(cur)),
+            "missing": sorted(set(base) - set(cur)), "new": sorted(set(cur) - set(base)),
+            "regressions": regressions, "improvements": improvements}
+
+
+def main_cli(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="AmplifyAI benchmark suite")
+    sub = parser.add_subparsers(dest="command", required=True)
+    run_cmd = sub.add_parser("run", help="run the suite and write JSON results")
+    run_cmd.add_argument("--quick", action="store_true")
+    run_cmd.add_argument("--skip-e2e", action="store_true", help="micro benchmarks only (no httpx/groq/supabase needed)")
+    run_cmd.add_argument("--out", help="write results here (default: stdout)")
+    cmp_cmd = sub.add_parser("compare", help="flag regressions of RESULTS against BASELINE (exit 1 if any)")
+    cmp_cmd.add_argument("baseline")
+    cmp_cmd.add_argument("results")
+    cmp_cmd.add_argument("--threshold", type=float, default=0.15, help="allowed relative slowdown (default 0.15)")
+    args = parser.parse_args(argv)
+
+    if args.command == "run":
+        output = json.dumps(run(quick=args.quick, skip_e2e=args.skip_e2e), indent=2)
+        if args.out:
+            with open(args.out, "w", encoding="utf-8") as f: f.write(output + "\n")
+        else:
+            print(output)
+        return 0
+
+    with open(args.baseline, encoding="utf-8") as f: baseline = json.load(f)
+    with open(args.results, encoding="utf-8") as f: current = json.load(f)
+    report = compare(baseline, current, args.threshold)
+    print(json.dumps(report, indent=2))
+    return 1 if report["regressions"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main_cli())
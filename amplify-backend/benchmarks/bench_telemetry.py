@@ -0,0 +1,87 @@
+# benchmarks/bench_telemetry.py
+# scan_logs telemetry through write_behind.WriteBehindBuffer against a local fake PostgREST
+#   per_row: one blocking insert per scan (old log_scan_metrics)
+#   buffered: add() on the request path, bulk inserts in the background
+#   outage: the fake returns 503 for a while; rows spill to disk and replay on recovery
+# Inserts are plain HTTP POSTs to /rest/v1/scan_logs (no supabase client needed).
+#
+#   python benchmarks/bench_telemetry.py
+
+import os
+import json
+import time
+import asyncio
+import tempfile
+import urllib.request
+
+from harness import FakePostgREST, summarize_ms
+from write_behind import WriteBehindBuffer
+
+RTT = 0.02
+ROWS = 500
+
+
+def _inserter(fake: FakePostgREST):
+    def insert(rows: list):
+        req = urllib.request.Request(f"{fake.url}/rest/v1/scan_logs", data=json.dumps(rows).encode(),
+                                     headers={"Content-Type": "application/json"})
+        urllib.request.urlopen(req, timeout=5).read()
+    return insert
+
+
+def _row(i: int) -> dict:
+    return {"url": f"https://site{i}.example", "total_duration_ms": 1200, "scrape_status": "curl-cffi",
+            "ai_status": "groq", "cache_status": "miss", "final_score": 60}
+
+
+def _per_row(rows: int) -> dict:
+    with FakePostgREST(delay=RTT) as fake:
+        insert = _inserter(fake)
+        samples = []
+        for i in range(rows):
+            t0 = time.perf_counter()
+            insert([_row(i)])
+            samples.append(time.perf_counter() - t0)
+        return {"request_path": summarize_ms(samples), "stored": len(fake.tables.get("scan_logs", [])),
+                "inserts": fake.requests.get("scan_logs", 0)}
+
+
+async def _buffered(rows: int, outage_at: int = None, spill_path: str = None) -> dict:
+    with FakePostgREST(delay=RTT) as fake:
+        buffer = WriteBehindBuffer(_inserter(fake), batch_size=50, interval=0.2, max_backoff=0.5, spill_path=spill_path or "off")
+        flusher = asyncio.create_task(buffer.run())
+        samples = []
+        spilled_peak = 0
+        for i in range(rows):
+            if outage_at is not None and i == outage_at: fake.down = True
+            if outage_at is not None and i == outage_at + rows // 3: fake.down = False
+            t0 = time.perf_counter()
+            buffer.add(_row(i))
+            samples.append(time.perf_counter() - t0)
+            spilled_peak = max(spilled_peak, buffer.stats["spill_rows"])
+            await asyncio.sleep(0.002)  # request pacing
+        deadline = time.monotonic() + 10
+        while (buffer.stats["pending"] or buffer.stats["spill_rows"]) and time.monotonic() < deadline:
+            await asyncio.sleep(0.1)
+        await buffer.close()
+        flusher.cancel()
+        stats = buffer.stats
+        return {"request_path": summarize_ms(samples), "stored": len(fake.tables.get("scan_logs", [])),
+                "inserts": fake.requests.get("scan_logs", 0), "spill_peak_rows": spilled_peak,
+                "dropped": stats["dropped"] + stats["spill_dropped"], "replayed": stats["replayed"],
+                "flush_ms": stats["flush_ms"]}
+
+
+def run(quick: bool = False) -> dict:
+    rows = 100 if quick else ROWS
+    with tempfile.TemporaryDirectory() as tmp:
+        results = {
+            "per_row": _per_row(rows),
+            "buffered": asyncio.run(_buffered(rows)),
+            "outage": asyncio.run(_buffered(rows, outage_at=rows // 4, spill_path=os.path.join(tmp, "scan_logs.spill.jsonl"))),
+        }
+    return {"rtt_ms": RTT * 1000, "rows": rows, "results": results}
+
+
+if __name__ == "__main__":
+    print(json.dumps(run(), indent=2))
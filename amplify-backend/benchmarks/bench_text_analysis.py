@@ -0,0 +1,104 @@
+# benchmarks/bench_text_analysis.py
+# Lexicon text analyzer vs the TextBlob pipeline on the fixture corpus: agreement + speed
+# Reference is full TextBlob when the NLTK corpora are installed, otherwise TextBlob's
+# offline pattern tagger/tokenizer/sentiment (the same lexicons the NLTK-free path uses).
+#
+#   python benchmarks/bench_text_analysis.py           # report
+#   python benchmarks/bench_text_analysis.py --check   # exit 1 if agreement drops below tolerance
+
+import os
+import sys
+import json
+
+from harness import time_call
+
+import text_analysis
+
+CORPUS = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures", "content_corpus.json")
+
+# Tolerances for --check
+MAX_MEAN_DENSITY_DIFF = 0.06
+MAX_MEAN_POLARITY_DIFF = 0.05
+MIN_BAND_AGREEMENT = 0.8
+
+
+def _pattern_reference(text: str) -> dict:
+    from textblob.en.taggers import PatternTagger
+    from textblob.en.sentiments import PatternAnalyzer
+    from textblob.en import tokenize
+    tagged = [(w, t) for w, t in PatternTagger().tag(text) if w[0].isalnum()]
+    meaningful = sum(1 for _, t in tagged if t in text_analysis.MEANINGFUL_TAGS)
+    return {
+        "word_count": len(tagged),
+        "meaningful_count": meaningful,
+        "density": meaningful / (len(tagged) or 1),
+        "sentence_count": len(tokenize(text)),
+        "polarity": PatternAnalyzer().analyze(text).polarity,
+    }
+
+
+def _reference():
+    try:
+        text_analysis._analyze_textblob("Probe sentence. Another one.")
+        return "textblob", text_analysis._analyze_textblob
+    except Exception:
+        return "textblob_pattern_offline", _pattern_reference
+
+
+def _bands(result: dict, word_count: int) -> tuple:
+    """The score bands calculate_content_score derives from an analysis."""
+    d, p = result["density"], result["polarity"]
+    density_band = 5 if d >= 0.45 else 3 if d >= 0.35 else 1 if d >= 0.25 else 0
+    avg = word_count / (result["sentence_count"] or 1)
+    readability_band = 3 if 12 <= avg <= 22 else 2 if 8 <= avg <= 30 else 1
+    sentiment_band = 3 if p >= 0.2 else 2 if p >= 0 else 0
+    return density_band, readability_band, sentiment_band
+
+
+def run(quick: bool = False) -> dict:
+    texts = [t["text"] for t in json.load(open(CORPUS))["texts"]]
+    ref_name, reference = _reference()
+    text_analysis.load_lexicons()
+
+    density_diffs, polarity_diffs, sentence_diffs, band_matches, band_total = [], [], [], 0, 0
+    for text in texts:
+        ours, ref = text_analysis._analyze_lexicon(text), reference(text)
+        density_diffs.append(abs(ours["density"] - ref["density"]))
+        polarity_diffs.append(abs(ours["polarity"] - ref["polarity"]))
+        sentence_diffs.append(abs(ours["sentence_count"] - ref["sentence_count"]))
+        wc = len(text.split())
+        for a, b in zip(_bands(ours, wc), _bands(ref, wc)):
+            band_matches += a == b
+            band_total += 1
+
+    long_text = " ".join(texts)[:3000]
+    repeat = 5 if quick else 30
+    return {
+        "reference": ref_name,
+        "texts": len(texts),
+        "mean_density_diff": round(sum(density_diffs) / len(texts), 4),
+        "mean_polarity_diff": round(sum(polarity_diffs) / len(texts), 4),
+        "mean_sentence_count_diff": round(sum(sentence_diffs) / len(texts), 2),
+        "band_agreement": round(band_matches / band_total, 3),
+        "lexicon_3000_chars": time_call(text_analysis._analyze_lexicon, long_text, repeat=repeat),
+        "reference_3000_chars": time_call(reference, long_text, repeat=repeat),
+        "memoized_hit": time_call(text_analysis.analyze_text, long_text, repeat=repeat),
+    }
+
+
+def check(result: dict) -> list:
+    failures = []
+    if result["mean_density_diff"] > MAX_MEAN_DENSITY_DIFF: failures.append("density")
+    if result["mean_polarity_diff"] > MAX_MEAN_POLARITY_DIFF: failures.append("polarity")
+    if result["band_agreement"] < MIN_BAND_AGREEMENT: failures.append("band_agreement")
+    return failures
+
+
+if __name__ == "__main__":
+    result = run()
+    print(json.dumps(result, indent=2))
+    if "--check" in sys.argv:
+        failures = check(result)
+        if failures:
+            print(f"FAILED: {', '.join(failures)}")
+            sys.exit(1)
@@ -0,0 +1,106 @@
+# benchmarks/bench_ttl_cache.py
+# Persona cache set/get at capacity
+#   dict_sort: old persona_cache dict, sorting every key by created_at once capacity is reached
+#              (then dropping the oldest 10%)
+#   ttl_cache: ttl_cache.TTLCache (OrderedDict LRU, per-entry TTL, byte bound)
+# `--check` also runs behaviour checks on TTLCache (LRU order, TTL, bytes, sweeps).
+#
+#   python benchmarks/bench_ttl_cache.py [--check]
+
+import sys
+import json
+import time
+
+from harness import summarize_ms
+
+from ttl_cache import TTLCache
+
+CAPACITIES = (1000, 10000)
+PAYLOAD = {"status": "ready", "pain_hook": "Your brand is invisible to AI answers." * 3, "cta": "Fix it", "plan": ["a", "b", "c"]}
+
+
+class DictSortCache:
+    """The old main.py persona_cache logic."""
+
+    def __init__(self, capacity: int, ttl: float = 300):
+        self.data = {}
+        self.capacity = capacity
+        self.ttl = ttl
+
+    def get(self, key):
+        if key in self.data:
+            entry = self.data[key]
+            if time.time() - entry["created_at"] < self.ttl:
+                return entry
+        return None
+
+    def set(self, key, value):
+        if len(self.data) >= self.capacity:
+            oldest = sorted(self.data.keys(), key=lambda k: self.data[k]["created_at"])[:self.capacity // 10]
+            for k in oldest: del self.data[k]
+        self.data[key] = {**value, "created_at": time.time(), "status": "ready"}
+
+
+def _workload(cache, ops: int) -> dict:
+    set_samples, get_samples = [], []
+    for i in range(ops):
+        key = f"{i:016x}"
+        t0 = time.perf_counter()
+        cache.set(key, PAYLOAD)
+        set_samples.append(time.perf_counter() - t0)
+        t0 = time.perf_counter()
+        cache.get(f"{max(0, i - 50):016x}")
+        get_samples.append(time.perf_counter() - t0)
+    return {
+        "set": {**summarize_ms(set_samples), "total_ms": round(sum(set_samples) * 1000, 2)},
+        "get": {**summarize_ms(get_samples), "total_ms": round(sum(get_samples) * 1000, 2)},
+    }
+
+
+def check() -> list:
+    failures = []
+    c = TTLCache(maxsize=3, ttl=60)
+    for k in "abc": c.set(k, k)
+    c.get("a")
+    c.set("d", "d")
+    if "b" in c or "a" not in c: failures.append("lru_order")
+
+    c = TTLCache(maxsize=10, ttl=60)
+    c.set("short", 1, ttl=0.01)
+    c.set("long", 2)
+    time.sleep(0.02)
+    if c.get("short") is not None or c.get("long") != 2: failures.append("per_entry_ttl")
+
+    c = TTLCache(maxsize=100, ttl=60, max_bytes=100, sizeof=lambda v: 30)
+    for k in range(5): c.set(k, k)
+    if len(c) != 3 or c.stats["bytes"] != 90: failures.append("max_bytes")
+    c.set(4, "again")
+    if c.stats["bytes"] != 90: failures.append("overwrite_bytes")
+
+    c = TTLCache(maxsize=100, ttl=0.01, sweep_interval=0.01)
+    for k in range(10): c.set(k, k)
+    time.sleep(0.02)
+    c.set("fresh", 1, ttl=60)
+    if len(c) != 1: failures.append("periodic_sweep")
+    if c.sweep() != 0: failures.append("sweep_count")
+    return failures
+
+
+def run(quick: bool = False) -> dict:
+    ops = 3000 if quick else 30000
+    results = {}
+    for capacity in CAPACITIES:
+        before = _workload(DictSortCache(capacity), ops)
+        after = _workload(TTLCache(maxsize=capacity, ttl=300, max_bytes=64_000_000), ops)
+        results[f"capacity_{capacity}"] = {"dict_sort": before, "ttl_cache": after}
+    return {"ops": ops, "results": results}
+
+
+if __name__ == "__main__":
+    print(json.dumps(run(), indent=2))
+    if "--check" in sys.argv:
+        failures = check()
+        if failures:
+            print(f"FAILED: {', '.join(failures)}")
+            sys.exit(1)
+        print("checks passed")
@@ -0,0 +1,403 @@
+# benchmarks/harness.py
+# Local stand-ins for benchmarks: static scrape target, stub LLM, fake Supabase/Redis, timing helpers
+# Everything binds to 127.0.0.1 on an ephemeral port - no real sites or APIs are hit
+
+import os
+import sys
+import json
+import time
+import random
+import hashlib
+import threading
+from urllib.parse import urlsplit, parse_qsl
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if BACKEND_DIR not in sys.path:
+    sys.path.insert(0, BACKEND_DIR)
+
+WORDS = (
+    "platform customers trusted enterprise security pricing integration analytics team "
+    "growth marketing software cloud dashboard support review partner award certified "
+    "how what why when where we our build help teams ship faster reliable data insight "
+    "contact email phone address location guide steps process benefit because price free"
+).split()
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# PAGE GENERATION
+# ═══════════════════════════════════════════════════════════════════════════
+
+def sample_page(words: int = 1500, seed: int = 7) -> str:
+    """Deterministic marketing-style page with meta tags, headings, JSON-LD and links."""
+    rng = random.Random(seed)
+    paragraphs = []
+    remaining = words
+    while remaining > 0:
+        n = min(remaining, rng.randint(40, 90))
+        sentence_words = [rng.choice(WORDS) for _ in range(n)]
+        sentences = []
+        for i in range(0, n, 14):
+            chunk = sentence_words[i:i + 14]
+            sentences.append(" ".join(chunk).capitalize() + ".")
+        paragraphs.append(f"<p>{' '.join(sentences)}</p>")
+        remaining -= n
+    body = "\n".join(
+        (f"<h2>Section {i}</h2>\n" if i % 4 == 0 else "") + p for i, p in enumerate(paragraphs)
+    )
+    return f"""<!DOCTYPE html>
+<html lang="en"><head>
+<meta charset="utf-8">
+<title>Acme Analytics - Reliable data platform for growth teams</title>
+<meta name="description" content="Acme Analytics helps growth teams ship faster with reliable data, trusted by 2,000 customers worldwide. Start a free trial today.">
+<script type="application/ld+json">{{"@context": "https://schema.org", "@type": "Organization", "name": "Acme"}}</script>
+<script type="application/ld+json">{{"@context": "https://schema.org", "@type": "FAQPage"}}</script>
+<style>body {{ font-family: sans-serif; }}</style>
+</head><body>
+<nav><a href="/">Home</a> <a href="/blog">Blog</a> <a href="/pricing">Pricing</a></nav>
+<h1>Reliable analytics for growth teams</h1>
+{body}
+<h2>Frequently asked questions</h2>
+<p>What is Acme? How does pricing work? Why choose us? Contact our team by email or phone.</p>
+<footer><a href="https://linkedin.com/company/acme">LinkedIn</a> <a href="https://github.com/acme">GitHub</a> Founded 2019. Acme Inc.</footer>
+<script>window.dataLayer = [];</script>
+</body></html>"""
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# LOCAL SERVERS
+# ═══════════════════════════════════════════════════════════════════════════
+
+class _QuietHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True  # headers and body go out in separate writes
+
+    def log_message(self, *args):
+        pass
+
+    def _send(self, status: int, body: bytes, content_type: str, headers: dict = None):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        for k, v in (headers or {}).items():
+            self.send_header(k, v)
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class _Server(ThreadingHTTPServer):
+    def handle_error(self, request, client_address):
+        # Clients that time out and hang up (broken pipe) are expected in latency benchmarks
+        if not isinstance(sys.exc_info()[1], ConnectionError):
+            super().handle_error(request, client_address)
+
+
+class LocalServer:
+    """Runs a handler class on a daemon thread. Use as a context manager."""
+
+    def __init__(self, handler_cls):
+        self.httpd = _Server(("127.0.0.1", 0), handler_cls)
+        self.httpd.daemon_threads = True
+        self.httpd.owner = self
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.httpd.server_address[1]}"
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+class StaticSite(LocalServer):
+    """
+    Serves `pages` ({path: html}) or `default_page` for any path, after `delay` seconds.
+    With `etag=True` responses carry an ETag and a matching If-None-Match gets a bodyless 304.
+    `connect_delay` is paid once per new connection (stands in for the TCP + TLS handshake).
+    Bodies are encoded once per page and reused, so serving allocates nothing per request.
+    """
+
+    def __init__(self, default_page: str = None, pages: dict = None, delay: float = 0.0, etag: bool = False,
+                 connect_delay: float = 0.0):
+        self.default_page = default_page if default_page is not None else sample_page()
+        self.pages = pages or {}
+        self.delay = delay
+        self.etag = etag
+        self.connect_delay = connect_delay
+        self.hits = 0
+        self.connections = 0
+        self.not_modified = 0
+        self.bytes_sent = 0
+        self._bodies = {}
+
+        class Handler(_QuietHandler):
+            def setup(handler):
+                super().setup()
+                site = handler.server.owner
+                site.connections += 1
+                if site.connect_delay: time.sleep(site.connect_delay)
+
+            def do_GET(handler):
+                site = handler.server.owner
+                site.hits += 1
+                if site.delay: time.sleep(site.delay)
+                html = site.pages.get(handler.path.split("?")[0], site.default_page)
+                body = site._bodies.get(html)
+                if body is None: body = site._bodies.setdefault(html, html.encode("utf-8"))
+                headers = {}
+                if site.etag:
+                    headers["ETag"] = '"%s"' % hashlib.sha1(body).hexdigest()
+                    if handler.headers.get("If-None-Match") == headers["ETag"]:
+                        site.not_modified += 1
+                        handler._send(304, b"", "text/html; charset=utf-8", headers)
+                        return
+                site.bytes_sent += len(body)
+                handler._send(200, body, "text/html; charset=utf-8", headers)
+
+        super().__init__(Handler)
+
+
+DEFAULT_JUDGMENT = {
+    "ai_judgment_score": {"total": 24, "breakdown": {"brand_clarity": 10, "trust": 10, "sentiment": 4}},
+    "industry": "SaaS/Tech",
+    "company_tier": "growth",
+    "detected_issues": ["Missing comparison pages"],
+    "fix_list": [{"title": "Add comparison pages", "priority": "medium", "description": "Cover competitor queries.", "impact_metric": "AI Citations", "status": "pending"}],
+}
+
+
+class StubLLM(LocalServer):
+    """
+    OpenAI-compatible chat completions endpoint (what the Groq SDK speaks).
+    Point a client at `groq_base_url`. `delay` may be a float or a callable returning one.
+    """
+
+    def __init__(self, payload: dict = None, delay=0.0):
+        self.payload = payload or DEFAULT_JUDGMENT
+        self.delay = delay
+        self.calls = 0
+
+        class Handler(_QuietHandler):
+            def do_POST(handler):
+                stub = handler.server.owner
+                stub.calls += 1
+                length = int(handler.headers.get("Content-Length", 0))
+                handler.rfile.read(length)
+                delay = stub.delay() if callable(stub.delay) else stub.delay
+                if delay: time.sleep(delay)
+                body = {
+                    "id": f"stub-{stub.calls}", "object": "chat.completion", "created": int(time.time()),
+                    "model": "stub",
+                    "choices": [{"index": 0, "finish_reason": "stop",
+                                 "message": {"role": "assistant", "content": json.dumps(stub.payload)}}],
+                    "usage": {"prompt_tokens": 1, "completion_tokens": 1, "total_tokens": 2},
+                }
+                handler._send(200, json.dumps(body).encode(), "application/json")
+
+        super().__init__(Handler)
+
+    @property
+    def groq_base_url(self) -> str:
+        return self.url
+
+
+class FakePostgREST(LocalServer):
+    """
+    Minimal in-memory PostgREST (what supabase-py talks to) for /rest/v1/<table>.
+    GET supports select, eq./gte./ilike. filters, order and limit; POST inserts or
+    upserts (on_conflict). Every request waits `delay` seconds, standing in for the
+    network round trip. `tables` holds the rows, `requests` counts calls per table
+    (or function). POST /rpc/save_scan mirrors migrations/002 unless rpc=False.
+    Set `down = True` to answer everything with 503 (outage).
+    """
+
+    def __init__(self, delay: float = 0.0, rpc: bool = True):
+        self.delay = delay
+        self.tables = {}
+        self.requests = {}
+        self.functions = {"save_scan": _save_scan} if rpc else {}
+        self.down = False
+        self.lock = threading.Lock()
+
+        class Handler(_QuietHandler):
+            def _table(handler):
+                parts = urlsplit(handler.path)
+                name = parts.path.rsplit("/", 1)[-1]
+                stub = handler.server.owner
+                with stub.lock:
+                    stub.requests[name] = stub.requests.get(name, 0) + 1
+                if stub.delay: time.sleep(stub.delay)
+                return stub, name, parse_qsl(parts.query)
+
+            def _unavailable(handler):
+                if not handler.server.owner.down: return False
+                handler.rfile.read(int(handler.headers.get("Content-Length", 0)))
+                handler._send(503, b'{"message": "stub outage"}', "application/json")
+                return True
+
+            def do_GET(handler):
+                stub, name, query = handler._table()
+                if handler._unavailable(): return
+                with stub.lock:
+                    rows = [dict(r) for r in stub.tables.get(name, [])]
+                order, limit = None, None
+                for key, value in query:
+                    if key == "select": continue
+                    if key == "order": order = value; continue
+                    if key == "limit": limit = int(value); continue
+                    op, _, arg = value.partition(".")
+                    rows = [r for r in rows if _matches(r.get(key), op, arg)]
+                if order:
+                    col, _, direction = order.partition(".")
+                    rows.sort(key=lambda r: str(r.get(col) or ""), reverse=direction.startswith("desc"))
+                if limit is not None: rows = rows[:limit]
+                handler._send(200, json.dumps(rows).encode(), "application/json")
+
+            def do_POST(handler):
+                stub, name, query = handler._table()
+                if handler._unavailable(): return
+                length = int(handler.headers.get("Content-Length", 0))
+                payload = json.loads(handler.rfile.read(length) or b"[]")
+                if "/rpc/" in handler.path:
+                    if name not in stub.functions:
+                        body = {"code": "PGRST202", "message": f"Could not find the function public.{name}"}
+                        return handler._send(404, json.dumps(body).encode(), "application/json")
+                    with stub.lock:
+                        result = stub.functions[name](stub, **payload)
+                    return handler._send(200, json.dumps(result).encode(), "application/json")
+                rows = payload if isinstance(payload, list) else [payload]
+                conflict = dict(query).get("on_conflict")
+                with stub.lock:
+                    table = stub.tables.setdefault(name, [])
+                    stored = []
+                    for row in rows:
+                        existing = next((r for r in table if conflict and r.get(conflict) == row.get(conflict)), None)
+                        if existing is not None:
+                            existing.update(row)
+                            stored.append(dict(existing))
+                            continue
+                        row = {"id": len(table) + 1, "created_at": time.strftime("%Y-%m-%dT%H:%M:%S+00:00", time.gmtime()), **row}
+                        table.append(row)
+                        stored.append(dict(row))
+                handler._send(201, json.dumps(stored).encode(), "application/json")
+
+        super().__init__(Handler)
+
+    def client(self):
+        from supabase import create_client
+        return create_client(self.url, "stub-key")
+
+
+def _insert_row(stub, table: str, row: dict) -> dict:
+    rows = stub.tables.setdefault(table, [])
+    row = {"id": len(rows) + 1, "created_at": time.strftime("%Y-%m-%dT%H:%M:%S+00:00", time.gmtime()), **row}
+    rows.append(row)
+    return row
+
+
+def _save_scan(stub, p_email: str, p_scan: dict) -> dict:
+    lead = next((r for r in stub.tables.get("leads", []) if r.get("email") == p_email), None)
+    if lead is None: lead = _insert_row(stub, "leads", {"email": p_email, "marketing_source": "web_scan"})
+    scan = _insert_row(stub, "scan_results", {"lead_id": lead["id"], **p_scan})
+    return {"lead_id": lead["id"], "scan_id": scan["id"]}
+
+
+def _matches(value, op: str, arg: str) -> bool:
+    if op == "eq": return str(value) == arg
+    if op == "gte": return value is not None and str(value) >= arg
+    if op == "ilike": return value is not None and arg.strip("*%").lower() in str(value).lower()
+    return True
+
+
+class FakeRedis:
+    """In-process stand-in for the redis-py commands rate_limiter uses (get/incr/decr/expire/pipeline)."""
+
+    def __init__(self):
+        self.data = {}
+        self.expires = {}
+        self.lock = threading.Lock()
+
+    def _live(self, key):
+        deadline = self.expires.get(key)
+        if deadline is not None and deadline <= time.time():
+            self.data.pop(key, None)
+            self.expires.pop(key, None)
+        return self.data.get(key)
+
+    def get(self, key):
+        with self.lock:
+            value = self._live(key)
+            return None if value is None else str(value).encode()
+
+    def incr(self, key, amount: int = 1):
+        with self.lock:
+            value = int(self._live(key) or 0) + amount
+            self.data[key] = value
+            return value
+
+    def decr(self, key, amount: int = 1):
+        return self.incr(key, -amount)
+
+    def expire(self, key, seconds: int):
+        with self.lock:
+            if key not in self.data: return False
+            self.expires[key] = time.time() + seconds
+            return True
+
+    def pipeline(self):
+        return _FakePipeline(self)
+
+
+class _FakePipeline:
+    def __init__(self, redis):
+        self.redis = redis
+        self.calls = []
+
+    def __getattr__(self, name):
+        def queue(*args):
+            self.calls.append((name, args))
+            return self
+        return queue
+
+    def execute(self):
+        results = [getattr(self.redis, name)(*args) for name, args in self.calls]
+        self.calls = []
+        return results
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# TIMING HELPERS
+# ═══════════════════════════════════════════════════════════════════════════
+
+def percentile(samples: list, pct: float) -> float:
+    if not samples: return 0.0
+    ordered = sorted(samples)
+    idx = min(len(ordered) - 1, max(0, int(round(pct / 100 * (len(ordered) - 1)))))
+    return ordered[idx]
+
+
+def summarize_ms(samples: list) -> dict:
+    """Latency summary in milliseconds from samples in seconds."""
+    return {
+        "n": len(samples),
+        "p50_ms": round(percentile(samples, 50) * 1000, 2),
+        "p99_ms": round(percentile(samples, 99) * 1000, 2),
+        "max_ms": round(max(samples) * 1000, 2) if samples else 0.0,
+    }
+
+
+def time_call(fn, *args, repeat: int = 50, **kwargs) -> dict:
+    """Calls fn repeat times and returns per-call latency summary."""
+    samples = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn(*args, **kwargs)
+        samples.append(time.perf_counter() - t0)
+    summary = summarize_ms(samples)
+    summary["mean_ms"] = round(sum(samples) / len(samples) * 1000, 3)
+    return summary
@@ -0,0 +1,140 @@
+# browser_pool.py
+# Persistent headless Chromium for the Playwright fallback scrape
+# One browser per worker, an isolated context + page per scan, bounded page slots
+# (callers queue when full), recycling after N pages or a crash, heavy resources blocked
+
+import os
+import asyncio
+from contextlib import asynccontextmanager
+
+# Resource types never needed to read a page's text/markup
+BLOCKED_RESOURCE_TYPES = {"image", "font", "media"}
+
+
+async def _block_heavy_resources(route):
+    if route.request.resource_type in BLOCKED_RESOURCE_TYPES:
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+class BrowserPool:
+    """
+    Usage:
+        async with browser_pool.page() as page:
+            await page.goto(url)
+
+    BROWSER_POOL_MAX_PAGES (default 4) pages run concurrently, the rest wait.
+    After BROWSER_RECYCLE_AFTER (default 200) pages the browser is replaced;
+    the old one closes once its last in-flight page finishes.
+    """
+
+    def __init__(self, max_pages: int = None, recycle_after: int = None):
+        self.max_pages = max_pages or int(os.getenv("BROWSER_POOL_MAX_PAGES", "4"))
+        self.recycle_after = recycle_after or int(os.getenv("BROWSER_RECYCLE_AFTER", "200"))
+        self._slots = asyncio.Semaphore(self.max_pages)
+        self._lock = asyncio.Lock()
+        self._playwright = None
+        self._browser = None
+        self._pages_on_browser = 0
+        self._in_use = {}     # browser -> open contexts
+        self._closing = set() # browsers we closed on purpose (not crashes)
+        self.stats = {"launches": 0, "recycles": 0, "crashes": 0, "pages": 0, "waiting": 0, "active": 0}
+
+    async def start(self):
+        async with self._lock:
+            await self._ensure_browser()
+
+    async def stop(self):
+        async with self._lock:
+            for browser in list(self._in_use) + ([self._browser] if self._browser else []):
+                await self._close_browser(browser)
+            self._browser = None
+            self._in_use.clear()
+            if self._playwright is not None:
+                await self._playwright.stop()
+                self._playwright = None
+
+    async def _ensure_browser(self):
+        if self._playwright is None:
+            from playwright.async_api import async_playwright
+            self._playwright = await async_playwright().start()
+        if self._browser is None or not self._browser.is_connected():
+            browser = await self._playwright.chromium.launch(headless=True, args=['--no-sandbox'])
+            browser.on("disconnected", self._on_disconnected)
+            self._browser = browser
+            self._in_use.setdefault(browser, 0)
+            self._pages_on_browser = 0
+            self.stats["launches"] += 1
+        return self._browser
+
+    def _on_disconnected(self, browser):
+        if browser in self._closing:
+            self._closing.discard(browser)
+        else:
+            self.stats["crashes"] += 1
+            print("   ⚠️ Browser pool: Chromium disconnected, relaunching on next page")
+        self._in_use.pop(browser, None)
+        if browser is self._browser:
+            self._browser = None
+
+    async def _close_browser(self, browser):
+        self._closing.add(browser)
+        try:
+            await browser.close()
+        except Exception:
+            self._closing.discard(browser)
+
+    async def _acquire_browser(self):
+        async with self._lock:
+            if self._browser is not None and self._pages_on_browser >= self.recycle_after:
+                retiring = self._browser
+                self._browser = None
+                self.stats["recycles"] += 1
+                if self._in_use.get(retiring, 0) == 0:
+                    self._in_use.pop(retiring, None)
+                    await self._close_browser(retiring)
+            browser = await self._ensure_browser()
+            self._pages_on_browser += 1
+            self._in_use[browser] = self._in_use.get(browser, 0) + 1
+            return browser
+
+    async def _release_browser(self, browser):
+        async with self._lock:
+            if browser not in self._in_use: return
+            self._in_use[browser] -= 1
+            if browser is not self._browser and self._in_use[browser] <= 0:
+                self._in_use.pop(browser, None)
+                await self._close_browser(browser)
+
+    @asynccontextmanager
+    async def page(self):
+        self.stats["waiting"] += 1
+        async with self._slots:
+            self.stats["waiting"] -= 1
+            browser = await self._acquire_browser()
+            self.stats["active"] += 1
+            self.stats["pages"] += 1
+            context = None
+            try:
+                try:
+                    context = await browser.new_context()
+                except Exception:
+                    # Browser died without a disconnect event; force a relaunch
+                    if browser is self._browser:
+                        self._browser = None
+                        self.stats["crashes"] += 1
+                    raise
+                await context.route("**/*", _block_heavy_resources)
+                yield await context.new_page()
+            finally:
+                self.stats["active"] -= 1
+                if context is not None:
+                    try:
+                        await context.close()
+                    except Exception:
+                        pass
+                await self._release_browser(browser)
+
+
+browser_pool = BrowserPool()
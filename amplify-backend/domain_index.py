@@ -0,0 +1,74 @@
+# domain_index.py
+# Label-reversed trie for "which known domain does this host belong to" lookups
+# "shop.nike.com" walks com -> nike -> shop, so a lookup costs one dict step per label no
+# matter how many domains are indexed, and "notamazon.com" can never match "amazon.com".
+
+# Suffixes under which different labels belong to different owners (public suffix list,
+# multi-label ICANN entries plus common hosting platforms). An indexed domain that is one
+# of these only matches exactly, never its subdomains ("someone.github.io" is not GitHub).
+PUBLIC_SUFFIXES = frozenset({
+    "co.uk", "org.uk", "ac.uk", "gov.uk", "me.uk", "ltd.uk", "plc.uk",
+    "com.au", "net.au", "org.au", "edu.au", "gov.au",
+    "co.nz", "co.jp", "ne.jp", "or.jp", "co.kr", "co.in", "co.za", "co.il",
+    "com.br", "com.mx", "com.ar", "com.cn", "com.hk", "com.sg", "com.tw", "com.tr",
+    "qc.ca", "on.ca", "bc.ca", "ab.ca",
+    "github.io", "gitlab.io", "herokuapp.com", "vercel.app", "netlify.app", "pages.dev",
+    "workers.dev", "web.app", "firebaseapp.com", "appspot.com", "azurewebsites.net",
+    "cloudfront.net", "blogspot.com", "myshopify.com", "wixsite.com", "squarespace.com",
+    "webflow.io", "fly.dev", "onrender.com", "amazonaws.com",
+})
+
+_ENTRY = object()  # trie key holding the value stored at a node
+
+
+def normalize_host(host: str) -> str:
+    """Lowercase, no port / credentials / trailing dot, leading "www." label dropped."""
+    host = host.strip().lower().rsplit("@", 1)[-1]
+    if host.startswith("["): return host  # IPv6 literal
+    host = host.split(":", 1)[0].rstrip(".")
+    return host[4:] if host.startswith("www.") else host
+
+
+class DomainIndex:
+    """
+    Usage:
+        index = DomainIndex()
+        index.add("amazon.com", info)
+        index.lookup("smile.amazon.com")   # (info, "amazon.com", exact=False)
+        index.lookup("notamazon.com")      # None
+
+    Later `add` calls for the same domain replace the earlier value.
+    """
+
+    def __init__(self, public_suffixes: frozenset = PUBLIC_SUFFIXES):
+        self._root = {}
+        self.public_suffixes = public_suffixes
+        self.size = 0
+
+    def add(self, domain: str, value):
+        domain = normalize_host(domain)
+        node = self._root
+        for label in reversed(domain.split(".")):
+            node = node.setdefault(label, {})
+        if _ENTRY not in node: self.size += 1
+        node[_ENTRY] = (value, domain)
+
+    def lookup(self, host: str):
+        """(value, matched_domain, exact) for the longest indexed domain covering `host`, else None."""
+        labels = normalize_host(host).split(".")
+        node = self._root
+        best = None
+        depth = 0
+        for label in reversed(labels):
+            node = node.get(label)
+            if node is None: break
+            depth += 1
+            if _ENTRY in node: best = (node[_ENTRY], depth)
+        if best is None: return None
+        (value, domain), matched_depth = best
+        exact = matched_depth == len(labels)
+        if not exact and domain in self.public_suffixes: return None
+        return value, domain, exact
+
+    def __len__(self) -> int:
+        return self.size
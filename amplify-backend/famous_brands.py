@@ -3,7 +3,12 @@
 # Expanded list: Major US & Canadian Giants (Tier 1)
 # Prevents wrong scores for blocked enterprise sites
 
+import os
+import json
+from functools import lru_cache
 from urllib.parse import urlparse
+from keyword_matcher import register_signals, match_signals
+from domain_index import DomainIndex, normalize_host
 
 # ═══════════════════════════════════════════════════════════════════════════
 # TIER 1 GIANTS: Known brands with pre-set minimum scores
@@ -174,65 +179,96 @@ KNOWN_BLOCKED_DOMAINS = {
 }
 
 
+# ═══════════════════════════════════════════════════════════════════════════
+# BRAND INDEX: every table in one label-reversed trie, built once at import
+# ═══════════════════════════════════════════════════════════════════════════
+
+BRAND_LOOKUP_CACHE_SIZE = int(os.getenv("BRAND_LOOKUP_CACHE_SIZE", "4096"))
+BRAND_INDEX = DomainIndex()
+
+
+def register_brands(table: dict, source: str):
+    """Adds {domain: {"industry", "tier", "min_score"}} to the index; replaces earlier entries."""
+    for domain, info in table.items():
+        BRAND_INDEX.add(domain, (info, source))
+    _lookup_host.cache_clear()
+
+
+def load_brand_file(path: str) -> int:
+    """Loads a JSON brand database ({domain: info}) into the index. Returns the entry count."""
+    with open(path, encoding="utf-8") as f:
+        table = json.load(f)
+    register_brands(table, "brand_db")
+    return len(table)
+
+
+@lru_cache(maxsize=BRAND_LOOKUP_CACHE_SIZE)
+def _lookup_host(host: str):
+    return BRAND_INDEX.lookup(host)
+
+
 def get_brand_tier(url: str) -> dict | None:
     """
-    Check if URL belongs to a known brand.
+    Check if URL belongs to a known brand (exact domain or a subdomain of one).
     Returns tier info or None if unknown.
     """
     try:
         parsed = urlparse(url if url.startswith('http') else f'https://{url}')
-        domain = parsed.netloc.lower().replace('www.', '')
-        
-        # Check Tier 1 Giants
-        if domain in TIER_1_GIANTS:
-            return {**TIER_1_GIANTS[domain], "domain": domain, "source": "tier1_giants"}
-        
-        # Check Known Blocked
-        if domain in KNOWN_BLOCKED_DOMAINS:
-            return {**KNOWN_BLOCKED_DOMAINS[domain], "domain": domain, "source": "known_blocked"}
-        
-        # Check subdomain matches (e.g., shop.nike.com)
-        for known_domain, info in TIER_1_GIANTS.items():
-            if domain.endswith(f'.{known_domain}') or domain.endswith(known_domain):
-                return {**info, "domain": domain, "source": "subdomain_match"}
-        
-        return None
+        domain = normalize_host(parsed.netloc)
+        found = _lookup_host(domain)
+        if found is None: return None
+        (info, source), _, exact = found
+        return {**info, "domain": domain, "source": source if exact else "subdomain_match"}
         
     except Exception as e:
         print(f"   ⚠️ Brand tier check error: {e}")
         return None
 
-def detect_company_tier_from_content(text: str) -> str:
-    """
-    Detects company tier (enterprise/growth/local) from content signals.
-    Used when brand is NOT in our known list.
-    """
-    text_lower = text.lower()
-    
+
+# Tier 1 wins when a domain is in both tables
+register_brands(KNOWN_BLOCKED_DOMAINS, "known_blocked")
+register_brands(TIER_1_GIANTS, "tier1_giants")
+if os.getenv("BRAND_DB_PATH"):
+    try:
+        print(f"   ✅ Brand database: {load_brand_file(os.getenv('BRAND_DB_PATH'))} domains")
+    except (OSError, ValueError) as e:
+        print(f"   ⚠️ Brand database not loaded: {e}")
+
+# Content signals for companies NOT in our known list
+COMPANY_TIER_SIGNALS = {
     # Enterprise Signals
-    enterprise_signals = [
+    "enterprise": [
         "fortune 500", "enterprise", "global", "publicly traded",
         "nasdaq", "nyse", "series d", "series e", "ipo",
         "billion", "10,000+ employees", "worldwide", "multinational"
-    ]
-    
+    ],
     # Growth/Scale-up Signals
-    growth_signals = [
+    "growth": [
         "series a", "series b", "series c", "backed by",
         "funded", "venture", "raised", "million in funding",
         "scaling", "growing team", "100+ employees", "startup"
-    ]
-    
+    ],
     # Local Business Signals
-    local_signals = [
+    "local": [
         "family owned", "locally owned", "serving the", "neighborhood",
         "call us today", "visit our location", "hours:", "appointment",
         "free consultation", "free estimate", "licensed and insured"
-    ]
+    ],
+}
+
+register_signals("tier", COMPANY_TIER_SIGNALS)
+
+
+def detect_company_tier_from_content(text: str) -> str:
+    """
+    Detects company tier (enterprise/growth/local) from content signals.
+    Used when brand is NOT in our known list.
+    """
+    hits = match_signals(text)
     
-    enterprise_count = sum(1 for s in enterprise_signals if s in text_lower)
-    growth_count = sum(1 for s in growth_signals if s in text_lower)
-    local_count = sum(1 for s in local_signals if s in text_lower)
+    enterprise_count = hits.count("tier:enterprise")
+    growth_count = hits.count("tier:growth")
+    local_count = hits.count("tier:local")
     
     if enterprise_count > growth_count and enterprise_count > local_count:
         return "enterprise"
@@ -0,0 +1,83 @@
+# html_fetch.py
+# Size-capped page download for the scraper
+# curl hands the body to a write callback that fills one buffer and aborts the transfer at
+# SCRAPE_MAX_BYTES (nothing past the budget is read or queued), then the buffer is decoded once
+# with the charset from Content-Type, a <meta charset> near the top, or UTF-8.
+
+import os
+import re
+import codecs
+
+SCRAPE_MAX_BYTES = int(os.getenv("SCRAPE_MAX_BYTES", "1000000"))
+META_SNIFF_BYTES = 4096  # browsers look for <meta charset> in the first 1024; be lenient
+
+_HEADER_CHARSET = re.compile(r'charset\s*=\s*["\']?([\w.:-]+)', re.I)
+_META_CHARSET = re.compile(rb'<meta[^>]+charset\s*=\s*["\']?([\w.:-]+)', re.I)
+
+CURL_WRITEFUNC_ERROR = 0xFFFFFFFF  # write-callback return that makes curl abort (curl_cffi.curl)
+
+
+def _known_codec(name) -> str:
+    if not name: return None
+    if isinstance(name, bytes): name = name.decode("ascii", "ignore")
+    try:
+        return codecs.lookup(name).name
+    except LookupError:
+        return None
+
+
+def detect_charset(content_type: str, head: bytes) -> str:
+    """Declared charset (header first, then <meta>), BOM-aware; UTF-8 when nothing usable is declared."""
+    if head.startswith(codecs.BOM_UTF8): return "utf-8-sig"
+    if head.startswith((codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE)): return "utf-16"
+    header = _HEADER_CHARSET.search(content_type or "")
+    charset = _known_codec(header.group(1)) if header else None
+    if charset is None:
+        meta = _META_CHARSET.search(head[:META_SNIFF_BYTES])
+        charset = _known_codec(meta.group(1)) if meta else None
+    return charset or "utf-8"
+
+
+class CappedBody:
+    """curl write callback: keeps the first `max_bytes` of the body, then aborts the transfer."""
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self.buf = bytearray()
+        self.truncated = False
+
+    def write(self, chunk: bytes) -> int:
+        room = self.max_bytes - len(self.buf)
+        if len(chunk) > room:
+            self.buf += chunk[:room]
+            self.truncated = True
+            return CURL_WRITEFUNC_ERROR
+        self.buf += chunk
+        return len(chunk)
+
+
+def decode_html(raw, content_type: str = None) -> str:
+    # "replace" also absorbs a multi-byte character cut in half by the byte budget
+    return raw.decode(detect_charset(content_type, bytes(raw[:META_SNIFF_BYTES])), errors="replace")
+
+
+def fetch_html(get, url: str, max_bytes: int = None, **kwargs) -> dict:
+    """
+    Usage:
+        page = fetch_html(cffi_requests.get, url, impersonate="chrome110", timeout=8)
+        page["status_code"], page["headers"], page["html"], page["bytes"], page["truncated"]
+
+    `get` is a curl_cffi get (function or Session method) accepting content_callback. The
+    transfer is aborted as soon as the budget is reached; the body is only decoded for 200s.
+    """
+    body = CappedBody(max_bytes or SCRAPE_MAX_BYTES)
+    try:
+        resp = get(url, content_callback=body.write, **kwargs)
+    except Exception as e:
+        # Our own abort surfaces as a curl write error that still carries the response
+        resp = getattr(e, "response", None)
+        if not body.truncated or resp is None: raise
+    if resp.status_code != 200:
+        return {"status_code": resp.status_code, "headers": resp.headers, "html": "", "bytes": 0, "truncated": False}
+    return {"status_code": 200, "headers": resp.headers, "html": decode_html(body.buf, resp.headers.get("content-type")),
+            "bytes": len(body.buf), "truncated": body.truncated}
@@ -2,6 +2,8 @@
 # Industry benchmarks, keywords, and revenue messaging
 # Supports 15 industries with Hormozi-style messaging
 
+from keyword_matcher import register_signals, match_signals
+
 # ═══════════════════════════════════════════════════════════════════════════
 # INDUSTRY KEYWORDS FOR DETECTION
 # ═══════════════════════════════════════════════════════════════════════════
@@ -24,6 +26,8 @@ INDUSTRY_KEYWORDS = {
     "Non-Profit": ["donate", "mission", "volunteer", "cause", "charity", "foundation", "support"]
 }
 
+register_signals("industry", INDUSTRY_KEYWORDS)
+
 # ═══════════════════════════════════════════════════════════════════════════
 # INDUSTRY BENCHMARKS
 # ═══════════════════════════════════════════════════════════════════════════
@@ -54,11 +58,11 @@ def validate_industry(ai_suggested_industry: str, text: str) -> str:
     Cross-checks AI's industry guess against content keywords.
     Returns validated or corrected industry.
     """
-    text_lower = text.lower()
+    hits = match_signals(text)
     
     industry_scores = {}
-    for industry, keywords in INDUSTRY_KEYWORDS.items():
-        matches = sum(1 for k in keywords if k in text_lower)
+    for industry in INDUSTRY_KEYWORDS:
+        matches = hits.count(f"industry:{industry}")
         if matches > 0:
             industry_scores[industry] = matches
     
@@ -0,0 +1,32 @@
+# io_executor.py
+# Bounded thread pool for blocking network I/O (Supabase, Groq/Gemini SDKs)
+# Keeps the event loop free so one worker can hold many scans in flight
+
+import os
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+
+_executor = None
+
+
+def get_io_executor() -> ThreadPoolExecutor:
+    """Lazily creates the shared executor (sized by IO_MAX_WORKERS, default 64)."""
+    global _executor
+    if _executor is None:
+        max_workers = int(os.getenv("IO_MAX_WORKERS", "64"))
+        _executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="amplify-io")
+    return _executor
+
+
+async def run_io(func, *args, **kwargs):
+    """Runs a blocking call on the bounded I/O pool and awaits its result."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(get_io_executor(), functools.partial(func, *args, **kwargs))
+
+
+def shutdown_io_executor():
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=False, cancel_futures=True)
+        _executor = None
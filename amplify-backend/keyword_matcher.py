@@ -0,0 +1,124 @@
+# keyword_matcher.py
+# Single-pass multi-pattern matcher for every keyword/signal dictionary
+# Modules register their phrase lists at import; one automaton finds all hits in one scan
+# Uses pyahocorasick when installed, otherwise one precompiled trie regex
+
+import re
+from functools import lru_cache
+
+try:
+    import ahocorasick
+    HAS_AHOCORASICK = True
+except ImportError:
+    HAS_AHOCORASICK = False
+
+# "namespace:category" -> [phrases] (declared order is preserved in results)
+SIGNAL_DICTIONARIES = {}
+
+_matcher = None
+
+
+class KeywordHits:
+    """Every phrase found in one text, readable per category in declared order."""
+
+    def __init__(self, found: set, dictionaries: dict):
+        self.found_phrases = found
+        self._dictionaries = dictionaries
+
+    def found(self, category: str) -> list:
+        return [p for p in self._dictionaries.get(category, ()) if p in self.found_phrases]
+
+    def count(self, category: str) -> int:
+        return sum(1 for p in self._dictionaries.get(category, ()) if p in self.found_phrases)
+
+    def any(self, category: str) -> bool:
+        return any(p in self.found_phrases for p in self._dictionaries.get(category, ()))
+
+
+class KeywordMatcher:
+    """
+    Substring semantics identical to `phrase in text_lower` for every phrase,
+    but the text is scanned once regardless of how many phrases are registered.
+    """
+
+    def __init__(self, dictionaries: dict):
+        self.dictionaries = {k: list(v) for k, v in dictionaries.items()}
+        phrases = sorted({p for v in self.dictionaries.values() for p in v if p})
+
+        if HAS_AHOCORASICK:
+            self._automaton = ahocorasick.Automaton()
+            for phrase in phrases:
+                self._automaton.add_word(phrase, phrase)
+            if phrases: self._automaton.make_automaton()
+            self._regex = None
+        else:
+            self._automaton = None
+            # Longest phrase per start position comes from the regex; shorter phrases
+            # starting at the same position are exactly its registered prefixes.
+            self._prefixes = {p: [q for q in phrases if q != p and p.startswith(q)] for p in phrases}
+            self._regex = re.compile(f"(?=({_trie_pattern(phrases)}))") if phrases else None
+
+    def scan(self, text_lower: str) -> set:
+        found = set()
+        if self._automaton is not None:
+            if len(self._automaton):
+                for _, phrase in self._automaton.iter(text_lower):
+                    found.add(phrase)
+        elif self._regex is not None:
+            for m in self._regex.finditer(text_lower):
+                phrase = m.group(1)
+                if phrase not in found:
+                    found.add(phrase)
+                    found.update(self._prefixes[phrase])
+        return found
+
+    def match(self, text: str) -> KeywordHits:
+        return KeywordHits(self.scan(text.lower()), self.dictionaries)
+
+
+def _trie_pattern(phrases: list) -> str:
+    """Builds a prefix-factored, greedy alternation (longest match at each position)."""
+    trie = {}
+    for phrase in phrases:
+        node = trie
+        for ch in phrase:
+            node = node.setdefault(ch, {})
+        node[""] = True
+
+    def build(node):
+        branches = [re.escape(ch) + build(child) for ch, child in sorted(node.items()) if ch != ""]
+        if not branches: return ""
+        body = branches[0] if len(branches) == 1 else f"(?:{'|'.join(branches)})"
+        return f"(?:{body})?" if "" in node else body
+
+    return build(trie)
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# SHARED REGISTRY
+# ═══════════════════════════════════════════════════════════════════════════
+
+def register_signals(namespace: str, dictionaries: dict):
+    """Adds {category: phrases} under `namespace`; consumers read `namespace:category`."""
+    global _matcher
+    for category, phrases in dictionaries.items():
+        SIGNAL_DICTIONARIES[f"{namespace}:{category}"] = list(phrases)
+    _matcher = None
+    match_signals.cache_clear()
+
+
+def build_signal_matcher() -> KeywordMatcher:
+    """Compiles the shared matcher from everything registered so far (idempotent)."""
+    global _matcher
+    if _matcher is None:
+        _matcher = KeywordMatcher(SIGNAL_DICTIONARIES)
+    return _matcher
+
+
+@lru_cache(maxsize=128)
+def match_signals(text: str) -> KeywordHits:
+    """
+    All registered hits for `text` in one pass. Memoized so the scorers, persona,
+    industry and tier detection share a single scan of the same scraped text.
+    """
+    return build_signal_matcher().match(text)
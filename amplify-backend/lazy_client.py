@@ -0,0 +1,43 @@
+# lazy_client.py
+# Defers importing and constructing heavy SDK clients (supabase, groq, google-genai) until
+# the first attribute access, so the API process can answer requests before they are loaded.
+
+import threading
+
+
+class LazyClient:
+    """
+    Usage:
+        supabase = LazyClient(lambda: create_client(url, key), name="supabase")
+        supabase.table("leads")      # first access imports + builds the client (once, thread-safe)
+        supabase.load()              # or build it eagerly
+
+    Always truthy, so existing `if not client:` checks keep meaning "not configured".
+    A factory error is raised to the caller and retried on the next access.
+    """
+
+    def __init__(self, factory, name: str = "client"):
+        self._factory = factory
+        self._name = name
+        self._client = None
+        self._lock = threading.Lock()
+
+    def load(self):
+        client = self._client
+        if client is None:
+            with self._lock:
+                client = self._client
+                if client is None:
+                    client = self._client = self._factory()
+                    print(f"   ✅ {self._name} client loaded")
+        return client
+
+    @property
+    def loaded(self) -> bool:
+        return self._client is not None
+
+    def __getattr__(self, attr):
+        return getattr(self.load(), attr)
+
+    def __repr__(self) -> str:
+        return f"<LazyClient {self._name} ({'loaded' if self.loaded else 'not loaded'})>"
@@ -0,0 +1,180 @@
+# llm_cache.py
+# Persistent, content-addressed cache for LLM responses (SQLite, shared by all workers on a host)
+# Key = sha256(model | temperature | prompt with whitespace collapsed), value = JSON. Callers pass
+# the model and temperature actually sent; None means no temperature was sent (provider default).
+# Entries expire after a TTL; once the stored bytes pass a cap the least recently used go first.
+
+import os
+import json
+import time
+import sqlite3
+import hashlib
+import threading
+
+from scan_recorder import get_scan_recorder
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS llm_cache (
+    key TEXT PRIMARY KEY,
+    model TEXT NOT NULL,
+    value TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    expires_at REAL NOT NULL,
+    last_used REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS llm_cache_last_used ON llm_cache (last_used);
+"""
+
+
+def normalize_prompt(prompt: str) -> str:
+    """Collapses whitespace so re-indented f-string prompts map to the same key."""
+    return " ".join(prompt.split())
+
+
+def temperature_key(temperature) -> str:
+    return "default" if temperature is None else f"{float(temperature):.3f}"
+
+
+def cache_key(model: str, temperature: float, prompt: str) -> str:
+    raw = f"{model}|{temperature_key(temperature)}|{normalize_prompt(prompt)}"
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+class LLMCache:
+    """
+    Usage:
+        cache = LLMCache("llm_cache.sqlite3", ttl=7 * 86400, max_bytes=64_000_000)
+        data = cache.get(model, temperature, prompt)       # None on miss/expiry
+        cache.set(model, temperature, prompt, data)        # any JSON-serializable value
+
+    Expired rows are deleted on read and by the eviction pass, which runs every
+    `evict_every` writes and trims least recently used rows down to `max_bytes`.
+    """
+
+    def __init__(self, path: str, ttl: float = 7 * 86400, max_bytes: int = 64_000_000, evict_every: int = 100):
+        self.path = path
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.evict_every = evict_every
+        if path != ":memory:" and os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None, timeout=5)
+        if path != ":memory:":
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        self._lock = threading.Lock()
+        self._writes = 0
+        self.hits = 0
+        self.misses = 0
+        self.errors = 0
+        self.evictions = 0
+
+    def get(self, model: str, temperature: float, prompt: str):
+        key = cache_key(model, temperature, prompt)
+        now = time.time()
+        try:
+            with self._lock:
+                row = self._conn.execute("SELECT value, expires_at FROM llm_cache WHERE key = ?", (key,)).fetchone()
+                if row is not None and row[1] <= now:
+                    self._conn.execute("DELETE FROM llm_cache WHERE key = ?", (key,))
+                    row = None
+                if row is None:
+                    self.misses += 1
+                    return None
+                self._conn.execute("UPDATE llm_cache SET last_used = ? WHERE key = ?", (now, key))
+                self.hits += 1
+            return json.loads(row[0])
+        except (sqlite3.Error, ValueError) as e:
+            self.errors += 1
+            print(f"   ⚠️ LLM cache read error: {e}")
+            return None
+
+    def set(self, model: str, temperature: float, prompt: str, value, ttl: float = None):
+        key = cache_key(model, temperature, prompt)
+        now = time.time()
+        try:
+            blob = json.dumps(value)
+            with self._lock:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO llm_cache (key, model, value, size, expires_at, last_used) VALUES (?, ?, ?, ?, ?, ?)",
+                    (key, model, blob, len(blob), now + (self.ttl if ttl is None else ttl), now))
+                self._writes += 1
+                if self._writes % self.evict_every == 0: self._evict(now)
+        except (sqlite3.Error, TypeError, ValueError) as e:
+            self.errors += 1
+            print(f"   ⚠️ LLM cache write error: {e}")
+
+    def evict(self) -> int:
+        with self._lock:
+            return self._evict(time.time())
+
+    def _evict(self, now: float) -> int:
+        removed = self._conn.execute("DELETE FROM llm_cache WHERE expires_at <= ?", (now,)).rowcount
+        total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM llm_cache").fetchone()[0]
+        if total > self.max_bytes:
+            excess = total - self.max_bytes
+            freed = 0
+            doomed = []
+            for key, size in self._conn.execute("SELECT key, size FROM llm_cache ORDER BY last_used"):
+                if freed >= excess: break
+                doomed.append((key,))
+                freed += size
+            self._conn.executemany("DELETE FROM llm_cache WHERE key = ?", doomed)
+            removed += len(doomed)
+        self.evictions += removed
+        return removed
+
+    def clear(self):
+        with self._lock:
+            self._conn.execute("DELETE FROM llm_cache")
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    @property
+    def stats(self) -> dict:
+        with self._lock:
+            entries, size = self._conn.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM llm_cache").fetchone()
+        lookups = self.hits + self.misses
+        return {
+            "entries": entries, "bytes": size, "max_bytes": self.max_bytes,
+            "hits": self.hits, "misses": self.misses, "errors": self.errors, "evictions": self.evictions,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+        }
+
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_llm_cache():
+    """
+    Shared cache at LLM_CACHE_PATH (default .cache/llm_cache.sqlite3), or None when
+    LLM_CACHE_PATH is "off". TTL and size cap from LLM_CACHE_TTL / LLM_CACHE_MAX_BYTES.
+    """
+    global _cache
+    path = os.getenv("LLM_CACHE_PATH", os.path.join(".cache", "llm_cache.sqlite3"))
+    if path.lower() == "off": return None
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = LLMCache(path, ttl=float(os.getenv("LLM_CACHE_TTL", str(7 * 86400))),
+                                  max_bytes=int(os.getenv("LLM_CACHE_MAX_BYTES", "64000000")))
+    return _cache
+
+
+def cached_llm_call(model: str, temperature: float, prompt: str, call, cacheable=lambda value: value is not None):
+    """Returns the cached value for this prompt, else `call()` (stored when `cacheable(value)`)."""
+    recorder = get_scan_recorder()
+    if recorder.active:  # only upstream calls (cache misses) are recorded / replayed
+        upstream = call
+        call = lambda: recorder.llm(model, temperature, prompt, upstream)
+    cache = get_llm_cache()
+    if cache is None: return call()
+    value = cache.get(model, temperature, prompt)
+    if value is not None: return value
+    value = call()
+    if cacheable(value): cache.set(model, temperature, prompt, value)
+    return value
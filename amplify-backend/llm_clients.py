@@ -0,0 +1,38 @@
+# llm_clients.py
+# Long-lived LLM SDK clients shared by scan judgments and persona copy
+# Each client (and its HTTP connection pool) is created once per process on first use.
+
+import os
+import threading
+from dotenv import load_dotenv
+
+load_dotenv()
+GROQ_API_KEY = os.getenv("GROQ_API_KEY")
+GEMINI_API_KEY = os.getenv("GOOGLE_API_KEY")
+
+_lock = threading.Lock()
+_clients = {}
+
+
+def _get(name: str, factory):
+    client = _clients.get(name)
+    if client is None:
+        with _lock:
+            client = _clients.get(name)
+            if client is None:
+                client = _clients[name] = factory()
+    return client
+
+
+def get_groq_client():
+    """Shared Groq client, or None without GROQ_API_KEY."""
+    if not GROQ_API_KEY: return None
+    from groq import Groq
+    return _get("groq", lambda: Groq(api_key=GROQ_API_KEY))
+
+
+def get_gemini_client():
+    """Shared google-genai client, or None without GOOGLE_API_KEY."""
+    if not GEMINI_API_KEY: return None
+    from google import genai
+    return _get("gemini", lambda: genai.Client(api_key=GEMINI_API_KEY))
@@ -0,0 +1,151 @@
+# llm_hedge.py
+# Hedged LLM calls: start the primary provider, and if it has not answered after its
+# recent p90 latency, also start the next provider. The first valid result wins.
+# Per-provider latency windows drive the hedge delay, so a slow primary is hedged sooner.
+
+import os
+import time
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+
+class LatencyWindow:
+    """Latencies (seconds) of the last `size` successful calls, plus success/failure counts."""
+
+    def __init__(self, size: int = 256):
+        self._samples = deque(maxlen=size)
+        self._lock = threading.Lock()
+        self.successes = 0
+        self.failures = 0
+
+    def record(self, seconds: float):
+        with self._lock:
+            self._samples.append(seconds)
+            self.successes += 1
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+
+    def quantile(self, q: float):
+        """None until at least 20 samples are in."""
+        with self._lock:
+            if len(self._samples) < 20: return None
+            ordered = sorted(self._samples)
+        return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+    def summary(self) -> dict:
+        p50, p90, p99 = (self.quantile(q) for q in (0.5, 0.9, 0.99))
+        ms = lambda v: None if v is None else round(v * 1000, 1)
+        return {"n": len(self._samples), "successes": self.successes, "failures": self.failures,
+                "p50_ms": ms(p50), "p90_ms": ms(p90), "p99_ms": ms(p99)}
+
+
+class HedgedCaller:
+    """
+    Usage:
+        hedge = HedgedCaller()
+        name, data = hedge.call([("groq", call_groq), ("gemini", call_gemini)], timeout=10)
+
+    Each provider function takes no arguments and returns parsed JSON (raising on failure).
+    Providers are tried in order; provider i+1 starts when provider i fails or when it has
+    run longer than its LLM_HEDGE_QUANTILE (default 0.9) latency, clamped to
+    [LLM_HEDGE_MIN_MS, LLM_HEDGE_MAX_MS] (default 150 / 4000 ms; LLM_HEDGE_DELAY_MS,
+    default 2000 ms, before 20 samples exist). LLM_HEDGE_MODE=sequential only moves on
+    after a failure (the old fallback). The losing call cannot be interrupted inside the
+    SDK; it is abandoned and its latency still recorded. Returns (None, None) when all fail.
+    """
+
+    def __init__(self, mode: str = None, quantile: float = None, initial_delay: float = None,
+                 min_delay: float = None, max_delay: float = None, max_workers: int = None):
+        self.mode = mode or os.getenv("LLM_HEDGE_MODE", "hedged")
+        self.quantile = quantile or float(os.getenv("LLM_HEDGE_QUANTILE", "0.9"))
+        self.initial_delay = initial_delay if initial_delay is not None else int(os.getenv("LLM_HEDGE_DELAY_MS", "2000")) / 1000
+        self.min_delay = min_delay if min_delay is not None else int(os.getenv("LLM_HEDGE_MIN_MS", "150")) / 1000
+        self.max_delay = max_delay if max_delay is not None else int(os.getenv("LLM_HEDGE_MAX_MS", "4000")) / 1000
+        # Own pool: callers already run on the shared I/O executor and must not wait on it
+        self._executor = ThreadPoolExecutor(max_workers=max_workers or int(os.getenv("LLM_HEDGE_WORKERS", "32")),
+                                            thread_name_prefix="amplify-llm")
+        self.latency = {}
+        self.counters = {"calls": 0, "hedged": 0, "fallbacks": 0, "all_failed": 0}
+        self.wins = {}  # provider name -> calls it answered first
+        self._lock = threading.Lock()  # call() runs on many threads at once
+
+    def _count(self, key: str):
+        with self._lock:
+            self.counters[key] += 1
+
+    def _win(self, name: str):
+        with self._lock:
+            self.wins[name] = self.wins.get(name, 0) + 1
+
+    def window(self, name: str) -> LatencyWindow:
+        window = self.latency.get(name)
+        if window is None: window = self.latency.setdefault(name, LatencyWindow())
+        return window
+
+    def hedge_delay(self, name: str) -> float:
+        observed = self.window(name).quantile(self.quantile)
+        if observed is None: return self.initial_delay
+        return min(self.max_delay, max(self.min_delay, observed))
+
+    def _timed(self, name: str, fn):
+        window = self.window(name)
+        t0 = time.monotonic()
+        try:
+            result = fn()
+        except Exception:
+            window.record_failure()
+            raise
+        window.record(time.monotonic() - t0)
+        return result
+
+    def call(self, providers: list, timeout: float = 10):
+        self._count("calls")
+        deadline = time.monotonic() + timeout
+        pending = {}  # future -> provider name
+        launched = []  # (started_at, name)
+
+        def launch():
+            name, fn = providers[len(launched)]
+            pending[self._executor.submit(self._timed, name, fn)] = name
+            launched.append((time.monotonic(), name))
+
+        launch()
+        while pending:
+            now = time.monotonic()
+            if now >= deadline: break
+            hedge_at = None
+            if self.mode != "sequential" and len(launched) < len(providers):
+                started_at, name = launched[-1]
+                hedge_at = started_at + self.hedge_delay(name)
+            wait_for = deadline - now if hedge_at is None else min(deadline - now, max(0.0, hedge_at - now))
+            done, _ = wait(list(pending), timeout=wait_for, return_when=FIRST_COMPLETED)
+            for future in done:
+                name = pending.pop(future)
+                if future.exception() is None:
+                    for loser in pending: loser.cancel()
+                    self._win(name)
+                    return name, future.result()
+            if len(launched) < len(providers):
+                if not pending:
+                    self._count("fallbacks")
+                    launch()
+                elif hedge_at is not None and time.monotonic() >= hedge_at:
+                    self._count("hedged")
+                    launch()
+        for loser in pending: loser.cancel()
+        self._count("all_failed")
+        return None, None
+
+    @property
+    def stats(self) -> dict:
+        with self._lock:
+            counters, wins = dict(self.counters), dict(self.wins)
+        return {"mode": self.mode, **counters, "wins": wins,
+                "hedge_delay_ms": {name: round(self.hedge_delay(name) * 1000, 1) for name in self.latency},
+                "latency": {name: w.summary() for name, w in self.latency.items()}}
+
+    def shutdown(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
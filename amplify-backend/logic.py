@@ -1,45 +1,61 @@
-import requests
 from bs4 import BeautifulSoup
-from groq import Groq
-import re
-from textblob import TextBlob
 from difflib import SequenceMatcher
 import json
+import time
 import datetime
 import concurrent.futures
+from text_analysis import analyze_text
+from llm_cache import cached_llm_call, temperature_key
+from scraper_client import get_scraper_client
 
 # --- 1. AI ENGINE ROOM (Single & Dual) ---
+# Cache keys are built from these, the model and temperature each request actually sends
+GROQ_MODEL = "llama-3.3-70b-versatile"
+GROQ_TEMPERATURE = 0.1
+GEMINI_MODEL = "gemini-2.0-flash-exp"
+GEMINI_TEMPERATURE = None  # not sent: Gemini's default
 
 def ask_single_ai(prompt, groq_client):
     """
     Use only Groq for subjective/creative tasks to save tokens & time.
     Includes Error Logging (Enhancement #1).
+    Answers are cached by prompt (llm_cache); "ERROR" is never cached.
     """
-    try:
-        return groq_client.chat.completions.create(
-            messages=[{"role": "user", "content": prompt}],
-            model="llama-3.3-70b-versatile",
-            temperature=0.1,
-            timeout=6
-        ).choices[0].message.content.strip()
-    except Exception as e:
-        print(f"⚠️ Groq Single-AI failed: {str(e)[:100]}")
-        return "ERROR"
+    def ask():
+        try:
+            return groq_client.chat.completions.create(
+                messages=[{"role": "user", "content": prompt}],
+                model=GROQ_MODEL,
+                temperature=GROQ_TEMPERATURE,
+                timeout=6
+            ).choices[0].message.content.strip()
+        except Exception as e:
+            print(f"⚠️ Groq Single-AI failed: {str(e)[:100]}")
+            return "ERROR"
+    return cached_llm_call(f"groq:{GROQ_MODEL}", GROQ_TEMPERATURE, prompt, ask, cacheable=lambda r: r != "ERROR")
 
 def ask_dual_intelligence(prompt, groq_client, gemini_client):
     """
     Fires Groq and Gemini simultaneously for Identity Verification.
     Returns a list of successful responses.
     ✅ UPDATED TO NEW GEMINI API
+    Cached by prompt (llm_cache) only when both models answered.
     """
+    # Two requests with their own temperatures: both go into the model part of the key
+    model = f"dual:groq:{GROQ_MODEL}@{temperature_key(GROQ_TEMPERATURE)}+gemini:{GEMINI_MODEL}@{temperature_key(GEMINI_TEMPERATURE)}"
+    return cached_llm_call(model, None, prompt,
+                           lambda: _ask_both(prompt, groq_client, gemini_client),
+                           cacheable=lambda r: len(r) == 2)
+
+def _ask_both(prompt, groq_client, gemini_client):
     responses = []
     
     def call_groq():
         try:
             return groq_client.chat.completions.create(
                 messages=[{"role": "user", "content": prompt}],
-                model="llama-3.3-70b-versatile",
-                temperature=0.1,
+                model=GROQ_MODEL,
+                temperature=GROQ_TEMPERATURE,
                 timeout=6
             ).choices[0].message.content.strip()
         except Exception as e:
@@ -49,10 +65,8 @@ def ask_dual_intelligence(prompt, groq_client, gemini_client):
     def call_gemini():
         """✅ NEW GEMINI API"""
         try:
-            from google.genai import types
-            
             response = gemini_client.models.generate_content(
-                model='gemini-2.0-flash-exp',
+                model=GEMINI_MODEL,
                 contents=prompt
             )
             return response.text.strip()
@@ -187,22 +201,22 @@ def check_conversion_barriers(text, groq_client, gemini_client, industry):
 def check_tech_seo(url):
     try:
         if not url.startswith("http"): url = "https://" + url
-        headers = {"User-Agent": "Mozilla/5.0"}
-        response = requests.get(url, timeout=5, headers=headers)
+        started = time.perf_counter()
+        page = get_scraper_client().fetch(url)
+        elapsed = time.perf_counter() - started
         
-        if response.status_code != 200: 
-            return 0, [f"CRITICAL: Site unreachable ({response.status_code})."], None, 0
+        if page["status_code"] != 200: 
+            return 0, [f"CRITICAL: Site unreachable ({page['status_code']})."], None, 0
             
-        text = get_clean_text(response.text)
-        blob = TextBlob(text)
+        text = get_clean_text(page["html"])
         
         # Info Density
-        meaningful = [w for w, tag in blob.tags if tag.startswith('NN') or tag.startswith('VB')]
+        meaningful_count = analyze_text(text)['meaningful_count']
         total = len(text.split()) or 1
-        density = int((len(meaningful) / total) * 100 * 2.5)
+        density = int((meaningful_count / total) * 100 * 2.5)
         
         # Tech Debt (Bloat Penalty)
-        bloat_ratio = len(response.content) / max(1, len(text))
+        bloat_ratio = page["bytes"] / max(1, len(text))
         
         score = 0
         details = []
@@ -221,7 +235,7 @@ def check_tech_seo(url):
         else:
             score += 5
             
-        return max(0, score), details, response.content, response.elapsed.total_seconds()
+        return max(0, score), details, page["html"], elapsed
     except Exception as e:
         return 0, [f"Connection Failed: {str(e)}"], None, 0
 
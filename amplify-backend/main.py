@@ -4,32 +4,99 @@
 # FIXED: Added 'impact_metric' to default fixes to match Frontend expectations.
 
 import json
-import re
 import os
 import time
-import hashlib
+import asyncio
 import threading
+from contextlib import asynccontextmanager
 from datetime import datetime, timedelta, timezone
 from fastapi import FastAPI, Request, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import StreamingResponse, Response
 from pydantic import BaseModel
-import uvicorn
-from curl_cffi import requests as cffi_requests
-from bs4 import BeautifulSoup
-from groq import Groq
 from dotenv import load_dotenv
-from supabase import create_client, Client
-from playwright.async_api import async_playwright
 
 # Import our modules
-from scoring_engine import calculate_math_score
+from page_document import PageDocument
 from famous_brands import get_brand_tier, detect_company_tier_from_content
 from industry_config import validate_industry, get_industry_benchmark, calculate_revenue_message, calculate_archetype
 from persona_engine import get_persona_context, generate_url_hash, generate_persona_copy_sync
+from io_executor import run_io, shutdown_io_executor
+from keyword_matcher import build_signal_matcher
+from browser_pool import browser_pool
+from single_flight import SingleFlight
+from ttl_cache import TTLCache
+from rate_limiter import RateLimiter, create_backend
+from llm_clients import get_groq_client, get_gemini_client
+from persona_jobs import PersonaJobQueue
+from llm_hedge import HedgedCaller
+from llm_cache import cached_llm_call, get_llm_cache
+from batch_jobs import BatchJob, HostLimiter, JudgmentGrouper, BATCH_MAX_URLS, build_group_prompt, split_group_answer
+from score_pool import score_page, start_score_pool, shutdown_score_pool
+from write_behind import WriteBehindBuffer
+from revalidation import get_page_versions, content_fingerprint, conditional_headers
+from html_fetch import SCRAPE_MAX_BYTES
+from scraper_client import get_scraper_client, close_scraper_client
+from lazy_client import LazyClient
+from scan_recorder import get_scan_recorder
+from metrics import REGISTRY, CONTENT_TYPE, counter, gauge, histogram
 
 # --- LOAD CONFIG ---
 load_dotenv()
-app = FastAPI()
+
+# STARTUP_MODE=lazy (default): serve as soon as the app is up. SDK clients import on first use,
+# Chromium launches on the first fallback scrape, score-pool children warm in the background.
+# STARTUP_MODE=eager: load clients, launch the browser and warm the pool before serving.
+STARTUP_MODE = os.getenv("STARTUP_MODE", "lazy").lower()
+
+async def warm_score_pool():
+    try:
+        await start_score_pool()
+    except Exception as e:
+        print(f"   ⚠️ Score pool warm-up failed, children start on first scan: {e}")
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Side-effectful setup lives here, not at import: spawned score-pool children re-import
+    # this module when it runs as __main__ (`python main.py`)
+    global supabase
+    await run_io(build_signal_matcher)  # every signal dictionary is registered by the imports above
+    rate_limiter.backend = await run_io(create_backend)
+    await run_io(get_page_versions)
+    supabase = get_scan_recorder().wrap_db(supabase)
+    warmup = None
+    if STARTUP_MODE == "eager":
+        for client in (groq_client, gemini_client, supabase):
+            if client is None: continue
+            try: await run_io(client.load)
+            except Exception as e: print(f"   ⚠️ Init Error: {e}")
+        try:
+            await browser_pool.start()
+            print("   ✅ Browser pool ready (Playwright fallback)")
+        except Exception as e:
+            print(f"   ⚠️ Browser pool start failed, will retry on first fallback: {e}")
+        await warm_score_pool()
+    else:
+        warmup = asyncio.create_task(warm_score_pool())
+    scraper = get_scraper_client()
+    print(f"   ✅ Scraper client ready ({scraper.max_sessions} pooled sessions, {scraper.per_host}/host)")
+    sweeper = asyncio.create_task(rate_limiter.run_sweeper())
+    log_flusher = asyncio.create_task(scan_log_buffer.run())
+    persona_jobs.start()
+    yield
+    if warmup: warmup.cancel()
+    sweeper.cancel()
+    await scan_log_buffer.close()  # the flusher finishes its in-flight batch and exits first
+    log_flusher.cancel()
+    for task in list(batch_tasks): task.cancel()
+    persona_jobs.stop()
+    llm_hedge.shutdown()
+    await browser_pool.stop()
+    close_scraper_client()
+    shutdown_score_pool()
+    shutdown_io_executor()
+
+app = FastAPI(lifespan=lifespan)
 
 # --- KEYS ---
 GROQ_API_KEY = os.getenv("GROQ_API_KEY")
@@ -38,24 +105,17 @@ SUPABASE_URL = os.getenv("NEXT_PUBLIC_SUPABASE_URL")
 SUPABASE_KEY = os.getenv("NEXT_PUBLIC_SUPABASE_ANON_KEY")
 
 # --- INITIALIZE CLIENTS ---
-groq_client = None
-gemini_client = None 
-supabase: Client = None
-
-try:
-    if GROQ_API_KEY:
-        groq_client = Groq(api_key=GROQ_API_KEY)
-        print("   ✅ Groq AI Client Connected (Primary)")
-    if GEMINI_API_KEY:
-        from google import genai
-        from google.genai import types
-        gemini_client = genai.Client(api_key=GEMINI_API_KEY)
-        print("   ✅ Gemini AI Client Connected (Backup)")
-    if SUPABASE_URL and SUPABASE_KEY:
-        supabase = create_client(SUPABASE_URL, SUPABASE_KEY)
-        print("   ✅ Connected to Supabase Database")
-except Exception as e:
-    print(f"   ⚠️ Init Error: {e}")
+# Configured clients are LazyClient proxies: the SDK is imported and the client built on first use
+def create_supabase_client():
+    from supabase import create_client
+    return create_client(SUPABASE_URL, SUPABASE_KEY)
+
+groq_client = LazyClient(get_groq_client, name="Groq AI (primary)") if GROQ_API_KEY else None
+gemini_client = LazyClient(get_gemini_client, name="Gemini AI (backup)") if GEMINI_API_KEY else None
+supabase = LazyClient(create_supabase_client, name="Supabase") if SUPABASE_URL and SUPABASE_KEY else None
+
+# SCAN_RECORDER=record|replay: page fetches, LLM calls and Supabase requests go through the
+# recorder (see scan_recorder.py); the lifespan wraps `supabase`, on replay with an archive-backed stand-in
 
 # --- CORS ---
 app.add_middleware(
@@ -67,23 +127,41 @@ app.add_middleware(
 )
 
 # --- RATE LIMITER ---
-request_history = {}
 LIMIT_COUNT = 5
 LIMIT_WINDOW = 3600
 WHITELISTED_IPS = ["127.0.0.1", "::1"]
+rate_limiter = RateLimiter(LIMIT_COUNT, LIMIT_WINDOW)  # the lifespan swaps in the Redis backend when configured
 
-def check_rate_limit(ip_address: str):
+async def check_rate_limit(ip_address: str):
     if ip_address in WHITELISTED_IPS: return True
-    current_time = time.time()
-    history = request_history.get(ip_address, [])
-    clean_history = [t for t in history if (current_time - t) < LIMIT_WINDOW]
-    if len(clean_history) >= LIMIT_COUNT:
+    allowed = await run_io(rate_limiter.allow, ip_address) if rate_limiter.blocking else rate_limiter.allow(ip_address)
+    if not allowed:
         print(f"   ⛔ Rate Limit: {ip_address}")
         return False
-    clean_history.append(current_time)
-    request_history[ip_address] = clean_history
     return True
 
+# --- METRICS (GET /metrics, Prometheus text format) ---
+stage_seconds = histogram("amplify_scan_stage_seconds", "Duration of each scan pipeline stage.", ("stage",))
+scan_seconds = histogram("amplify_scan_seconds", "End-to-end scan duration by outcome path.", ("path",))
+llm_call_seconds = histogram("amplify_llm_call_seconds", "LLM provider call duration.", ("provider", "outcome"))
+db_write_seconds = histogram("amplify_db_write_seconds", "Supabase write duration.", ("op", "outcome"))
+cache_lookups = counter("amplify_cache_lookups_total", "Scan result cache lookups by tier.", ("tier", "result"))
+scrapes = counter("amplify_scrapes_total", "Scrape results by method and status.", ("method", "status"))
+scrape_fallbacks = counter("amplify_scrape_fallbacks_total", "curl-cffi fetches that fell back to Playwright.", ("reason",))
+scans_in_flight = gauge("amplify_scans_in_flight", "Scans currently running.")
+gauge("amplify_persona_jobs", "Background persona jobs by state.", ("state",),
+      fn=lambda: {("queued",): persona_jobs.stats["queue_depth"], ("running",): persona_jobs.stats["running"]})
+
+def timed_llm_call(provider: str, fn, *args):
+    t0 = time.perf_counter()
+    outcome = "error"
+    try:
+        result = fn(*args)
+        outcome = "ok"
+        return result
+    finally:
+        llm_call_seconds.observe(time.perf_counter() - t0, provider=provider, outcome=outcome)
+
 # --- CONSTANTS ---
 # Default fixes for Titans (Now with impact_metric to match Frontend)
 TITAN_DEFAULT_FIXES = [
@@ -93,21 +171,18 @@ TITAN_DEFAULT_FIXES = [
 ]
 
 # --- CACHE ---
-persona_cache = {}
 PERSONA_CACHE_TTL = 300
+PERSONA_PENDING_TTL = 120  # "processing"/"error" placeholders expire even if the generating thread dies
+persona_cache = TTLCache(maxsize=1000, ttl=PERSONA_CACHE_TTL, max_bytes=int(os.getenv("PERSONA_CACHE_MAX_BYTES", "8000000")))
 
 def get_cached_persona(url_hash: str):
-    if url_hash in persona_cache:
-        entry = persona_cache[url_hash]
-        if time.time() - entry["created_at"] < PERSONA_CACHE_TTL:
-            return entry
-    return None
+    return persona_cache.get(url_hash)
 
 def set_cached_persona(url_hash: str, data: dict):
-    if len(persona_cache) >= 1000:
-        oldest = sorted(persona_cache.keys(), key=lambda k: persona_cache[k]["created_at"])[:100]
-        for k in oldest: del persona_cache[k]
-    persona_cache[url_hash] = {**data, "created_at": time.time(), "status": "ready"}
+    persona_cache.set(url_hash, {**data, "created_at": time.time(), "status": "ready"})
+
+def set_persona_placeholder(url_hash: str, status: str):
+    persona_cache.set(url_hash, {"status": status, "created_at": time.time()}, ttl=PERSONA_PENDING_TTL)
 
 # --- MODELS ---
 class URLRequest(BaseModel):
@@ -119,6 +194,10 @@ class LeadCaptureRequest(BaseModel):
     full_name: str
     company_name: str
 
+class BatchRequest(BaseModel):
+    urls: list[str]
+    email: str = "guest_user@amplify.ai"
+
 class PersonaCopyRequest(BaseModel):
     url: str
     score: int
@@ -130,43 +209,95 @@ class PersonaCopyRequest(BaseModel):
     text: str = ""
 
 # --- AI HELPERS ---
+# Groq first; Gemini is started once Groq runs past its recent p90 (or fails), first valid JSON wins
+# Judgments are cached on disk by (models, temperature, prompt): an unchanged page skips the call
+llm_hedge = HedgedCaller()
+JUDGMENT_MODELS = {"groq": "llama-3.3-70b-versatile", "gemini": "gemini-2.0-flash-exp"}
+JUDGMENT_TEMPERATURE = 0.1  # sent to both providers, and part of the cache key
+
+def _ask_groq(prompt: str, timeout_seconds: int) -> dict:
+    completion = groq_client.chat.completions.create(
+        messages=[{"role": "user", "content": prompt}],
+        model=JUDGMENT_MODELS["groq"],
+        temperature=JUDGMENT_TEMPERATURE,
+        timeout=timeout_seconds,
+        response_format={"type": "json_object"}
+    )
+    return json.loads(completion.choices[0].message.content)
+
+def _ask_gemini(prompt: str) -> dict:
+    from google.genai import types
+    response = gemini_client.models.generate_content(
+        model=JUDGMENT_MODELS["gemini"],
+        contents=prompt,
+        config=types.GenerateContentConfig(temperature=JUDGMENT_TEMPERATURE, response_mime_type="application/json")
+    )
+    return json.loads(response.text)
+
 def call_ai_with_fallback(prompt: str, timeout_seconds: int = 10) -> dict:
-    if groq_client:
-        try:
-            completion = groq_client.chat.completions.create(
-                messages=[{"role": "user", "content": prompt}],
-                model="llama-3.3-70b-versatile",
-                temperature=0.1,
-                timeout=timeout_seconds,
-                response_format={"type": "json_object"}
-            )
-            return {"status": "success", "source": "groq", "data": json.loads(completion.choices[0].message.content)}
-        except Exception: pass
-    if gemini_client:
-        try:
-            response = gemini_client.models.generate_content(
-                model='gemini-2.0-flash-exp',
-                contents=prompt,
-                config=types.GenerateContentConfig(temperature=0.1, response_mime_type="application/json")
-            )
-            return {"status": "success", "source": "gemini", "data": json.loads(response.text)}
-        except Exception: pass
+    providers = []
+    if groq_client: providers.append(("groq", lambda: timed_llm_call("groq", _ask_groq, prompt, timeout_seconds)))
+    if gemini_client: providers.append(("gemini", lambda: timed_llm_call("gemini", _ask_gemini, prompt)))
+    if providers:
+        def ask():
+            source, data = llm_hedge.call(providers, timeout=timeout_seconds + 5)
+            return {"source": source, "data": data} if source else None
+        models = ",".join(f"{name}:{JUDGMENT_MODELS[name]}" for name, _ in providers)
+        answer = cached_llm_call(models, JUDGMENT_TEMPERATURE, prompt, ask)
+        if answer: return {"status": "success", "source": answer["source"], "data": answer["data"]}
     return {"status": "fallback", "source": "hardcoded", "data": None}
 
 # --- ASYNC PERSONA GENERATION ---
+# Fixed worker pool; rescans of a page still queued share its job, and only the newest result is cached
+# Streams waiting on a persona: url_hash -> [(loop, future)], resolved from the worker threads
+persona_waiters = {}
+persona_waiters_lock = threading.Lock()
+
+def _wake_persona_waiters(url_hash: str):
+    with persona_waiters_lock:
+        waiters = persona_waiters.pop(url_hash, [])
+    for loop, future in waiters:
+        loop.call_soon_threadsafe(lambda f=future: f.done() or f.set_result(None))
+
+def _persona_ready(url_hash: str, result: dict):
+    set_cached_persona(url_hash, result)
+    print(f"   🎭 Persona generated async for {url_hash}")
+    _wake_persona_waiters(url_hash)
+
+def _persona_failed(url_hash: str, error: Exception):
+    print(f"   ⚠️ Async persona failed: {error}")
+    set_persona_placeholder(url_hash, "error")
+    _wake_persona_waiters(url_hash)
+
+async def wait_for_persona(url_hash: str, timeout: float = PERSONA_PENDING_TTL):
+    """Cached persona entry once it is no longer "processing" (or None on timeout / nothing pending)."""
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
+    with persona_waiters_lock:
+        persona_waiters.setdefault(url_hash, []).append((loop, future))
+    try:
+        cached = get_cached_persona(url_hash)
+        if cached is None or cached.get("status") != "processing": return cached
+        try: await asyncio.wait_for(future, timeout)
+        except asyncio.TimeoutError: return None
+        return get_cached_persona(url_hash)
+    finally:
+        with persona_waiters_lock:
+            waiters = persona_waiters.get(url_hash)
+            if waiters and (loop, future) in waiters:
+                waiters.remove((loop, future))
+                if not waiters: del persona_waiters[url_hash]
+
+persona_jobs = PersonaJobQueue(work=generate_persona_copy_sync, on_result=_persona_ready, on_error=_persona_failed)
+
 def fire_persona_generation_async(url: str, context: dict):
     url_hash = generate_url_hash(url)
-    persona_cache[url_hash] = {"status": "processing", "created_at": time.time()}
-    def background_task():
-        try:
-            result = generate_persona_copy_sync(context)
-            set_cached_persona(url_hash, result)
-            print(f"   🎭 Persona generated async for {url_hash}")
-        except Exception as e:
-            print(f"   ⚠️ Async persona failed: {e}")
-            persona_cache[url_hash] = {"status": "error", "created_at": time.time()}
-    thread = threading.Thread(target=background_task)
-    thread.start()
+    set_persona_placeholder(url_hash, "processing")
+    status = persona_jobs.submit(url_hash, context)
+    if status == "rejected":
+        print(f"   ⚠️ Persona queue full, skipping {url_hash}")
+        set_persona_placeholder(url_hash, "error")
+    return status
 
 # --- DATABASE HELPERS ---
 def get_score_value(value) -> int:
@@ -174,89 +305,170 @@ def get_score_value(value) -> int:
     elif isinstance(value, (int, float)): return int(value)
     return 0
 
-def save_analysis_to_db(email, website, data):
+def record_lead(email):
     if not supabase: return
     try:
         supabase.table("leads").upsert({"email": email, "last_scan_at": datetime.now(timezone.utc).isoformat(), "marketing_source": "web_scan"}, on_conflict="email").execute()
-        lead_res = supabase.table("leads").select("id").eq("email", email).execute()
+    except Exception as e:
+        print(f"   ⚠️ DB Lead Error: {e}")
+
+def build_scan_payload(website, data) -> dict:
+    breakdown = data.get("breakdown", {})
+    return {
+        "url": website,
+        "url_hash": generate_url_hash(website),
+        "industry": data.get("industry", "Unknown"),
+        "archetype": data.get("archetype", "General"),
+        "total_score": int(data.get("score", 0)),
+        "technical_score": get_score_value(breakdown.get("technical", 0)),
+        "ai_score": get_score_value(breakdown.get("ai_judgment", 0)),
+        "authority_score": get_score_value(breakdown.get("authority", 0)),
+        "vibe_score": get_score_value(breakdown.get("content", 0)),
+        "benchmark_gap": max(0, data.get("benchmark", 88) - data.get("score", 0)),
+        "raw_analysis_json": data
+    }
+
+# Lead upsert + scan insert in one round trip via the save_scan RPC (migrations/002).
+# Without the function: upsert returning the lead id, then insert (two round trips).
+db_write_stats = {"rpc": 0, "fallback": 0, "errors": 0}
+save_scan_rpc_available = True
+
+def save_analysis_to_db(email, website, data):
+    if not supabase: return
+    t0 = time.perf_counter()
+    outcome = _save_analysis(email, website, data)
+    db_write_stats[outcome] += 1
+    db_write_seconds.observe(time.perf_counter() - t0, op="save_scan", outcome=outcome)
+
+def _save_analysis(email, website, data) -> str:
+    global save_scan_rpc_available
+    scan_payload = build_scan_payload(website, data)
+    try:
+        if save_scan_rpc_available:
+            try:
+                supabase.rpc("save_scan", {"p_email": email, "p_scan": scan_payload}).execute()
+                return "rpc"
+            except Exception as e:
+                if "PGRST202" not in str(e) and "Could not find the function" not in str(e): raise
+                save_scan_rpc_available = False
+                print("   ⚠️ save_scan RPC missing (run migrations/002), using two round trips")
+        lead_res = supabase.table("leads").upsert({"email": email, "last_scan_at": datetime.now(timezone.utc).isoformat(), "marketing_source": "web_scan"}, on_conflict="email").execute()
         lead_id = lead_res.data[0]['id'] if lead_res.data else None
-        
-        breakdown = data.get("breakdown", {})
-        scan_payload = {
-            "lead_id": lead_id,
-            "url": website,
-            "industry": data.get("industry", "Unknown"),
-            "archetype": data.get("archetype", "General"),
-            "total_score": int(data.get("score", 0)),
-            "technical_score": get_score_value(breakdown.get("technical", 0)),
-            "ai_score": get_score_value(breakdown.get("ai_judgment", 0)),
-            "authority_score": get_score_value(breakdown.get("authority", 0)),
-            "vibe_score": get_score_value(breakdown.get("content", 0)),
-            "benchmark_gap": max(0, data.get("benchmark", 88) - data.get("score", 0)),
-            "raw_analysis_json": data
-        }
-        supabase.table("scan_results").insert(scan_payload).execute()
+        supabase.table("scan_results").insert({"lead_id": lead_id, **scan_payload}).execute()
+        return "fallback"
     except Exception as e:
         print(f"   ⚠️ DB Save Error: {e}")
+        return "errors"
+
+# scan_logs rows are analytics: buffered and inserted in batches off the response path
+def insert_scan_logs(rows: list):
+    t0 = time.perf_counter()
+    outcome = "errors"
+    try:
+        supabase.table("scan_logs").insert(rows).execute()
+        outcome = "ok"
+    finally:
+        db_write_seconds.observe(time.perf_counter() - t0, op="scan_logs", outcome=outcome)
+
+# Rows that cannot be written are spilled to WRITE_BEHIND_SPILL_PATH ("off" disables) and
+# replayed once Supabase is back
+scan_log_buffer = WriteBehindBuffer(flush_rows=insert_scan_logs, run_blocking=run_io)
 
 def log_scan_metrics(url, duration, scrape, ai, cache, score):
+    scan_seconds.observe(duration, path=cache)
     if not supabase: return
-    try:
-        supabase.table("scan_logs").insert({
-            "url": url, "total_duration_ms": int(duration * 1000), 
-            "scrape_status": scrape, "ai_status": ai, "cache_status": cache, "final_score": score
-        }).execute()
-    except: pass
+    scan_log_buffer.add({
+        "url": url, "total_duration_ms": int(duration * 1000), 
+        "scrape_status": scrape, "ai_status": ai, "cache_status": cache, "final_score": score
+    })
+
+# Scan-result cache, two tiers keyed by generate_url_hash:
+#   tier 1: in-process LRU/TTL (no network), tier 2: Supabase scan_results.url_hash (indexed, exact match)
+RESULT_CACHE_TTL = 24 * 3600
+result_cache = TTLCache(maxsize=int(os.getenv("RESULT_CACHE_SIZE", "1000")), ttl=RESULT_CACHE_TTL, max_bytes=int(os.getenv("RESULT_CACHE_MAX_BYTES", "32000000")))
+db_cache_stats = {"hits": 0, "misses": 0, "errors": 0}
+
+def build_cached_result(data: dict, cached_at: str) -> dict:
+    return {
+        "score": data.get("score"),
+        "archetype": data.get("archetype"),
+        "industry": data.get("industry"),
+        "revenue_risk": data.get("revenue_risk", "Unknown"),
+        "benchmark": data.get("benchmark", 88),
+        "breakdown": data.get("breakdown", {}),
+        "fix_list": data.get("fix_list", []),
+        "revenue_message": data.get("revenue_message", {}),
+        "cached": True,
+        "cached_at": cached_at
+    }
+
+def remember_result(url_hash: str, data: dict):
+    result_cache.set(url_hash, build_cached_result(data, datetime.now(timezone.utc).isoformat()))
 
-def get_cached_result(url: str):
+def get_cached_result(url_hash: str):
     if not supabase: return None
     try:
-        clean_url = url.lower().replace('https://', '').replace('http://', '').replace('www.', '').rstrip('/')
-        cutoff = (datetime.now(timezone.utc) - timedelta(hours=24)).isoformat()
-        result = supabase.table("scan_results").select("*").ilike("url", f"%{clean_url}%").gte("created_at", cutoff).order("created_at", desc=True).limit(1).execute()
+        cutoff = (datetime.now(timezone.utc) - timedelta(seconds=RESULT_CACHE_TTL)).isoformat()
+        result = supabase.table("scan_results").select("total_score, archetype, industry, raw_analysis_json, created_at").eq("url_hash", url_hash).gte("created_at", cutoff).order("created_at", desc=True).limit(1).execute()
         if result.data and len(result.data) > 0:
             cached = result.data[0]
-            print(f"   📦 Cache HIT for {clean_url}")
+            db_cache_stats["hits"] += 1
+            print(f"   📦 Cache HIT for {url_hash}")
             return {
+                **build_cached_result(cached.get("raw_analysis_json") or {}, cached.get("created_at")),
                 "score": cached.get("total_score"),
                 "archetype": cached.get("archetype"),
                 "industry": cached.get("industry"),
-                "revenue_risk": cached.get("raw_analysis_json", {}).get("revenue_risk", "Unknown"),
-                "benchmark": cached.get("raw_analysis_json", {}).get("benchmark", 88),
-                "breakdown": cached.get("raw_analysis_json", {}).get("breakdown", {}),
-                "fix_list": cached.get("raw_analysis_json", {}).get("fix_list", []),
-                "revenue_message": cached.get("raw_analysis_json", {}).get("revenue_message", {}),
-                "cached": True,
-                "cached_at": cached.get("created_at")
             }
-    except: pass
+        db_cache_stats["misses"] += 1
+    except Exception as e:
+        db_cache_stats["errors"] += 1
+        print(f"   ⚠️ DB Cache Error: {e}")
     return None
 
 # --- ASYNC SCRAPER ---
-async def sophisticated_scrape(url: str) -> dict:
+# The PageDocument parsed here is handed to the scorers so each page is parsed once per scan.
+async def sophisticated_scrape(url: str, known: dict = None) -> dict:
+    """`known` (a page_versions entry) makes the first fetch conditional; a 304 returns status "not_modified"."""
     if not url.startswith('http'): url = 'https://' + url
+    result = await _scrape(url, known)
+    scrapes.inc(method=result.get("method", "none"), status=result["status"])
+    return result
+
+async def render_page(url: str) -> str:
+    async with browser_pool.page() as page:
+        await page.goto(url, timeout=15000)
+        return await page.content()
+
+async def _scrape(url: str, known: dict = None) -> dict:
     try:
-        resp = cffi_requests.get(url, impersonate="chrome110", timeout=8)
-        if resp.status_code == 200:
-            soup = BeautifulSoup(resp.content, 'html.parser')
-            for t in soup(["script", "style", "nav", "footer"]): t.decompose()
-            text = re.sub(r'\s+', ' ', soup.get_text()).strip()
-            if len(text) > 500: return {"status": "success", "html": str(resp.content)[:50000], "text": text[:6000], "title": soup.title.string if soup.title else "Unknown", "method": "curl-cffi"}
-    except: pass
+        with stage_seconds.time(stage="fetch_curl_cffi"):
+            page = await run_io(get_scan_recorder().fetch, get_scraper_client().fetch, url, headers=conditional_headers(known) or None)
+        if page["status_code"] == 304 and known: return {"status": "not_modified", "method": "curl-cffi"}
+        if page["status_code"] == 200:
+            with stage_seconds.time(stage="html_parse"):
+                doc = PageDocument(page["html"], text_limit=6000)
+            if len(doc.text) > 500:
+                return {"status": "success", "html": doc.html, "text": doc.text, "title": doc.title if doc.title is not None else "Unknown", "method": "curl-cffi", "doc": doc,
+                        "etag": page["headers"].get("etag"), "last_modified": page["headers"].get("last-modified"), "fingerprint": content_fingerprint(doc),
+                        "bytes": page["bytes"], "truncated": page["truncated"]}
+            scrape_fallbacks.inc(reason="thin_content")
+        else:
+            scrape_fallbacks.inc(reason=f"http_{page['status_code']}")
+    except Exception:
+        scrape_fallbacks.inc(reason="error")
     try:
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
-            page = await browser.new_page()
-            await page.goto(url, timeout=15000)
-            html = await page.content()
-            await browser.close()
-            soup = BeautifulSoup(html, 'html.parser')
-            for t in soup(["script", "style"]): t.decompose()
-            text = re.sub(r'\s+', ' ', soup.get_text()).strip()
-            if len(text) < 100: return {"status": "empty", "code": 204}
-            return {"status": "success", "html": html[:50000], "text": text[:6000], "title": soup.title.string if soup.title else "Unknown", "method": "playwright"}
+        with stage_seconds.time(stage="fetch_playwright"):
+            html = await get_scan_recorder().render(render_page, url)
+        # Rendered DOM can't be streamed; hold it to the same budget before parsing
+        if len(html) > SCRAPE_MAX_BYTES: html = html[:SCRAPE_MAX_BYTES]
+        with stage_seconds.time(stage="html_parse"):
+            doc = PageDocument(html, strip_tags=("script", "style"), text_limit=6000)
+        if len(doc.text) < 100: return {"status": "empty", "code": 204, "method": "playwright"}
+        return {"status": "success", "html": doc.html, "text": doc.text, "title": doc.title if doc.title is not None else "Unknown", "method": "playwright", "doc": doc,
+                "fingerprint": content_fingerprint(doc)}
     except Exception as e:
-        return {"status": "blocked", "code": 403}
+        return {"status": "blocked", "code": 403, "method": "playwright"}
 
 # --- AI JUDGMENT ---
 def get_ai_judgment(text: str, url: str, title: str, math_score: dict, use_reputation: bool = False) -> dict:
@@ -282,7 +494,9 @@ def get_ai_judgment(text: str, url: str, title: str, math_score: dict, use_reput
         3. Score them VERY HIGH (30-35/35).
         RETURN JSON as requested.
         """
-    ai_resp = call_ai_with_fallback(prompt)
+    return parse_ai_judgment(call_ai_with_fallback(prompt))
+
+def parse_ai_judgment(ai_resp: dict) -> dict:
     if ai_resp["status"] == "fallback":
         return {"ai_score": 20, "ai_judgment_score": {"total": 20}, "industry": "General", "company_tier": "unknown", "detected_issues": ["AI analysis unavailable"], "fix_list": [], "ai_source": "hardcoded"}
     try:
@@ -300,38 +514,113 @@ def get_ai_judgment(text: str, url: str, title: str, math_score: dict, use_reput
     except: return {"ai_score": 20, "industry": "General", "fix_list": [], "ai_source": "error"}
 
 # --- MAIN ENDPOINT ---
+# Concurrent scans of the same URL (same normalization as generate_url_hash) share one run
+scan_flight = SingleFlight()
+
 @app.post("/analyze")
 async def analyze_brand(request: URLRequest, req: Request):
-    start_time = time.time()
     forwarded = req.headers.get("x-forwarded-for")
     client_ip = forwarded.split(",")[0].strip() if forwarded else req.client.host
-    if not check_rate_limit(client_ip): raise HTTPException(status_code=429, detail="Rate limit exceeded.")
-    print(f"🚀 Scanning: {request.url}")
+    if not await check_rate_limit(client_ip): raise HTTPException(status_code=429, detail="Rate limit exceeded.")
+
+    url_hash = generate_url_hash(request.url)
+    waiter, joined = scan_flight.join(url_hash, lambda: run_scan(request.url, request.email))
+    if joined: print(f"   🔗 Coalescing: {request.url} (scan already running)")
+    result, callers = await waiter
+    # The scan row belongs to the first caller; joiners still get their lead recorded
+    if joined and not result.get("cached"): await run_io(record_lead, request.email)
+    return {**result, "coalesced_callers": callers}
+
+def sse_event(event: str, data) -> str:
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+SSE_HEADERS = {"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+
+@app.post("/analyze/stream")
+async def analyze_brand_stream(request: URLRequest, req: Request):
+    """
+    /analyze as Server-Sent Events: cache -> scrape -> math -> ai_judgment -> result -> persona -> done.
+    A caller joining a scan already in flight only receives result, persona and done.
+    """
+    forwarded = req.headers.get("x-forwarded-for")
+    client_ip = forwarded.split(",")[0].strip() if forwarded else req.client.host
+    if not await check_rate_limit(client_ip): raise HTTPException(status_code=429, detail="Rate limit exceeded.")
+
+    url_hash = generate_url_hash(request.url)
+    events = asyncio.Queue()
+    # Registered before anything awaits: `joined` is exact, and progress only runs for the leader
+    progress = lambda stage, data: events.put_nowait(sse_event(stage, data))
+    waiter, joined = scan_flight.join(url_hash, lambda: run_scan(request.url, request.email, progress))
+    scan = asyncio.ensure_future(waiter)
+    scan.add_done_callback(lambda _: events.put_nowait(None))
+
+    async def stream():
+        if joined: yield sse_event("joined", {"url_hash": url_hash})
+        while (chunk := await events.get()) is not None:
+            yield chunk
+        try:
+            result, callers = scan.result()
+        except Exception as e:
+            yield sse_event("error", {"detail": str(e)})
+            return
+        if joined and not result.get("cached"): await run_io(record_lead, request.email)
+        yield sse_event("result", {**result, "coalesced_callers": callers})
+        persona = await wait_for_persona(url_hash)
+        yield sse_event("persona", {"status": "ready", "data": persona} if persona and persona.get("status") == "ready" else {"status": "not_found"})
+        yield sse_event("done", {})
+
+    return StreamingResponse(stream(), media_type="text/event-stream", headers=SSE_HEADERS)
+
+async def run_scan(url: str, email: str, progress=None) -> dict:
+    """`progress(stage, data)`, when given, is called as each stage finishes (used by /analyze/stream)."""
+    with scans_in_flight.track():
+        return await _run_scan(url, email, progress)
+
+async def _run_scan(url: str, email: str, progress=None) -> dict:
+    start_time = time.time()
+    print(f"🚀 Scanning: {url}")
+    emit = progress or (lambda stage, data: None)
 
-    # 1. Cache
-    cached_result = get_cached_result(request.url)
+    # 1. Cache (in-process first, then Supabase)
+    url_hash = generate_url_hash(url)
+    cached_result = await find_cached_result(url_hash)
+    emit("cache", {"hit": bool(cached_result)})
     if cached_result:
-        log_scan_metrics(request.url, time.time() - start_time, "cached", "cached", "hit", cached_result.get("score", 0))
+        log_scan_metrics(url, time.time() - start_time, "cached", "cached", "hit", cached_result.get("score", 0))
         return cached_result
 
-    # 2. Scrape
-    scrape_result = await sophisticated_scrape(request.url)
-    brand_info = get_brand_tier(request.url)
+    # 2. Scrape (conditional when this page was fully scanned before)
+    known = await known_page_version(url_hash)
+    scrape_result = await sophisticated_scrape(url, known)
+    emit("scrape", {"status": scrape_result["status"], "method": scrape_result.get("method")})
+    revalidated = await revalidated_result(url_hash, scrape_result, known)
+    if revalidated:
+        emit("revalidated", {"via": revalidated["revalidated_via"]})
+        if known.get("context") and get_cached_persona(url_hash) is None: fire_persona_generation_async(url, known["context"])
+        await run_io(save_analysis_to_db, email, url, revalidated)
+        remember_result(url_hash, revalidated)
+        log_scan_metrics(url, time.time() - start_time, scrape_result["method"], "revalidated", "revalidated", revalidated["score"])
+        print(f"   ♻️ Unchanged since last scan ({revalidated['revalidated_via']}): {revalidated['score']}")
+        return revalidated
+    brand_info = get_brand_tier(url)
     html_content = ""
     text_content = ""
-    title_content = request.url
+    title_content = url
     is_blocked_famous = False
     
     # 3. Handle Explicit Block
     if scrape_result["status"] in ["blocked", "error", "empty"]:
         if brand_info:
-            print(f"   🛡️ Blocked but Famous: {request.url} -> Activating Synthetic Injection")
+            print(f"   🛡️ Blocked but Famous: {url} -> Activating Synthetic Injection")
             is_blocked_famous = True
-            text_content = f"Official website of {request.url}. Global market leader in {brand_info['industry']}."
-            title_content = f"{request.url} - Official Site"
+            text_content = f"Official website of {url}. Global market leader in {brand_info['industry']}."
+            title_content = f"{url} - Official Site"
         else:
-            result = {"score": 15, "archetype": "Security Fortress", "industry": "High Security", "revenue_risk": "AI Invisibility", "benchmark": 98, "breakdown": {"technical": 5, "content": 10}, "fix_list": []}
-            save_analysis_to_db(request.email, request.url, result)
+            result = blocked_scan_result()
+            await run_io(save_analysis_to_db, email, url, result)
+            remember_result(url_hash, result)
+            log_scan_metrics(url, time.time() - start_time, scrape_result["status"], "skipped", "blocked", result["score"])
+            print(f"   🛡️ Security Fortress: {url} ({scrape_result['status']})")
             return result
     else:
         html_content = scrape_result.get("html", "")
@@ -340,12 +629,83 @@ async def analyze_brand(request: URLRequest, req: Request):
 
     # 4. Scoring
     if is_blocked_famous:
-        math_result = {'total': 55, 'breakdown': {'technical': {'score': 15}, 'content': {'score': 10}, 'authority': {'score': 15}, 'ai_discoverability': {'score': 10}, 'answerability': {'score': 5}}}
-        ai_result = get_ai_judgment(text_content, request.url, title_content, math_result, use_reputation=True)
+        math_result = titan_math_result()
     else:
-        math_result = calculate_math_score(html_content, text_content, request.url)
-        ai_result = get_ai_judgment(text_content, request.url, title_content, math_result, use_reputation=False)
+        math_result = await timed_score_page(html_content, text_content, url, doc=scrape_result.get("doc"))
+    emit("math", {"total": math_result["total"], "breakdown": {k: v.get("score", 0) for k, v in math_result["breakdown"].items()}})
+    with stage_seconds.time(stage="ai_judgment"):
+        ai_result = await run_io(get_ai_judgment, text_content, url, title_content, math_result, use_reputation=is_blocked_famous)
+    emit("ai_judgment", {k: ai_result.get(k) for k in ("ai_score", "ai_judgment_score", "industry", "company_tier", "detected_issues", "ai_source")})
+
+    result, context = finalize_scan(url, text_content, brand_info, math_result, ai_result)
+
+    # 7. Async Persona
+    fire_persona_generation_async(url, context)
+
+    await run_io(save_analysis_to_db, email, url, result)
+    remember_result(url_hash, result)
+    await remember_page_version(url_hash, scrape_result, result, context)
+    log_scan_metrics(url, time.time() - start_time, scrape_result.get("method", scrape_result["status"]), ai_result.get("ai_source", "unknown"), "miss", result["score"])
+    print(f"   ✅ Final Score: {result['score']}")
+    return result
 
+async def find_cached_result(url_hash: str):
+    with stage_seconds.time(stage="cache_lookup"):
+        cached_result = result_cache.get(url_hash)
+        cache_lookups.inc(tier="memory", result="hit" if cached_result is not None else "miss")
+        if cached_result is None and supabase:
+            cached_result = await run_io(get_cached_result, url_hash)
+            cache_lookups.inc(tier="supabase", result="hit" if cached_result else "miss")
+            if cached_result: result_cache.set(url_hash, cached_result)
+    return cached_result
+
+async def timed_score_page(html: str, text: str, url: str, doc=None) -> dict:
+    """score_page, recording the whole math stage and each calculate_* step."""
+    timings = {}
+    with stage_seconds.time(stage="math"):
+        math_result = await score_page(html, text, url, doc=doc, timings=timings)
+    # score_html_parse only appears when the scorer had to re-parse (process pool, no shared doc)
+    for step, seconds in timings.items():
+        stage_seconds.observe(seconds, stage=f"score_{step}")
+    return math_result
+
+# Incremental re-scans: validators + content fingerprint + last full result per url_hash
+# (get_page_versions() is None when PAGE_VERSIONS_PATH=off; the lifespan opens the store)
+async def known_page_version(url_hash: str):
+    page_versions = get_page_versions()
+    return await run_io(page_versions.get, url_hash) if page_versions else None
+
+async def revalidated_result(url_hash: str, scrape_result: dict, known: dict):
+    """The previous result when the page is unchanged (304, or same content fingerprint), else None."""
+    if not known: return None
+    page_versions = get_page_versions()
+    if scrape_result["status"] == "not_modified":
+        via = "not_modified"
+    elif scrape_result["status"] == "success" and scrape_result.get("fingerprint") == known["fingerprint"]:
+        via = "fingerprint"
+    else:
+        page_versions.record("changed")
+        return None
+    page_versions.record("not_modified" if via == "not_modified" else "fingerprint_match")
+    # Refresh the entry (and pick up new validators when only boilerplate changed; a 304 may omit them)
+    await run_io(page_versions.put, url_hash, scrape_result.get("etag") or known["etag"], scrape_result.get("last_modified") or known["last_modified"],
+                 known["fingerprint"], known["result"], known.get("context"))
+    return {**known["result"], "scan_status": "unchanged, revalidated", "revalidated_via": via}
+
+async def remember_page_version(url_hash: str, scrape_result: dict, result: dict, context: dict = None):
+    page_versions = get_page_versions()
+    if page_versions is None or scrape_result["status"] != "success": return
+    await run_io(page_versions.put, url_hash, scrape_result.get("etag"), scrape_result.get("last_modified"),
+                 scrape_result["fingerprint"], result, context)
+
+def blocked_scan_result() -> dict:
+    return {"score": 15, "archetype": "Security Fortress", "industry": "High Security", "revenue_risk": "AI Invisibility", "benchmark": 98, "breakdown": {"technical": 5, "content": 10}, "fix_list": []}
+
+def titan_math_result() -> dict:
+    return {'total': 55, 'breakdown': {'technical': {'score': 15}, 'content': {'score': 10}, 'authority': {'score': 15}, 'ai_discoverability': {'score': 10}, 'answerability': {'score': 5}}}
+
+def finalize_scan(url: str, text_content: str, brand_info, math_result: dict, ai_result: dict):
+    """Steps 5-6 of a scan: Titan safety floor, industry/tier/benchmark, result dict. Returns (result, persona context)."""
     final_score = min(100, math_result['total'] + ai_result['ai_score'])
     
     # 5. SAFETY FLOOR (Fixes Score, Bars AND Fix List)
@@ -356,16 +716,7 @@ async def analyze_brand(request: URLRequest, req: Request):
         final_score = brand_info['min_score']
         
         # FIX 1: Overwrite Breakdown (so bars fill up)
-        math_result = {
-            'total': 55, 
-            'breakdown': {
-                'technical': {'score': 15}, 
-                'content': {'score': 10}, 
-                'authority': {'score': 15}, 
-                'ai_discoverability': {'score': 10}, 
-                'answerability': {'score': 5}
-            }
-        }
+        math_result = titan_math_result()
         # FIX 2: Inject Default Titan Fixes (so dashboard isn't empty)
         if not final_fix_list or len(final_fix_list) == 0:
             final_fix_list = TITAN_DEFAULT_FIXES
@@ -399,19 +750,97 @@ async def analyze_brand(request: URLRequest, req: Request):
         "fix_list": final_fix_list
     }
 
-    # 7. Async Persona
     context = get_persona_context(
-        url=request.url, text=text_content, industry=validated_industry, 
+        url=url, text=text_content, industry=validated_industry, 
         company_tier=tier, score=final_score, 
         breakdown=result["breakdown"], detected_issues=result["detected_issues"], 
         benchmark=benchmark["benchmark"]
     )
-    fire_persona_generation_async(request.url, context)
+    return result, context
+
+# --- BATCH SCANS ---
+# Same pipeline as run_scan, tuned for throughput: bounded per-host/global scraping and
+# several sites per LLM judgment prompt. No persona copy is generated.
+BATCH_JOB_TTL = 24 * 3600
+batch_jobs = TTLCache(maxsize=200, ttl=BATCH_JOB_TTL)
+batch_tasks = set()  # strong refs so running batches are not garbage collected
+
+async def judge_site_group(items: list) -> list:
+    if len(items) == 1:
+        item = items[0]
+        return [await run_io(get_ai_judgment, item["text"], item["url"], item["title"], {"total": item["math_total"]})]
+    ai_resp = await run_io(call_ai_with_fallback, build_group_prompt(items), 20)
+    judged = split_group_answer(ai_resp["data"], len(items)) if ai_resp["status"] == "success" else [None] * len(items)
+    results = []
+    for item, data in zip(items, judged):
+        if data is not None:
+            results.append(parse_ai_judgment({"status": "success", "source": ai_resp["source"], "data": data}))
+        elif ai_resp["status"] == "success":
+            # Site missing from the grouped answer: judge it on its own
+            results.append(await run_io(get_ai_judgment, item["text"], item["url"], item["title"], {"total": item["math_total"]}))
+        else:
+            results.append(parse_ai_judgment(ai_resp))
+    return results
+
+async def scan_batch_item(url: str, email: str, limiter: HostLimiter, grouper: JudgmentGrouper) -> dict:
+    url_hash = generate_url_hash(url)
+    cached_result = await find_cached_result(url_hash)
+    if cached_result: return cached_result
+
+    known = await known_page_version(url_hash)
+    async with limiter.slot(url):
+        scrape_result = await sophisticated_scrape(url, known)
+    revalidated = await revalidated_result(url_hash, scrape_result, known)
+    if revalidated:
+        await run_io(save_analysis_to_db, email, url, revalidated)
+        remember_result(url_hash, revalidated)
+        return revalidated
+    brand_info = get_brand_tier(url)
+
+    if scrape_result["status"] in ["blocked", "error", "empty"]:
+        if not brand_info:
+            result = blocked_scan_result()
+            await run_io(save_analysis_to_db, email, url, result)
+            remember_result(url_hash, result)
+            return result
+        text_content = f"Official website of {url}. Global market leader in {brand_info['industry']}."
+        math_result = titan_math_result()
+        ai_result = await run_io(get_ai_judgment, text_content, url, f"{url} - Official Site", math_result, use_reputation=True)
+    else:
+        text_content = scrape_result.get("text", "")
+        math_result = await timed_score_page(scrape_result.get("html", ""), text_content, url, doc=scrape_result.get("doc"))
+        ai_result = await grouper.judge({"url": url, "title": scrape_result.get("title", ""), "text": text_content, "math_total": math_result["total"]})
 
-    save_analysis_to_db(request.email, request.url, result)
-    print(f"   ✅ Final Score: {final_score}")
+    result, context = finalize_scan(url, text_content, brand_info, math_result, ai_result)
+    await run_io(save_analysis_to_db, email, url, result)
+    remember_result(url_hash, result)
+    await remember_page_version(url_hash, scrape_result, result, context)
     return result
 
+async def run_batch(job: BatchJob):
+    job.status = "running"
+    job.started_at = time.time()
+    limiter = HostLimiter()
+    grouper = JudgmentGrouper(judge_site_group)
+
+    async def one(index: int, url: str):
+        try:
+            job.add(index, url, result=await scan_batch_item(url, job.email, limiter, grouper))
+        except Exception as e:
+            print(f"   ⚠️ Batch item failed ({url}): {e}")
+            job.add(index, url, error=str(e))
+
+    try:
+        await asyncio.gather(*(one(i, url) for i, url in enumerate(job.urls)))
+        job.finish()
+    except asyncio.CancelledError:
+        job.finish("cancelled")
+        raise
+    finally:
+        grouper.close()
+    progress = job.progress()
+    print(f"   📦 Batch {job.id}: {progress['completed']} URLs in {progress['elapsed_s']}s ({progress['urls_per_minute']} URLs/min, {grouper.groups} LLM groups)")
+
 # ✅ FIXED ENDPOINT: Handles both HASH and RAW URL
 @app.get("/persona/{identifier}")
 async def get_persona_copy(identifier: str):
@@ -426,6 +855,19 @@ async def get_persona_copy(identifier: str):
     if not cached: return {"status": "not_found", "message": "No persona data"}
     return {"status": "ready", "data": cached}
 
+@app.get("/persona/{identifier}/stream")
+async def stream_persona_copy(identifier: str):
+    """One SSE `persona` event as soon as generation finishes (replaces polling /persona/{identifier})."""
+    async def stream():
+        persona = None
+        for url_hash in (identifier, generate_url_hash(identifier)):
+            if get_cached_persona(url_hash) is not None:
+                persona = await wait_for_persona(url_hash)
+                break
+        yield sse_event("persona", {"status": "ready", "data": persona} if persona and persona.get("status") == "ready" else {"status": "not_found"})
+
+    return StreamingResponse(stream(), media_type="text/event-stream", headers=SSE_HEADERS)
+
 @app.post("/generate-persona-copy")
 async def generate_persona_copy(request: PersonaCopyRequest):
     context = get_persona_context(
@@ -434,20 +876,82 @@ async def generate_persona_copy(request: PersonaCopyRequest):
         breakdown=request.breakdown, detected_issues=request.detected_issues, 
         benchmark=request.benchmark
     )
-    result = generate_persona_copy_sync(context)
+    result = await run_io(generate_persona_copy_sync, context)
     url_hash = generate_url_hash(request.url)
     set_cached_persona(url_hash, result)
     return result
 
+@app.post("/analyze-batch")
+async def analyze_batch(request: BatchRequest, req: Request):
+    forwarded = req.headers.get("x-forwarded-for")
+    client_ip = forwarded.split(",")[0].strip() if forwarded else req.client.host
+    if not await check_rate_limit(client_ip): raise HTTPException(status_code=429, detail="Rate limit exceeded.")
+    urls = list(dict.fromkeys(u.strip() for u in request.urls if u and u.strip()))
+    if not urls: raise HTTPException(status_code=400, detail="No URLs submitted.")
+    if len(urls) > BATCH_MAX_URLS: raise HTTPException(status_code=413, detail=f"At most {BATCH_MAX_URLS} URLs per batch.")
+    job = BatchJob(urls, request.email)
+    batch_jobs.set(job.id, job)
+    task = asyncio.create_task(run_batch(job))
+    batch_tasks.add(task)
+    task.add_done_callback(batch_tasks.discard)
+    return {"job_id": job.id, "total": len(urls), "status_url": f"/analyze-batch/{job.id}", "stream_url": f"/analyze-batch/{job.id}/stream"}
+
+@app.get("/analyze-batch/{job_id}")
+async def get_batch(job_id: str, offset: int = 0):
+    job = batch_jobs.get(job_id)
+    if job is None: raise HTTPException(status_code=404, detail="Unknown batch job.")
+    return {**job.progress(), "offset": offset, "results": job.results[offset:]}
+
+@app.get("/analyze-batch/{job_id}/stream")
+async def stream_batch(job_id: str):
+    job = batch_jobs.get(job_id)
+    if job is None: raise HTTPException(status_code=404, detail="Unknown batch job.")
+
+    async def lines():
+        sent = 0
+        while True:
+            await job.wait_for(sent)
+            while sent < len(job.results):
+                yield json.dumps(job.results[sent]) + "\n"
+                sent += 1
+            if job.done and sent >= len(job.results):
+                yield json.dumps({"progress": job.progress()}) + "\n"
+                return
+
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
+
 @app.post("/capture-lead")
 async def capture_lead(request: LeadCaptureRequest):
     if not supabase: return {"status": "error"}
-    supabase.table("leads").upsert({"email": request.email, "full_name": request.full_name, "company_name": request.company_name, "is_subscribed": True}, on_conflict="email").execute()
+    await run_io(lambda: supabase.table("leads").upsert({"email": request.email, "full_name": request.full_name, "company_name": request.company_name, "is_subscribed": True}, on_conflict="email").execute())
     return {"status": "success"}
 
+@app.get("/stats")
+async def stats():
+    llm_cache = get_llm_cache()
+    return {
+        "result_cache": {"memory": result_cache.stats, "supabase": dict(db_cache_stats)},
+        "persona_cache": persona_cache.stats,
+        "scan_flight": dict(scan_flight.stats),
+        "persona_jobs": persona_jobs.stats,
+        "llm": llm_hedge.stats,
+        "llm_cache": llm_cache.stats if llm_cache else None,
+        "rate_limiter": rate_limiter.info(),
+        "db_writes": {**db_write_stats, "scan_logs": scan_log_buffer.stats},
+        "revalidation": get_page_versions().stats if get_page_versions() else None,
+        "scraper": get_scraper_client().info(),
+        "scan_recorder": get_scan_recorder().info(),
+    }
+
+@app.get("/metrics")
+async def metrics():
+    return Response(REGISTRY.render(), media_type=CONTENT_TYPE)
+
 @app.get("/health")
 async def health_check():
     return {"status": "alive", "timestamp": datetime.now(timezone.utc).isoformat()}
 
 if __name__ == "__main__":
-    uvicorn.run(app, host="0.0.0.0", port=8000)
\ No newline at end of file
+    import uvicorn
+    uvicorn.run(app, host="0.0.0.0", port=8000)
+
@@ -0,0 +1,13 @@
+-- migrations/001_scan_results_url_hash.sql
+-- Exact-match cache lookups for get_cached_result (replaces the ILIKE '%url%' scan)
+-- url_hash = generate_url_hash(url): md5 of the lowercased URL without scheme, "www." and trailing "/", first 16 hex chars
+-- Run before deploying the backend that writes url_hash.
+
+ALTER TABLE scan_results ADD COLUMN IF NOT EXISTS url_hash text;
+
+UPDATE scan_results
+SET url_hash = left(md5(rtrim(replace(replace(replace(lower(url), 'https://', ''), 'http://', ''), 'www.', ''), '/')), 16)
+WHERE url_hash IS NULL AND url IS NOT NULL;
+
+CREATE INDEX IF NOT EXISTS scan_results_url_hash_created_at_idx
+    ON scan_results (url_hash, created_at DESC);
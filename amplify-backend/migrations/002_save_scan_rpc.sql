@@ -0,0 +1,32 @@
+-- migrations/002_save_scan_rpc.sql
+-- save_scan(email, scan): upserts the lead and inserts the scan_results row in one round trip
+-- (replaces upsert lead -> select lead id -> insert scan). `scan` carries scan_results columns
+-- except lead_id. Returns {"lead_id": ..., "scan_id": ...}.
+-- Runs as the caller (RLS unchanged). Without it the backend falls back to two round trips.
+
+CREATE OR REPLACE FUNCTION save_scan(p_email text, p_scan jsonb)
+RETURNS jsonb
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    v_lead_id leads.id%TYPE;
+    v_scan_id scan_results.id%TYPE;
+BEGIN
+    INSERT INTO leads (email, last_scan_at, marketing_source)
+    VALUES (p_email, now(), 'web_scan')
+    ON CONFLICT (email) DO UPDATE
+        SET last_scan_at = EXCLUDED.last_scan_at, marketing_source = EXCLUDED.marketing_source
+    RETURNING id INTO v_lead_id;
+
+    INSERT INTO scan_results (lead_id, url, url_hash, industry, archetype, total_score, technical_score,
+                              ai_score, authority_score, vibe_score, benchmark_gap, raw_analysis_json)
+    SELECT v_lead_id, s.url, s.url_hash, s.industry, s.archetype, s.total_score, s.technical_score,
+           s.ai_score, s.authority_score, s.vibe_score, s.benchmark_gap, s.raw_analysis_json
+    FROM jsonb_populate_record(NULL::scan_results, p_scan) AS s
+    RETURNING id INTO v_scan_id;
+
+    RETURN jsonb_build_object('lead_id', v_lead_id, 'scan_id', v_scan_id);
+END;
+$$;
+
+GRANT EXECUTE ON FUNCTION save_scan(text, jsonb) TO anon, authenticated;
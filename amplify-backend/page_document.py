@@ -0,0 +1,138 @@
+# page_document.py
+# Parse-once document model shared by the scraper and every scorer
+# Uses lxml when installed (~20x faster tree build), falls back to BeautifulSoup's html.parser
+
+import os
+import re
+
+try:
+    import lxml.html
+    from lxml import etree
+    HAS_LXML = True
+except ImportError:
+    HAS_LXML = False
+
+PAGE_PARSER = os.getenv("PAGE_PARSER", "lxml" if HAS_LXML else "html.parser")
+
+# Tags removed before visible-text extraction (matches the curl-cffi scrape path)
+DEFAULT_STRIP_TAGS = ("script", "style", "nav", "footer")
+HEADING_TAGS = ("h1", "h2", "h3", "h4", "h5", "h6")
+
+
+class PageDocument:
+    """
+    Everything the scorers read from a page, extracted in a single parse:
+    meta tags, title, headings, JSON-LD blocks, links, visible text and
+    lowercased text/HTML. The parse tree itself is not kept.
+
+    Pass `text` to reuse already-extracted text instead of re-deriving it.
+    """
+
+    def __init__(self, html: str, text: str = None, strip_tags: tuple = DEFAULT_STRIP_TAGS,
+                 text_limit: int = None, parser: str = None):
+        self.html = html or ""
+        self.title = None
+        self.meta = {}
+        self.headings = {tag: [] for tag in HEADING_TAGS}
+        self.json_ld = []
+        self.links = []
+        self._html_lower = None
+        self._text_lower = None
+
+        parser = parser or PAGE_PARSER
+        raw_text = None
+        try:
+            if parser == "lxml" and HAS_LXML:
+                raw_text = self._parse_lxml(strip_tags, need_text=text is None, text_limit=text_limit)
+            else:
+                raw_text = self._parse_bs4(strip_tags, need_text=text is None, text_limit=text_limit)
+        except Exception as e:
+            print(f"   ⚠️ Page parse error: {e}")
+
+        if text is None:
+            text = re.sub(r'\s+', ' ', raw_text or "").strip()
+            if text_limit: text = text[:text_limit]
+        self.text = text
+
+    @property
+    def html_lower(self) -> str:
+        if self._html_lower is None:
+            self._html_lower = self.html.lower()
+        return self._html_lower
+
+    @property
+    def text_lower(self) -> str:
+        if self._text_lower is None:
+            self._text_lower = self.text.lower()
+        return self._text_lower
+
+    # --- BACKENDS ---
+
+    def _parse_lxml(self, strip_tags: tuple, need_text: bool, text_limit: int = None) -> str:
+        if not self.html.strip(): return ""
+        try:
+            root = lxml.html.document_fromstring(self.html)
+        except ValueError:
+            # str input carrying an <?xml encoding?> declaration
+            root = lxml.html.document_fromstring(self.html.encode("utf-8"))
+
+        title = root.find(".//title")
+        if title is not None and len(title) == 0:
+            self.title = title.text
+
+        for meta in root.iter("meta"):
+            key = meta.get("name") or meta.get("property")
+            if key and key not in self.meta:
+                self.meta[key] = meta.get("content")
+
+        for el in root.iter(*HEADING_TAGS):
+            self.headings[el.tag].append(el.text_content())
+
+        for script in root.iter("script"):
+            if script.get("type") == "application/ld+json":
+                self.json_ld.append(script.text or "")
+
+        self.links = [a.get("href") for a in root.iter("a") if a.get("href")]
+
+        if not need_text: return None
+        for el in list(root.iter(*strip_tags)):
+            el.drop_tree()
+        # Comments and processing instructions are not visible text
+        for el in list(root.iter(etree.Comment, etree.ProcessingInstruction)):
+            el.drop_tree()
+        return root.text_content() if not text_limit else _leading_text(root.itertext(), text_limit)
+
+    def _parse_bs4(self, strip_tags: tuple, need_text: bool, text_limit: int = None) -> str:
+        from bs4 import BeautifulSoup
+        soup = BeautifulSoup(self.html, 'html.parser')
+
+        if soup.title:
+            self.title = soup.title.string
+
+        for meta in soup.find_all('meta'):
+            key = meta.get('name') or meta.get('property')
+            if key and key not in self.meta:
+                self.meta[key] = meta.get('content')
+
+        for el in soup.find_all(HEADING_TAGS):
+            self.headings[el.name].append(el.get_text())
+
+        self.json_ld = [s.string or "" for s in soup.find_all('script', type='application/ld+json')]
+        self.links = [a['href'] for a in soup.find_all('a', href=True)]
+
+        if not need_text: return None
+        for t in soup(list(strip_tags)): t.decompose()
+        return soup.get_text() if not text_limit else _leading_text(soup.strings, text_limit)
+
+
+def _leading_text(pieces, limit: int) -> str:
+    """
+    Joins text nodes only until the whitespace-collapsed text is sure to reach `limit` chars,
+    so collapsing + truncating the result gives the same text as doing it on the whole page.
+    """
+    taken, collapsed = [], 0
+    for piece in pieces:
+        taken.append(piece)
+        collapsed += len(" ".join(piece.split()))
+        if collapsed >= limit: break
+    return "".join(taken)
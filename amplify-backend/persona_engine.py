@@ -3,12 +3,13 @@
 # Includes: Signal Extraction, Persona Logic, and Copy Generation
 
 import os
-import re
 import json
 import hashlib
 from urllib.parse import urlparse
-from groq import Groq
 from dotenv import load_dotenv
+from keyword_matcher import register_signals, match_signals
+from llm_clients import get_groq_client, get_gemini_client
+from llm_cache import cached_llm_call
 
 # --- CONFIG ---
 load_dotenv()
@@ -72,6 +73,8 @@ PERSONA_SIGNALS = {
     }
 }
 
+register_signals("persona", {persona: config["signals"] for persona, config in PERSONA_SIGNALS.items()})
+
 # Fallback persona
 FALLBACK_PERSONA = "growth_marketer"
 
@@ -87,15 +90,12 @@ def extract_brand_name(url: str) -> str:
 
 
 def extract_content_signals(text: str) -> dict:
-    text_lower = text.lower()
+    hits = match_signals(text)
     results = {}
     all_found_signals = []
     
     for persona, config in PERSONA_SIGNALS.items():
-        found = []
-        for signal in config["signals"]:
-            if signal in text_lower:
-                found.append(signal)
+        found = hits.found(f"persona:{persona}")
         
         results[persona] = {
             "count": len(found),
@@ -213,25 +213,26 @@ def generate_persona_copy_sync(context: dict) -> dict:
 
     try:
         if GROQ_API_KEY:
-            client = Groq(api_key=GROQ_API_KEY)
-            completion = client.chat.completions.create(
-                messages=[{"role": "user", "content": prompt}],
-                model="llama-3.3-70b-versatile",
-                temperature=0.7,
-                response_format={"type": "json_object"}
-            )
-            return json.loads(completion.choices[0].message.content)
+            def ask_groq():
+                completion = get_groq_client().chat.completions.create(
+                    messages=[{"role": "user", "content": prompt}],
+                    model="llama-3.3-70b-versatile",
+                    temperature=0.7,
+                    response_format={"type": "json_object"}
+                )
+                return json.loads(completion.choices[0].message.content)
+            return cached_llm_call("groq:llama-3.3-70b-versatile", 0.7, prompt, ask_groq)
             
         elif GEMINI_API_KEY:
-            from google import genai
             from google.genai import types
-            client = genai.Client(api_key=GEMINI_API_KEY)
-            response = client.models.generate_content(
-                model='gemini-2.0-flash-exp',
-                contents=prompt,
-                config=types.GenerateContentConfig(response_mime_type="application/json")
-            )
-            return json.loads(response.text)
+            def ask_gemini():
+                response = get_gemini_client().models.generate_content(
+                    model='gemini-2.0-flash-exp',
+                    contents=prompt,
+                    config=types.GenerateContentConfig(response_mime_type="application/json")
+                )
+                return json.loads(response.text)
+            return cached_llm_call("gemini:gemini-2.0-flash-exp", None, prompt, ask_gemini)  # no temperature sent
 
     except Exception as e:
         print(f"   ⚠️ Persona Gen Failed: {e}")
@@ -0,0 +1,157 @@
+# persona_jobs.py
+# Bounded job queue + fixed worker pool for background persona copy generation
+# One queued job per key (url hash): resubmitting replaces the queued context, and a result
+# computed for a superseded submission is discarded. Jobs that waited too long are dropped.
+
+import os
+import time
+import threading
+from collections import OrderedDict, deque
+
+
+def _summary_ms(samples) -> dict:
+    if not samples: return {"n": 0, "p50_ms": 0.0, "p99_ms": 0.0, "max_ms": 0.0}
+    ordered = sorted(samples)
+    pick = lambda pct: ordered[min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))]
+    return {"n": len(ordered), "p50_ms": round(pick(50) * 1000, 1), "p99_ms": round(pick(99) * 1000, 1), "max_ms": round(ordered[-1] * 1000, 1)}
+
+
+class _Job:
+    __slots__ = ("key", "context", "seq", "enqueued_at")
+
+    def __init__(self, key, context, seq):
+        self.key = key
+        self.context = context
+        self.seq = seq
+        self.enqueued_at = time.monotonic()
+
+
+class PersonaJobQueue:
+    """
+    Usage:
+        jobs = PersonaJobQueue(work=generate, on_result=store, on_error=mark_failed)
+        jobs.submit(url_hash, context)   # "queued" | "deduplicated" | "rejected"
+
+    PERSONA_WORKERS (default 4) threads run `work(context)`; at most PERSONA_QUEUE_SIZE
+    (default 200) jobs wait, further submissions are rejected. A job still queued after
+    PERSONA_JOB_MAX_WAIT seconds (default 60) is cancelled with `on_error(key, TimeoutError)`.
+    Wait and run times of the last 512 jobs are kept for `stats`.
+    """
+
+    def __init__(self, work, on_result, on_error, workers: int = None, max_queue: int = None, max_wait: float = None):
+        self.work = work
+        self.on_result = on_result
+        self.on_error = on_error
+        self.workers = workers or int(os.getenv("PERSONA_WORKERS", "4"))
+        self.max_queue = max_queue or int(os.getenv("PERSONA_QUEUE_SIZE", "200"))
+        self.max_wait = max_wait or float(os.getenv("PERSONA_JOB_MAX_WAIT", "60"))
+        self._pending = OrderedDict()  # key -> _Job, FIFO
+        self._latest = {}              # key -> seq of the newest submission (queued or running)
+        self._seq = 0
+        self._cond = threading.Condition()
+        self._threads = []
+        self._stopping = False
+        self._wait_times = deque(maxlen=512)
+        self._run_times = deque(maxlen=512)
+        self.counters = {"submitted": 0, "deduplicated": 0, "rejected": 0, "expired": 0,
+                         "superseded": 0, "completed": 0, "failed": 0, "running": 0}
+
+    def start(self):
+        with self._cond:
+            self._stopping = False
+            while len(self._threads) < self.workers:
+                t = threading.Thread(target=self._run, name=f"persona-worker-{len(self._threads)}", daemon=True)
+                self._threads.append(t)
+                t.start()
+
+    def stop(self, timeout: float = 5.0):
+        """Drops queued jobs and waits up to `timeout` for running ones to finish."""
+        with self._cond:
+            self._stopping = True
+            self._pending.clear()
+            self._cond.notify_all()
+            threads, self._threads = self._threads, []
+        deadline = time.monotonic() + timeout
+        for t in threads: t.join(max(0.0, deadline - time.monotonic()))
+
+    def submit(self, key, context) -> str:
+        if not self._threads: self.start()
+        with self._cond:
+            self.counters["submitted"] += 1
+            self._seq += 1
+            job = self._pending.get(key)
+            if job is not None:
+                # Same page rescanned before its job ran: keep the queue slot, run the newest context
+                job.context, job.seq = context, self._seq
+                self._latest[key] = self._seq
+                self.counters["deduplicated"] += 1
+                return "deduplicated"
+            if len(self._pending) >= self.max_queue:
+                self.counters["rejected"] += 1
+                return "rejected"
+            self._pending[key] = _Job(key, context, self._seq)
+            self._latest[key] = self._seq
+            self._cond.notify()
+            return "queued"
+
+    def _next_job(self):
+        with self._cond:
+            while True:
+                if self._stopping: return None
+                now = time.monotonic()
+                while self._pending:
+                    _, job = self._pending.popitem(last=False)
+                    waited = now - job.enqueued_at
+                    if waited > self.max_wait:
+                        self.counters["expired"] += 1
+                        self._forget(job)
+                        self._cond.release()
+                        try: self._safe(self.on_error, job.key, TimeoutError(f"persona job waited {waited:.0f}s"))
+                        finally: self._cond.acquire()
+                        continue
+                    self._wait_times.append(waited)
+                    self.counters["running"] += 1
+                    return job
+                self._cond.wait()
+
+    def _run(self):
+        while True:
+            job = self._next_job()
+            if job is None: return
+            t0 = time.monotonic()
+            try:
+                result, error = self.work(job.context), None
+            except Exception as e:
+                result, error = None, e
+            with self._cond:
+                self._run_times.append(time.monotonic() - t0)
+                self.counters["running"] -= 1
+                current = self._latest.get(job.key) == job.seq
+                if current: self._forget(job)
+                else: self.counters["superseded"] += 1
+                self.counters["failed" if error else "completed"] += 1
+            if not current: continue
+            if error is None: self._safe(self.on_result, job.key, result)
+            else: self._safe(self.on_error, job.key, error)
+
+    def _forget(self, job):
+        if self._latest.get(job.key) == job.seq: del self._latest[job.key]
+
+    @staticmethod
+    def _safe(callback, key, value):
+        try: callback(key, value)
+        except Exception as e: print(f"   ⚠️ Persona job callback failed for {key}: {e}")
+
+    def depth(self) -> int:
+        return len(self._pending)
+
+    @property
+    def stats(self) -> dict:
+        with self._cond:
+            return {
+                "workers": self.workers, "alive_workers": sum(t.is_alive() for t in self._threads),
+                "queue_depth": len(self._pending), "max_queue": self.max_queue,
+                **self.counters,
+                "wait": _summary_ms(list(self._wait_times)),
+                "run": _summary_ms(list(self._run_times)),
+            }
@@ -0,0 +1,139 @@
+# rate_limiter.py
+# Sliding-window-counter rate limiter with constant memory per key
+# Each key keeps two counters (current + previous fixed window); the previous window is
+# weighted by how much of it still overlaps the sliding window:
+#   estimate = previous * (1 - elapsed / window) + current
+# Backends: in-process (default) or shared across workers through a Redis-compatible client
+# (RATE_LIMIT_REDIS_URL, needs the `redis` package).
+
+import os
+import time
+import asyncio
+import threading
+
+
+class MemoryBackend:
+    """key -> (window_index, current_count, previous_count); idle keys removed by sweep()."""
+
+    def __init__(self):
+        self._counters = {}
+        self._lock = threading.Lock()
+
+    def hit(self, key: str, limit: int, window: float, now: float) -> bool:
+        index = int(now // window)
+        with self._lock:
+            entry = self._counters.get(key)
+            if entry is None:
+                current, previous = 0, 0
+            elif entry[0] == index:
+                current, previous = entry[1], entry[2]
+            else:
+                current, previous = 0, entry[1] if entry[0] == index - 1 else 0
+            if previous * (1 - (now % window) / window) + current >= limit:
+                return False
+            self._counters[key] = (index, current + 1, previous)
+            return True
+
+    def sweep(self, window: float, now: float) -> int:
+        """Drops keys with no requests in the current or previous window (their estimate is 0)."""
+        stale_before = int(now // window) - 1
+        with self._lock:
+            idle = [k for k, entry in self._counters.items() if entry[0] < stale_before]
+            for k in idle: del self._counters[k]
+        return len(idle)
+
+    def __len__(self):
+        return len(self._counters)
+
+
+class RedisBackend:
+    """
+    Same algorithm on a Redis-compatible client (get/incr/decr/expire/pipeline).
+    Keys: <prefix>:<key>:<window_index>, expiring after two windows, so Redis evicts idle keys itself.
+    """
+
+    def __init__(self, client, prefix: str = "ratelimit"):
+        self.client = client
+        self.prefix = prefix
+
+    def hit(self, key: str, limit: int, window: float, now: float) -> bool:
+        index = int(now // window)
+        elapsed = (now % window) / window
+        current_key = f"{self.prefix}:{key}:{index}"
+        pipe = self.client.pipeline()
+        pipe.get(f"{self.prefix}:{key}:{index - 1}")
+        pipe.incr(current_key)
+        pipe.expire(current_key, int(window * 2))
+        previous, current, _ = pipe.execute()
+        if int(previous or 0) * (1 - elapsed) + int(current) - 1 >= limit:
+            self.client.decr(current_key)  # denied requests don't count
+            return False
+        return True
+
+    def sweep(self, window: float, now: float) -> int:
+        return 0
+
+    def __len__(self):
+        return 0
+
+
+class RateLimiter:
+    """
+    Usage:
+        limiter = RateLimiter(limit=5, window=3600)
+        if not limiter.allow(ip): raise HTTPException(429)
+
+    allow() on a shared (Redis) backend is a network round trip; async callers check
+    `blocking` and run it through io_executor.run_io.
+    """
+
+    def __init__(self, limit: int, window: float, backend=None, sweep_interval: float = 60):
+        self.limit = limit
+        self.window = window
+        self.backend = backend if backend is not None else MemoryBackend()  # RedisBackend has len() 0
+        self.sweep_interval = sweep_interval
+        self.stats = {"allowed": 0, "denied": 0, "errors": 0, "swept": 0}
+
+    def allow(self, key: str) -> bool:
+        try:
+            allowed = self.backend.hit(key, self.limit, self.window, time.time())
+        except Exception as e:
+            # Fail open: a limiter outage must not take scanning down with it
+            self.stats["errors"] += 1
+            print(f"   ⚠️ Rate limiter backend error: {e}")
+            return True
+        self.stats["allowed" if allowed else "denied"] += 1
+        return allowed
+
+    @property
+    def blocking(self) -> bool:
+        return not isinstance(self.backend, MemoryBackend)
+
+    def sweep(self) -> int:
+        removed = self.backend.sweep(self.window, time.time())
+        self.stats["swept"] += removed
+        return removed
+
+    async def run_sweeper(self):
+        """Background task: evicts idle keys every sweep_interval seconds."""
+        while True:
+            await asyncio.sleep(self.sweep_interval)
+            self.sweep()
+
+    def info(self) -> dict:
+        return {**self.stats, "backend": type(self.backend).__name__, "keys": len(self.backend), "limit": self.limit, "window_s": self.window}
+
+
+def create_backend():
+    """RATE_LIMIT_REDIS_URL set -> RedisBackend (shared by all workers), otherwise in-process."""
+    redis_url = os.getenv("RATE_LIMIT_REDIS_URL")
+    if not redis_url: return MemoryBackend()
+    try:
+        import redis
+        client = redis.Redis.from_url(redis_url, socket_timeout=0.5)
+        client.ping()
+        print("   ✅ Rate limiter using Redis")
+        return RedisBackend(client)
+    except Exception as e:
+        print(f"   ⚠️ Redis rate limiter unavailable, using in-process: {e}")
+        return MemoryBackend()
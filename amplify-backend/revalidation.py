@@ -0,0 +1,112 @@
+# revalidation.py
+# Incremental re-scans: per URL we keep the response validators (ETag / Last-Modified), a
+# fingerprint of the page content and the last full result. A re-scan sends a conditional
+# request; on 304, or when the content fingerprint is unchanged (only scripts, styles, nav or
+# footer changed), the previous math + AI result is reused instead of re-running the pipeline.
+
+import os
+import json
+import time
+import sqlite3
+import hashlib
+import threading
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS page_versions (
+    url_hash TEXT PRIMARY KEY,
+    etag TEXT,
+    last_modified TEXT,
+    fingerprint TEXT NOT NULL,
+    result TEXT NOT NULL,
+    context TEXT,
+    updated_at REAL NOT NULL
+);
+"""
+
+
+def content_fingerprint(doc) -> str:
+    """
+    sha256 over what the scorers and the LLM read: title, meta description, headings, JSON-LD
+    and visible text (scripts/styles/nav/footer already stripped), whitespace collapsed.
+    """
+    parts = [doc.title or "", doc.meta.get("description") or ""]
+    parts += [h for tag in sorted(doc.headings) for h in doc.headings[tag]]
+    parts += sorted(doc.json_ld)
+    parts.append(doc.text)
+    normalized = "\x1f".join(" ".join(str(p).split()) for p in parts)
+    return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+
+
+def conditional_headers(known: dict) -> dict:
+    headers = {}
+    if known and known.get("etag"): headers["If-None-Match"] = known["etag"]
+    if known and known.get("last_modified"): headers["If-Modified-Since"] = known["last_modified"]
+    return headers
+
+
+class PageVersionStore:
+    """
+    Usage:
+        store = PageVersionStore(".cache/page_versions.sqlite3", ttl=30 * 86400)
+        known = store.get(url_hash)     # {"etag", "last_modified", "fingerprint", "result", "context"} or None
+        store.put(url_hash, etag, last_modified, fingerprint, result, context)
+
+    Entries older than `ttl` are ignored (and replaced by the next full scan).
+    """
+
+    def __init__(self, path: str, ttl: float = 30 * 86400):
+        self.ttl = ttl
+        if path != ":memory:" and os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None, timeout=5)
+        if path != ":memory:": self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(_SCHEMA)
+        self._lock = threading.Lock()
+        self.stats = {"not_modified": 0, "fingerprint_match": 0, "changed": 0, "unknown": 0, "errors": 0}
+
+    def get(self, url_hash: str):
+        try:
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT etag, last_modified, fingerprint, result, context FROM page_versions WHERE url_hash = ? AND updated_at > ?",
+                    (url_hash, time.time() - self.ttl)).fetchone()
+        except sqlite3.Error as e:
+            self.stats["errors"] += 1
+            print(f"   ⚠️ Page version read error: {e}")
+            return None
+        if row is None: return None
+        return {"etag": row[0], "last_modified": row[1], "fingerprint": row[2],
+                "result": json.loads(row[3]), "context": json.loads(row[4]) if row[4] else None}
+
+    def put(self, url_hash: str, etag, last_modified, fingerprint: str, result: dict, context: dict = None):
+        try:
+            blobs = (json.dumps(result), json.dumps(context) if context is not None else None)
+            with self._lock:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO page_versions (url_hash, etag, last_modified, fingerprint, result, context, updated_at) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (url_hash, etag, last_modified, fingerprint, *blobs, time.time()))
+        except (sqlite3.Error, TypeError, ValueError) as e:
+            self.stats["errors"] += 1
+            print(f"   ⚠️ Page version write error: {e}")
+
+    def record(self, outcome: str):
+        self.stats[outcome] += 1
+
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def get_page_versions():
+    """
+    Shared store at PAGE_VERSIONS_PATH (default .cache/page_versions.sqlite3), or None when
+    PAGE_VERSIONS_PATH is "off". Entries are trusted for PAGE_VERSIONS_TTL seconds (default 30 days).
+    """
+    global _store
+    path = os.getenv("PAGE_VERSIONS_PATH", os.path.join(".cache", "page_versions.sqlite3"))
+    if path.lower() == "off": return None
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                _store = PageVersionStore(path, ttl=float(os.getenv("PAGE_VERSIONS_TTL", str(30 * 86400))))
+    return _store
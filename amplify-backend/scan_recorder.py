@@ -0,0 +1,328 @@
+# scan_recorder.py
+# Record-and-replay of a scan's external I/O, for offline load tests of /analyze
+#   record: page fetches (curl_cffi and Playwright), upstream LLM calls (cache misses) and Supabase
+#           requests are stored with their latency in a compact archive (SQLite; payloads are
+#           zlib-compressed JSON, stored once per distinct content)
+#   replay: the same boundaries answer from the archive after waiting the recorded latency;
+#           no site, LLM provider or database is contacted
+# SCAN_RECORDER=off|record|replay (default off), SCAN_ARCHIVE_PATH, SCAN_REPLAY_SPEED (1.0)
+
+import os
+import json
+import time
+import zlib
+import asyncio
+import sqlite3
+import hashlib
+import itertools
+import threading
+from types import SimpleNamespace
+from urllib.parse import urlsplit, urlunsplit
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS payloads (
+    digest TEXT PRIMARY KEY,
+    data BLOB NOT NULL
+);
+CREATE TABLE IF NOT EXISTS calls (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    kind TEXT NOT NULL,
+    pool TEXT NOT NULL,
+    key TEXT NOT NULL,
+    latency REAL NOT NULL,
+    digest TEXT,
+    error TEXT,
+    recorded_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS calls_kind_key ON calls (kind, key);
+"""
+
+DB_VERBS = ("select", "insert", "upsert", "update", "delete")
+
+
+class ReplayMiss(LookupError):
+    """Nothing recorded for this call (not even a substitute of the same kind)."""
+
+
+class ReplayedError(RuntimeError):
+    """A call that failed while recording fails again, after the same latency."""
+
+
+def page_key(url: str) -> str:
+    """Fetches are keyed by URL without the fragment (never sent to the server); "" path -> "/"."""
+    if not url.startswith("http"): url = "https://" + url
+    parts = urlsplit(url)
+    return urlunsplit((parts.scheme, parts.netloc.lower(), parts.path or "/", parts.query, ""))
+
+
+def llm_key(model: str, temperature: float, prompt: str) -> tuple:
+    """(pool, key): responses for one model/temperature can stand in for each other on replay."""
+    from llm_cache import cache_key, temperature_key
+    return f"{model}|{temperature_key(temperature)}", cache_key(model, temperature, prompt)
+
+
+class ScanArchive:
+    """
+    Usage:
+        archive = ScanArchive("scans.sqlite3")
+        archive.add("fetch", pool, key, latency=0.41, value=page, request={...})
+        calls = archive.calls()      # [(kind, pool, key, latency, digest, error)] in recording order
+        archive.payload(digest)      # {"request": ..., "value": ...}
+
+    Identical payloads (the same page fetched twice, a repeated DB response) are stored once.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        if path != ":memory:" and os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None, timeout=5)
+        if path != ":memory:":
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        self._lock = threading.Lock()
+
+    def add(self, kind: str, pool: str, key: str, latency: float, value=None, request=None, error: str = None):
+        digest = None
+        if error is None:
+            raw = json.dumps({"request": request, "value": value}, separators=(",", ":"), sort_keys=True, default=str).encode("utf-8")
+            digest = hashlib.sha256(raw).hexdigest()
+            data = zlib.compress(raw, 6)
+        with self._lock:
+            if digest is not None:
+                self._conn.execute("INSERT OR IGNORE INTO payloads (digest, data) VALUES (?, ?)", (digest, data))
+            self._conn.execute("INSERT INTO calls (kind, pool, key, latency, digest, error, recorded_at) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                               (kind, pool, key, latency, digest, error, time.time()))
+
+    def calls(self) -> list:
+        with self._lock:
+            return self._conn.execute("SELECT kind, pool, key, latency, digest, error FROM calls ORDER BY id").fetchall()
+
+    def payload(self, digest: str) -> dict:
+        with self._lock:
+            row = self._conn.execute("SELECT data FROM payloads WHERE digest = ?", (digest,)).fetchone()
+        if row is None: raise ReplayMiss(f"payload {digest} missing from archive")
+        return json.loads(zlib.decompress(row[0]))
+
+    def summary(self) -> dict:
+        with self._lock:
+            kinds = self._conn.execute("SELECT kind, COUNT(*), COUNT(DISTINCT key), COALESCE(AVG(latency), 0), SUM(error IS NOT NULL) FROM calls GROUP BY kind").fetchall()
+            stored, blobs = self._conn.execute("SELECT COALESCE(SUM(LENGTH(data)), 0), COUNT(*) FROM payloads").fetchone()
+        return {
+            "calls": {kind: {"count": n, "distinct": distinct, "mean_latency_ms": round(mean * 1000, 1), "errors": errors}
+                      for kind, n, distinct, mean, errors in kinds},
+            "payloads": blobs, "stored_bytes": stored,
+        }
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+class ScanRecorder:
+    """
+    Usage:
+        recorder = get_scan_recorder()
+        page = recorder.fetch(client.fetch, url, headers=...)     # blocking (run it through run_io)
+        html = await recorder.render(render_page, url)             # Playwright
+        value = recorder.llm(model, temperature, prompt, call)      # inside cached_llm_call, on a miss
+        supabase = recorder.wrap_db(supabase)
+
+    mode "off" calls straight through. On replay a call is answered by the recordings with the
+    same key, in recording order (cycling); when there are none, recordings from the same pool
+    (any fetched page, same LLM model/temperature, same table operation) stand in, so scans of
+    URLs that were never recorded still produce realistic work. Recorded latencies are divided
+    by `speed`.
+    """
+
+    def __init__(self, mode: str = "off", archive: ScanArchive = None, speed: float = 1.0):
+        if mode not in ("off", "record", "replay"): raise ValueError(f"unknown SCAN_RECORDER mode: {mode}")
+        if mode != "off" and archive is None: raise ValueError(f"SCAN_RECORDER={mode} needs an archive")
+        self.mode = mode
+        self.archive = archive
+        self.speed = speed
+        self._by_key = None
+        self._by_pool = None
+        self._payloads = {}
+        self._load_lock = threading.Lock()
+        self.stats = {"recorded": 0, "replayed": 0, "substituted": 0, "missed": 0, "errors_replayed": 0}
+
+    @property
+    def active(self) -> bool:
+        return self.mode != "off"
+
+    # --- record ---
+    def _record(self, kind: str, pool: str, key: str, t0: float, value=None, request=None, error: Exception = None):
+        try:
+            self.archive.add(kind, pool, key, time.perf_counter() - t0, value=value, request=request,
+                             error=None if error is None else f"{type(error).__name__}: {error}")
+            self.stats["recorded"] += 1
+        except (sqlite3.Error, TypeError, ValueError) as e:
+            print(f"   ⚠️ Scan archive write error: {e}")
+
+    def _call(self, kind: str, pool: str, key: str, request, fn, *args, encode=lambda v: v, **kwargs):
+        if self.mode == "replay": return self._replay_sync(kind, pool, key)
+        if self.mode == "off": return fn(*args, **kwargs)
+        t0 = time.perf_counter()
+        try:
+            value = fn(*args, **kwargs)
+        except Exception as e:
+            self._record(kind, pool, key, t0, request=request, error=e)
+            raise
+        self._record(kind, pool, key, t0, value=encode(value), request=request)
+        return value
+
+    # --- replay ---
+    def _load(self):
+        with self._load_lock:
+            if self._by_key is not None: return
+            by_key, by_pool = {}, {}
+            for kind, pool, key, latency, digest, error in self.archive.calls():
+                call = (latency, digest, error)
+                by_key.setdefault((kind, key), []).append(call)
+                by_pool.setdefault((kind, pool), []).append(call)
+            self._by_key = {k: (calls, itertools.count()) for k, calls in by_key.items()}
+            self._by_pool = {k: (calls, itertools.count()) for k, calls in by_pool.items()}
+            print(f"   ▶️ Replaying {sum(len(c) for c, _ in self._by_key.values())} recorded calls from {self.archive.path}")
+
+    def _pick(self, kind: str, pool: str, key: str) -> tuple:
+        if self._by_key is None: self._load()
+        entry = self._by_key.get((kind, key))
+        if entry is None:
+            entry = self._by_pool.get((kind, pool))
+            if entry is None:
+                self.stats["missed"] += 1
+                raise ReplayMiss(f"no recorded {kind} call for {key}")
+            self.stats["substituted"] += 1
+        calls, counter = entry
+        return calls[next(counter) % len(calls)]
+
+    def _answer(self, call: tuple):
+        _, digest, error = call
+        if error is not None:
+            self.stats["errors_replayed"] += 1
+            raise ReplayedError(error)
+        value = self._payloads.get(digest)
+        if value is None: value = self._payloads[digest] = self.archive.payload(digest)["value"]
+        self.stats["replayed"] += 1
+        return value
+
+    def _replay_sync(self, kind: str, pool: str, key: str):
+        call = self._pick(kind, pool, key)
+        time.sleep(call[0] / self.speed)
+        return self._answer(call)
+
+    async def _replay_async(self, kind: str, pool: str, key: str):
+        call = self._pick(kind, pool, key)
+        await asyncio.sleep(call[0] / self.speed)
+        return self._answer(call)
+
+    # --- boundaries ---
+    def fetch(self, fetch, url: str, **kwargs) -> dict:
+        """ScraperClient.fetch; headers are stored lower-cased so replayed pages answer .get("etag")."""
+        encode = lambda page: {**page, "headers": {k.lower(): v for k, v in dict(page["headers"]).items()}}
+        return self._call("fetch", "page", page_key(url), {"headers": kwargs.get("headers")}, fetch, url, encode=encode, **kwargs)
+
+    async def render(self, render, url: str) -> str:
+        """Rendered HTML of a Playwright fallback."""
+        key = page_key(url)
+        if self.mode == "replay": return await self._replay_async("render", "page", key)
+        if self.mode == "off": return await render(url)
+        t0 = time.perf_counter()
+        try:
+            html = await render(url)
+        except Exception as e:
+            self._record("render", "page", key, t0, error=e)
+            raise
+        self._record("render", "page", key, t0, value=html)
+        return html
+
+    def llm(self, model: str, temperature: float, prompt: str, call):
+        pool, key = llm_key(model, temperature, prompt)
+        return self._call("llm", pool, key, {"model": model, "temperature": temperature, "prompt": prompt}, call)
+
+    def wrap_db(self, client):
+        """Supabase client to use: unchanged when off, recorded when configured, a stand-in on replay."""
+        if self.mode == "off" or (self.mode == "record" and client is None) or isinstance(client, RecordedDB): return client
+        return RecordedDB(self, client if self.mode == "record" else None)
+
+    def info(self) -> dict:
+        info = {"mode": self.mode, **self.stats}
+        if self.archive is not None: info["archive"] = self.archive.path
+        return info
+
+
+class RecordedDB:
+    """
+    Supabase client shape used by the API: `table(name).<verb>(...)...execute()` and `rpc(name, params).execute()`.
+    Each execute() is keyed by "<table>.<verb>" ("rpc.<name>"); replay returns an object with
+    `.data` / `.count` like a PostgREST response.
+    """
+
+    def __init__(self, recorder: ScanRecorder, client=None):
+        self._recorder = recorder
+        self._client = client
+
+    def table(self, name: str):
+        return _RecordedQuery(self._recorder, name, self._client.table(name) if self._client is not None else None)
+
+    def rpc(self, name: str, params: dict = None):
+        target = self._client.rpc(name, params) if self._client is not None else None
+        return _RecordedQuery(self._recorder, "rpc", target, op=f"rpc.{name}", request=params)
+
+    def load(self):
+        if self._client is not None and hasattr(self._client, "load"): self._client.load()
+
+    def __repr__(self) -> str:
+        return f"<RecordedDB {self._recorder.mode} {self._client!r}>"
+
+
+class _RecordedQuery:
+    def __init__(self, recorder: ScanRecorder, table: str, target, op: str = None, request=None):
+        self._recorder = recorder
+        self._table = table
+        self._target = target
+        self._op = op
+        self._request = request
+
+    def __getattr__(self, name: str):
+        def step(*args, **kwargs):
+            target = getattr(self._target, name)(*args, **kwargs) if self._target is not None else None
+            op, request = self._op, self._request
+            if op is None and name in DB_VERBS:
+                op, request = f"{self._table}.{name}", {"args": list(args), **kwargs}
+            return _RecordedQuery(self._recorder, self._table, target, op, request)
+        return step
+
+    def execute(self):
+        op = self._op or f"{self._table}.query"
+        if self._recorder.mode == "replay":
+            value = self._recorder._replay_sync("db", op, op)
+            return SimpleNamespace(data=value.get("data"), count=value.get("count"))
+        encode = lambda resp: {"data": resp.data, "count": getattr(resp, "count", None)}
+        return self._recorder._call("db", op, op, self._request, self._target.execute, encode=encode)
+
+
+_recorder = None
+_recorder_lock = threading.Lock()
+
+
+def get_scan_recorder() -> ScanRecorder:
+    """
+    Process-wide recorder from SCAN_RECORDER (off | record | replay), SCAN_ARCHIVE_PATH
+    (default .cache/scan_archive.sqlite3) and SCAN_REPLAY_SPEED (recorded latency divisor, 1.0).
+    """
+    global _recorder
+    if _recorder is None:
+        with _recorder_lock:
+            if _recorder is None:
+                mode = os.getenv("SCAN_RECORDER", "off").lower()
+                archive = None
+                if mode != "off":
+                    path = os.getenv("SCAN_ARCHIVE_PATH", os.path.join(".cache", "scan_archive.sqlite3"))
+                    if mode == "replay" and not os.path.exists(path): raise FileNotFoundError(f"SCAN_RECORDER=replay: no archive at {path}")
+                    archive = ScanArchive(path)
+                    print(f"   🎞️ Scan recorder: {mode} ({path})")
+                _recorder = ScanRecorder(mode, archive, speed=float(os.getenv("SCAN_REPLAY_SPEED", "1.0")))
+    return _recorder
@@ -0,0 +1,111 @@
+# score_pool.py
+# Process pool for the CPU-bound math scoring stage (HTML parse, text analysis, regex scorers)
+# Pages cross the process boundary as one zlib-compressed UTF-8 payload instead of pickled str
+# objects; each child loads lexicons and compiles the keyword matcher once, at pool start.
+# On by default when there is a core to spare (min(2, cpus - 1) children); with one CPU, or
+# SCORE_POOL_WORKERS=0, scoring runs inline on the io_executor threads, never on the event loop.
+# Children are spawned and import only the scorers.
+
+import os
+import zlib
+import multiprocessing
+import asyncio
+import struct
+from concurrent.futures import ProcessPoolExecutor
+
+def _default_workers() -> int:
+    cpus = os.cpu_count() or 1
+    return min(2, cpus - 1) if cpus > 1 else 0
+
+
+SCORE_POOL_WORKERS = int(os.getenv("SCORE_POOL_WORKERS") or _default_workers())
+SCORE_POOL_MAX_TASKS_PER_CHILD = int(os.getenv("SCORE_POOL_MAX_TASKS_PER_CHILD", "500"))
+SCORE_POOL_COMPRESS_OVER = 16_384  # smaller payloads are not worth compressing
+
+_pool = None
+
+
+def pack_page(html: str, text: str, url: str) -> bytes:
+    """[flag][len(html)][len(text)] + html + text + url, zlib level 1 when large."""
+    parts = [html.encode("utf-8", "replace"), text.encode("utf-8", "replace"), url.encode("utf-8", "replace")]
+    body = b"".join(parts)
+    compressed = len(body) > SCORE_POOL_COMPRESS_OVER
+    if compressed: body = zlib.compress(body, 1)
+    return struct.pack("!BII", compressed, len(parts[0]), len(parts[1])) + body
+
+
+def unpack_page(payload: bytes) -> tuple:
+    compressed, html_len, text_len = struct.unpack_from("!BII", payload)
+    body = payload[struct.calcsize("!BII"):]
+    if compressed: body = zlib.decompress(body)
+    html = body[:html_len].decode("utf-8")
+    text = body[html_len:html_len + text_len].decode("utf-8")
+    return html, text, body[html_len + text_len:].decode("utf-8")
+
+
+def _warm_child():
+    """Runs once in each child: imports the scorers, loads lexicons, compiles the matcher."""
+    import scoring_engine
+    from text_analysis import load_lexicons, LexiconUnavailable
+    from keyword_matcher import build_signal_matcher
+    try: load_lexicons()
+    except LexiconUnavailable: pass  # logged; the child scores with the TextBlob pipeline
+    build_signal_matcher()
+    scoring_engine.calculate_math_score("<html><title>warm up</title><body><p>Warm up.</p></body></html>", "Warm up.", "https://warmup.local")
+
+
+def _score_packed(payload: bytes) -> tuple:
+    from scoring_engine import calculate_math_score
+    html, text, url = unpack_page(payload)
+    timings = {}
+    return calculate_math_score(html, text, url, timings=timings), timings
+
+
+def _ready() -> int:
+    return os.getpid()
+
+
+def get_score_pool():
+    """
+    Shared pool of SCORE_POOL_WORKERS processes, or None when it is 0 (the default on a
+    single CPU: scoring then runs on a thread). Children are replaced after
+    SCORE_POOL_MAX_TASKS_PER_CHILD pages.
+    """
+    global _pool
+    if _pool is None and SCORE_POOL_WORKERS > 0:
+        _pool = ProcessPoolExecutor(max_workers=SCORE_POOL_WORKERS, initializer=_warm_child, mp_context=multiprocessing.get_context("spawn"),
+                                    max_tasks_per_child=SCORE_POOL_MAX_TASKS_PER_CHILD or None)
+    return _pool
+
+
+async def start_score_pool():
+    """Starts every child now (each runs _warm_child) so the first scans do not pay for it."""
+    pool = get_score_pool()
+    if pool is None: return
+    loop = asyncio.get_running_loop()
+    await asyncio.gather(*(loop.run_in_executor(pool, _ready) for _ in range(SCORE_POOL_WORKERS)))
+
+
+async def score_page(html: str, text: str, url: str, doc=None, timings: dict = None) -> dict:
+    """
+    calculate_math_score in a worker process (which parses the page again) when the pool is
+    on, otherwise on an io_executor thread reusing `doc`.
+    `timings`, when given, receives the per-step seconds measured where the scoring ran.
+    """
+    pool = get_score_pool()
+    if pool is None:
+        from io_executor import run_io
+        from scoring_engine import calculate_math_score
+        return await run_io(calculate_math_score, html, text, url, doc=doc, timings=timings)
+    loop = asyncio.get_running_loop()
+    from scoring_engine import SCORE_HTML_LIMIT
+    result, child_timings = await loop.run_in_executor(pool, _score_packed, pack_page(html[:SCORE_HTML_LIMIT], text, url))
+    if timings is not None: timings.update(child_timings)
+    return result
+
+
+def shutdown_score_pool():
+    global _pool
+    if _pool is not None:
+        _pool.shutdown(wait=False, cancel_futures=True)
+        _pool = None
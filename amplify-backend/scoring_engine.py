@@ -2,18 +2,53 @@
 # Math-based scoring engine - 60% of total score (0-60 points)
 # No AI calls, instant execution, zero hallucination
 
-import re
-import json
+import time
 import hashlib
-from bs4 import BeautifulSoup
-from textblob import TextBlob
-from urllib.parse import urlparse
+from page_document import PageDocument
+from keyword_matcher import register_signals, match_signals
+from text_analysis import analyze_text
+
+# The HTML scorers look at the first 50,000 characters of a page (text comes from the whole page)
+SCORE_HTML_LIMIT = 50_000
+
+# ═══════════════════════════════════════════════════════════════════════════
+# TEXT SIGNAL DICTIONARIES (matched in one pass via keyword_matcher)
+# ═══════════════════════════════════════════════════════════════════════════
+
+TRUST_PHRASES = [
+    'trusted by', 'case study', 'testimonial', 'review',
+    'client', 'customer', 'partner', 'award', 'certified',
+    'featured in', 'as seen', 'enterprise', 'security'
+]
+CONTACT_SIGNALS = ['contact', 'email', 'phone', 'address', 'location']
+FAQ_INDICATORS = ['faq', 'frequently asked', 'common questions', 'q&a']
+QUESTION_PATTERNS = ['what ', 'how ', 'why ', 'when ', 'where ', 'who ', 'can ', 'does ', 'is ']
+ENTITY_INDICATORS = ['we ', 'our ', 'us ', ' inc', ' llc', ' ltd', 'founded', 'established']
+ANSWERABLE_PATTERNS = {
+    "what_is": ["is a", "are a", "means", "defined as", "refers to"],
+    "how_to": ["how to", "steps", "guide", "process", "method"],
+    "why": ["because", "reason", "benefit", "advantage"],
+    "comparison": ["vs", "versus", "compared to", "better than", "difference"],
+    "cost": ["price", "cost", "pricing", "$", "free", "subscription"],
+    "location": ["located", "address", "find us", "visit", "hours"],
+    "contact": ["contact", "email", "phone", "call", "reach"],
+    "reviews": ["review", "testimonial", "rating", "feedback"]
+}
+
+register_signals("scoring", {
+    "trust": TRUST_PHRASES,
+    "contact": CONTACT_SIGNALS,
+    "faq": FAQ_INDICATORS,
+    "question": QUESTION_PATTERNS,
+    "entity": ENTITY_INDICATORS,
+    **{f"answerable_{query_type}": indicators for query_type, indicators in ANSWERABLE_PATTERNS.items()},
+})
 
 # ═══════════════════════════════════════════════════════════════════════════
 # SECTION 1: TECHNICAL SEO SCORE (0-15 points)
 # ═══════════════════════════════════════════════════════════════════════════
 
-def calculate_technical_score(html_content: str, url: str) -> dict:
+def calculate_technical_score(html_content: str, url: str, doc: PageDocument = None) -> dict:
     """
     Pure math scoring for technical SEO signals.
     No AI, no tokens, instant execution.
@@ -22,12 +57,12 @@ def calculate_technical_score(html_content: str, url: str) -> dict:
     factors = {}
     
     try:
-        soup = BeautifulSoup(html_content, 'html.parser')
+        doc = doc or PageDocument(html_content)
         
         # 1. Meta Description (0-3 points)
-        meta = soup.find('meta', attrs={'name': 'description'})
-        if meta and meta.get('content'):
-            meta_len = len(meta['content'])
+        meta_content = doc.meta.get('description')
+        if meta_content:
+            meta_len = len(meta_content)
             if 120 <= meta_len <= 160:
                 score += 3
                 factors['meta_description'] = {'score': 3, 'status': 'optimal', 'length': meta_len}
@@ -41,9 +76,8 @@ def calculate_technical_score(html_content: str, url: str) -> dict:
             factors['meta_description'] = {'score': 0, 'status': 'missing'}
         
         # 2. Title Tag (0-3 points)
-        title = soup.find('title')
-        if title and title.string:
-            title_len = len(title.string.strip())
+        if doc.title:
+            title_len = len(doc.title.strip())
             if 30 <= title_len <= 60:
                 score += 3
                 factors['title_tag'] = {'score': 3, 'status': 'optimal', 'length': title_len}
@@ -54,7 +88,7 @@ def calculate_technical_score(html_content: str, url: str) -> dict:
             factors['title_tag'] = {'score': 0, 'status': 'missing'}
         
         # 3. Schema Markup (0-3 points)
-        schema_scripts = soup.find_all('script', type='application/ld+json')
+        schema_scripts = doc.json_ld
         if len(schema_scripts) >= 2:
             score += 3
             factors['schema_markup'] = {'score': 3, 'status': 'rich', 'count': len(schema_scripts)}
@@ -65,8 +99,8 @@ def calculate_technical_score(html_content: str, url: str) -> dict:
             factors['schema_markup'] = {'score': 0, 'status': 'missing', 'count': 0}
         
         # 4. Heading Structure (0-3 points)
-        h1_count = len(soup.find_all('h1'))
-        h2_count = len(soup.find_all('h2'))
+        h1_count = len(doc.headings['h1'])
+        h2_count = len(doc.headings['h2'])
         if h1_count == 1 and h2_count >= 2:
             score += 3
             factors['heading_structure'] = {'score': 3, 'status': 'optimal', 'h1': h1_count, 'h2': h2_count}
@@ -97,9 +131,10 @@ def calculate_technical_score(html_content: str, url: str) -> dict:
 # SECTION 2: CONTENT QUALITY SCORE (0-15 points)
 # ═══════════════════════════════════════════════════════════════════════════
 
-def calculate_content_score(text: str) -> dict:
+def calculate_content_score(text: str, doc: PageDocument = None) -> dict:
     """
-    NLP-based content analysis using TextBlob (FREE, local).
+    NLP-based content analysis (FREE, local) via text_analysis:
+    lexicon tagger by default, TextBlob with TEXT_ANALYZER=textblob.
     No API calls, instant execution.
     """
     score = 0
@@ -120,14 +155,10 @@ def calculate_content_score(text: str) -> dict:
         else:
             factors['word_count'] = {'score': 0, 'value': word_count, 'status': 'empty'}
         
-        # 2. Information Density (0-5 points) - TextBlob POS tagging
-        blob = TextBlob(text[:3000])  # Limit for speed
+        # 2. Information Density (0-5 points) - POS tagging
+        analysis = analyze_text(text[:3000])  # Limit for speed
         
-        meaningful_tags = ['NN', 'NNS', 'NNP', 'NNPS', 'VB', 'VBD', 'VBG', 'VBN', 'VBP', 'VBZ']
-        meaningful_count = sum(1 for word, tag in blob.tags if tag in meaningful_tags)
-        total_words = len(blob.words) or 1
-        
-        density_ratio = meaningful_count / total_words
+        density_ratio = analysis['density']
         
         if density_ratio >= 0.45:
             score += 5
@@ -142,7 +173,7 @@ def calculate_content_score(text: str) -> dict:
             factors['info_density'] = {'score': 0, 'ratio': round(density_ratio, 2), 'status': 'noise'}
         
         # 3. Readability (0-3 points)
-        sentence_count = len(blob.sentences) or 1
+        sentence_count = analysis['sentence_count'] or 1
         avg_sentence_length = word_count / sentence_count
         
         if 12 <= avg_sentence_length <= 22:
@@ -156,7 +187,7 @@ def calculate_content_score(text: str) -> dict:
             factors['readability'] = {'score': 1, 'avg_sentence': round(avg_sentence_length, 1), 'status': 'poor'}
         
         # 4. Sentiment Confidence (0-3 points)
-        sentiment = blob.sentiment.polarity
+        sentiment = analysis['polarity']
         
         if sentiment >= 0.2:
             score += 3
@@ -182,7 +213,7 @@ def calculate_content_score(text: str) -> dict:
 # SECTION 3: AUTHORITY SIGNALS SCORE (0-15 points)
 # ═══════════════════════════════════════════════════════════════════════════
 
-def calculate_authority_score(html_content: str, text: str) -> dict:
+def calculate_authority_score(html_content: str, text: str, doc: PageDocument = None) -> dict:
     """
     Detects trust signals using pattern matching.
     No AI, instant, deterministic.
@@ -191,8 +222,8 @@ def calculate_authority_score(html_content: str, text: str) -> dict:
     factors = {}
     
     try:
-        text_lower = text.lower()
-        html_lower = html_content.lower()
+        text_lower = doc.text_lower if doc else text.lower()
+        html_lower = doc.html_lower if doc else html_content.lower()
         
         # 1. Social Proof Links (0-4 points)
         social_platforms = {
@@ -219,13 +250,8 @@ def calculate_authority_score(html_content: str, text: str) -> dict:
         }
         
         # 2. Trust Language (0-5 points)
-        trust_phrases = [
-            'trusted by', 'case study', 'testimonial', 'review',
-            'client', 'customer', 'partner', 'award', 'certified',
-            'featured in', 'as seen', 'enterprise', 'security'
-        ]
-        
-        found_trust = [phrase for phrase in trust_phrases if phrase in text_lower]
+        hits = match_signals(doc.text if doc else text)
+        found_trust = hits.found("scoring:trust")
         trust_score = min(len(found_trust) * 2, 5)
         score += trust_score
         factors['trust_signals'] = {
@@ -257,8 +283,7 @@ def calculate_authority_score(html_content: str, text: str) -> dict:
         }
         
         # 4. Contact Transparency (0-3 points)
-        contact_signals = ['contact', 'email', 'phone', 'address', 'location']
-        found_contact = [c for c in contact_signals if c in text_lower]
+        found_contact = hits.found("scoring:contact")
         
         contact_score = min(len(found_contact), 3)
         score += contact_score
@@ -282,7 +307,7 @@ def calculate_authority_score(html_content: str, text: str) -> dict:
 # SECTION 4: AI DISCOVERABILITY SCORE (0-10 points)
 # ═══════════════════════════════════════════════════════════════════════════
 
-def calculate_ai_discoverability_score(html_content: str, text: str) -> dict:
+def calculate_ai_discoverability_score(html_content: str, text: str, doc: PageDocument = None) -> dict:
     """
     Measures how well optimized for AI search engines.
     Based on FAQ, schema, entities, conversational patterns.
@@ -291,13 +316,12 @@ def calculate_ai_discoverability_score(html_content: str, text: str) -> dict:
     factors = {}
     
     try:
-        soup = BeautifulSoup(html_content, 'html.parser')
-        text_lower = text.lower()
+        doc = doc or PageDocument(html_content, text=text)
         
         # 1. FAQ Detection (0-3 points)
-        faq_indicators = ['faq', 'frequently asked', 'common questions', 'q&a']
-        has_faq_text = any(f in text_lower for f in faq_indicators)
-        has_faq_schema = 'faqpage' in html_content.lower()
+        hits = match_signals(doc.text)
+        has_faq_text = hits.any("scoring:faq")
+        has_faq_schema = 'faqpage' in doc.html_lower
         
         if has_faq_schema:
             score += 3
@@ -309,21 +333,20 @@ def calculate_ai_discoverability_score(html_content: str, text: str) -> dict:
             factors['faq_section'] = {'score': 0, 'status': 'missing'}
         
         # 2. Clear Value Proposition (0-3 points)
-        h1 = soup.find('h1')
-        meta_desc = soup.find('meta', attrs={'name': 'description'})
+        h1_texts = doc.headings['h1']
+        meta_desc = doc.meta.get('description')
         
         clarity_score = 0
-        if h1 and len(h1.get_text().strip()) > 10:
+        if h1_texts and len(h1_texts[0].strip()) > 10:
             clarity_score += 1
-        if meta_desc and meta_desc.get('content') and len(meta_desc['content']) > 80:
+        if meta_desc and len(meta_desc) > 80:
             clarity_score += 2
         
         score += clarity_score
         factors['value_clarity'] = {'score': clarity_score, 'max': 3}
         
         # 3. Conversational Content (0-2 points)
-        question_patterns = ['what ', 'how ', 'why ', 'when ', 'where ', 'who ', 'can ', 'does ', 'is ']
-        question_count = sum(1 for q in question_patterns if q in text_lower)
+        question_count = hits.count("scoring:question")
         
         if question_count >= 5:
             conv_score = 2
@@ -336,8 +359,7 @@ def calculate_ai_discoverability_score(html_content: str, text: str) -> dict:
         factors['conversational_content'] = {'score': conv_score, 'question_patterns': question_count}
         
         # 4. Entity Mentions (0-2 points)
-        entity_indicators = ['we ', 'our ', 'us ', ' inc', ' llc', ' ltd', 'founded', 'established']
-        entity_count = sum(1 for e in entity_indicators if e in text_lower)
+        entity_count = hits.count("scoring:entity")
         
         if entity_count >= 3:
             entity_score = 2
@@ -363,7 +385,7 @@ def calculate_ai_discoverability_score(html_content: str, text: str) -> dict:
 # SECTION 5: CONTENT ANSWERABILITY SCORE (0-5 points) - NEW!
 # ═══════════════════════════════════════════════════════════════════════════
 
-def calculate_answerability_score(text: str) -> dict:
+def calculate_answerability_score(text: str, doc: PageDocument = None) -> dict:
     """
     Measures how many TYPES of questions the content could answer.
     Proxy for "query coverage" without expensive embeddings.
@@ -372,30 +394,19 @@ def calculate_answerability_score(text: str) -> dict:
     factors = {}
     
     try:
-        text_lower = text.lower()
-        
-        answerable_patterns = {
-            "what_is": ["is a", "are a", "means", "defined as", "refers to"],
-            "how_to": ["how to", "steps", "guide", "process", "method"],
-            "why": ["because", "reason", "benefit", "advantage"],
-            "comparison": ["vs", "versus", "compared to", "better than", "difference"],
-            "cost": ["price", "cost", "pricing", "$", "free", "subscription"],
-            "location": ["located", "address", "find us", "visit", "hours"],
-            "contact": ["contact", "email", "phone", "call", "reach"],
-            "reviews": ["review", "testimonial", "rating", "feedback"]
-        }
+        hits = match_signals(doc.text if doc else text)
         
         covered_types = []
         
-        for query_type, indicators in answerable_patterns.items():
-            if any(ind in text_lower for ind in indicators):
+        for query_type in ANSWERABLE_PATTERNS:
+            if hits.any(f"scoring:answerable_{query_type}"):
                 covered_types.append(query_type)
         
-        coverage_ratio = len(covered_types) / len(answerable_patterns)
+        coverage_ratio = len(covered_types) / len(ANSWERABLE_PATTERNS)
         score = round(coverage_ratio * 5)
         
         factors['covered_types'] = covered_types
-        factors['missing_types'] = [t for t in answerable_patterns.keys() if t not in covered_types]
+        factors['missing_types'] = [t for t in ANSWERABLE_PATTERNS.keys() if t not in covered_types]
         factors['coverage_ratio'] = round(coverage_ratio, 2)
         
     except Exception as e:
@@ -427,16 +438,32 @@ def calculate_url_variance(url: str) -> int:
 # SECTION 7: MAIN AGGREGATOR
 # ═══════════════════════════════════════════════════════════════════════════
 
-def calculate_math_score(html_content: str, text: str, url: str) -> dict:
+def _timed(name: str, fn, *args, timings: dict = None, **kwargs):
+    """fn(*args, **kwargs), recording its duration in `timings[name]` when timings is given."""
+    if timings is None: return fn(*args, **kwargs)
+    t0 = time.perf_counter()
+    result = fn(*args, **kwargs)
+    timings[name] = time.perf_counter() - t0
+    return result
+
+
+def calculate_math_score(html_content: str, text: str, url: str, doc: PageDocument = None, timings: dict = None) -> dict:
     """
     Calculates 60% of final score using pure math.
     Returns detailed breakdown for transparency.
+    Pass the scraper's PageDocument to skip re-parsing the HTML; pages longer than
+    SCORE_HTML_LIMIT are re-parsed from their first SCORE_HTML_LIMIT characters instead.
+    Pass a `timings` dict to receive seconds per step (html_parse when parsed here, then each scorer).
     """
-    technical = calculate_technical_score(html_content, url)
-    content = calculate_content_score(text)
-    authority = calculate_authority_score(html_content, text)
-    ai_disc = calculate_ai_discoverability_score(html_content, text)
-    answerability = calculate_answerability_score(text)
+    if len(html_content) > SCORE_HTML_LIMIT:
+        html_content = html_content[:SCORE_HTML_LIMIT]
+        if doc is not None and len(doc.html) > SCORE_HTML_LIMIT: doc = None
+    doc = doc or _timed("html_parse", PageDocument, html_content, text=text, timings=timings)
+    technical = _timed("technical", calculate_technical_score, html_content, url, doc=doc, timings=timings)
+    content = _timed("content", calculate_content_score, text, doc=doc, timings=timings)
+    authority = _timed("authority", calculate_authority_score, html_content, text, doc=doc, timings=timings)
+    ai_disc = _timed("ai_discoverability", calculate_ai_discoverability_score, html_content, text, doc=doc, timings=timings)
+    answerability = _timed("answerability", calculate_answerability_score, text, doc=doc, timings=timings)
     variance = calculate_url_variance(url)
     
     base_score = (
@@ -0,0 +1,133 @@
+# scraper_client.py
+# Shared curl_cffi sessions for page fetches: keep-alive connections, TLS sessions and DNS
+# answers are reused across scans instead of a fresh handshake per request.
+# Created once at startup (main lifespan), closed on shutdown.
+
+import os
+import queue
+import threading
+from contextlib import contextmanager
+from urllib.parse import urlparse
+
+from html_fetch import fetch_html
+
+
+class ScraperClient:
+    """
+    Usage:
+        client = ScraperClient()
+        page = client.fetch(url, headers={...})   # html_fetch.fetch_html dict (status_code, headers, html, ...)
+        client.close()
+
+    Blocking; call it through run_io. At most `max_sessions` fetches run at once (each session
+    keeps its own connection cache; idle sessions are reused most-recent-first so warm
+    connections stay warm) and at most `per_host` per host.
+
+    Env: SCRAPER_MAX_SESSIONS (16), SCRAPER_PER_HOST (6), SCRAPER_CONNECT_TIMEOUT (4 s),
+    SCRAPER_READ_TIMEOUT (8 s), SCRAPER_DNS_CACHE_TTL (300 s), SCRAPER_HTTP2 (1),
+    SCRAPER_IMPERSONATE (chrome110).
+    """
+
+    def __init__(self, max_sessions: int = None, per_host: int = None, connect_timeout: float = None,
+                 read_timeout: float = None, dns_cache_ttl: int = None, http2: bool = None, impersonate: str = None):
+        self.max_sessions = max_sessions or int(os.getenv("SCRAPER_MAX_SESSIONS", "16"))
+        self.per_host = per_host or int(os.getenv("SCRAPER_PER_HOST", "6"))
+        self.connect_timeout = connect_timeout or float(os.getenv("SCRAPER_CONNECT_TIMEOUT", "4"))
+        self.read_timeout = read_timeout or float(os.getenv("SCRAPER_READ_TIMEOUT", "8"))
+        self.dns_cache_ttl = dns_cache_ttl or int(os.getenv("SCRAPER_DNS_CACHE_TTL", "300"))
+        self.http2 = http2 if http2 is not None else os.getenv("SCRAPER_HTTP2", "1") != "0"
+        self.impersonate = impersonate or os.getenv("SCRAPER_IMPERSONATE", "chrome110")
+        self._idle = queue.LifoQueue()
+        self._slots = threading.BoundedSemaphore(self.max_sessions)
+        self._hosts = {}  # host -> [semaphore, users]
+        self._hosts_lock = threading.Lock()
+        self._all = []
+        self._closed = False
+        self.stats = {"requests": 0, "sessions": 0, "reused": 0, "host_waits": 0, "errors": 0}
+
+    def _new_session(self):
+        from curl_cffi import requests as cffi_requests
+        from curl_cffi import CurlOpt, CurlHttpVersion
+        session = cffi_requests.Session(
+            impersonate=self.impersonate,
+            timeout=(self.connect_timeout, self.read_timeout),
+            http_version=CurlHttpVersion.V2TLS if self.http2 else CurlHttpVersion.V1_1,
+            curl_options={CurlOpt.DNS_CACHE_TIMEOUT: self.dns_cache_ttl},
+        )
+        self._all.append(session)
+        self.stats["sessions"] += 1
+        return session
+
+    @contextmanager
+    def _session(self):
+        self._slots.acquire()
+        try:
+            try:
+                session = self._idle.get_nowait()
+                self.stats["reused"] += 1
+            except queue.Empty:
+                session = self._new_session()
+            try:
+                yield session
+            finally:
+                if not self._closed: self._idle.put(session)
+        finally:
+            self._slots.release()
+
+    @contextmanager
+    def _host_slot(self, url: str):
+        host = urlparse(url).netloc.lower()
+        with self._hosts_lock:
+            entry = self._hosts.setdefault(host, [threading.BoundedSemaphore(self.per_host), 0])
+            entry[1] += 1
+        if not entry[0].acquire(blocking=False):
+            self.stats["host_waits"] += 1
+            entry[0].acquire()
+        try:
+            yield
+        finally:
+            entry[0].release()
+            with self._hosts_lock:
+                entry[1] -= 1
+                if entry[1] == 0: self._hosts.pop(host, None)
+
+    def fetch(self, url: str, max_bytes: int = None, **kwargs) -> dict:
+        """Streamed, size-capped GET (see html_fetch.fetch_html) on a pooled session."""
+        if self._closed: raise RuntimeError("scraper client is closed")
+        if not url.startswith("http"): url = "https://" + url
+        self.stats["requests"] += 1
+        with self._host_slot(url), self._session() as session:
+            try:
+                return fetch_html(session.get, url, max_bytes=max_bytes, **kwargs)
+            except Exception:
+                self.stats["errors"] += 1
+                raise
+
+    def close(self):
+        self._closed = True
+        for session in self._all:
+            try: session.close()
+            except Exception: pass
+        self._all.clear()
+
+    def info(self) -> dict:
+        return {**self.stats, "idle": self._idle.qsize(), "max_sessions": self.max_sessions, "per_host": self.per_host}
+
+
+_client = None
+_client_lock = threading.Lock()
+
+
+def get_scraper_client() -> ScraperClient:
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None: _client = ScraperClient()
+    return _client
+
+
+def close_scraper_client():
+    global _client
+    if _client is not None:
+        _client.close()
+        _client = None
@@ -0,0 +1,56 @@
+# single_flight.py
+# Request coalescing: concurrent calls with the same key share one in-flight computation
+# The first caller starts the work as a task; callers arriving before it finishes await
+# the same task and receive the same result (or exception).
+
+import asyncio
+
+
+class SingleFlight:
+    """
+    Usage:
+        flight = SingleFlight()
+        result, callers = await flight.do(key, lambda: compute(...))
+        waiter, joined = flight.join(key, lambda: compute(...))   # registers now, await waiter later
+
+    `callers` is how many callers shared that computation (1 = nobody joined).
+    The shared task is shielded, so one caller disconnecting does not cancel it for the others.
+    """
+
+    def __init__(self):
+        self._flights = {}  # key -> [task, callers]
+        self.stats = {"leaders": 0, "coalesced": 0, "in_flight": 0}
+
+    async def do(self, key, coro_fn):
+        waiter, _ = self.join(key, coro_fn)
+        return await waiter
+
+    def join(self, key, coro_fn) -> tuple:
+        """
+        Registers the caller synchronously: (coroutine returning (result, callers), joined).
+        `coro_fn` only runs when this caller leads; `joined` is True when it did not.
+        """
+        flight = self._flights.get(key)
+        joined = flight is not None
+        if not joined:
+            flight = [asyncio.ensure_future(coro_fn()), 1]
+            self._flights[key] = flight
+            self.stats["leaders"] += 1
+            self.stats["in_flight"] = len(self._flights)
+            flight[0].add_done_callback(lambda _: self._forget(key, flight))
+        else:
+            flight[1] += 1
+            self.stats["coalesced"] += 1
+        return self._wait(flight), joined
+
+    async def _wait(self, flight):
+        result = await asyncio.shield(flight[0])
+        return result, flight[1]
+
+    def _forget(self, key, flight):
+        if self._flights.get(key) is flight:
+            del self._flights[key]
+        self.stats["in_flight"] = len(self._flights)
+
+    def in_flight(self, key) -> bool:
+        return key in self._flights
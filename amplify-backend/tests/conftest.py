@@ -0,0 +1,12 @@
+# tests/conftest.py
+# Puts the backend modules (and the benchmark harness stand-ins) on sys.path so tests import
+# them the way main.py does
+#   python -m pytest tests
+
+import os
+import sys
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+for path in (os.path.join(BACKEND_DIR, "benchmarks"), BACKEND_DIR):
+    if path not in sys.path:
+        sys.path.insert(0, path)
@@ -0,0 +1,31 @@
+# tests/test_html_fetch.py
+# fetch_html against the harness StaticSite: whole small pages, abort at the byte budget, charset decoding
+
+import pytest
+
+from harness import StaticSite
+from html_fetch import fetch_html, decode_html
+
+cffi_requests = pytest.importorskip("curl_cffi.requests")
+
+
+def test_small_page_is_read_whole():
+    html = "<html><head><title>Small</title></head><body><p>héllo</p></body></html>"
+    with StaticSite(default_page=html) as site:
+        page = fetch_html(cffi_requests.get, site.url + "/", max_bytes=10_000, timeout=10)
+    assert page["status_code"] == 200 and not page["truncated"]
+    assert page["html"] == html and page["bytes"] == len(html.encode("utf-8"))
+
+
+def test_large_page_stops_at_the_budget():
+    html = "<html><body>" + "<p>filler</p>" * 200_000 + "</body></html>"  # 2.6 MB
+    with StaticSite(default_page=html) as site:
+        page = fetch_html(cffi_requests.get, site.url + "/", max_bytes=50_000, timeout=10)
+    assert page["status_code"] == 200 and page["truncated"]
+    assert page["bytes"] == 50_000 and page["html"] == html[:50_000]
+
+
+def test_decode_uses_meta_charset_and_survives_a_cut_character():
+    raw = '<meta charset="iso-8859-1"><p>caf\xe9</p>'.encode("latin-1")
+    assert "café" in decode_html(raw)
+    assert decode_html("é".encode("utf-8")[:1]) == "�"
@@ -0,0 +1,51 @@
+# tests/test_llm_hedge.py
+# HedgedCaller: hedging a slow primary, falling back on failure, counters under concurrent calls
+
+import time
+import threading
+
+from llm_hedge import HedgedCaller
+
+
+def _fail():
+    raise RuntimeError("provider down")
+
+
+def test_slow_primary_is_hedged_and_the_backup_wins():
+    hedge = HedgedCaller(initial_delay=0.05)
+    try:
+        name, data = hedge.call([("slow", lambda: time.sleep(1) or "late"), ("fast", lambda: "ok")], timeout=2)
+    finally:
+        hedge.shutdown()
+    assert (name, data) == ("fast", "ok")
+    assert hedge.stats["hedged"] == 1 and hedge.stats["wins"] == {"fast": 1}
+
+
+def test_failure_falls_back_and_all_failed_is_counted():
+    hedge = HedgedCaller(mode="sequential")
+    try:
+        assert hedge.call([("a", _fail), ("b", lambda: "ok")]) == ("b", "ok")
+        assert hedge.call([("a", _fail), ("b", _fail)]) == (None, None)
+    finally:
+        hedge.shutdown()
+    stats = hedge.stats
+    assert stats["calls"] == 2 and stats["fallbacks"] == 2 and stats["all_failed"] == 1
+
+
+def test_counters_are_exact_under_concurrent_calls():
+    hedge = HedgedCaller(max_workers=8)
+    threads, per_thread = 16, 100
+
+    def worker():
+        for _ in range(per_thread):
+            hedge.call([("groq", lambda: "ok")], timeout=5)
+
+    pool = [threading.Thread(target=worker) for _ in range(threads)]
+    try:
+        for t in pool: t.start()
+        for t in pool: t.join()
+    finally:
+        hedge.shutdown()
+    stats = hedge.stats
+    assert stats["calls"] == threads * per_thread
+    assert stats["wins"] == {"groq": threads * per_thread}
@@ -0,0 +1,72 @@
+# tests/test_rate_limiter.py
+# Sliding-window limit on both backends (RedisBackend against the harness FakeRedis); clock is faked
+
+import time
+
+import pytest
+
+from harness import FakeRedis
+from rate_limiter import RateLimiter, MemoryBackend, RedisBackend
+
+WINDOW = 60
+LIMIT = 3
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000 * WINDOW  # start of a window
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(time, "time", fake)  # RateLimiter and FakeRedis expiry read time.time
+    return fake
+
+
+@pytest.fixture(params=["memory", "redis"])
+def limiter(request, clock):
+    backend = MemoryBackend() if request.param == "memory" else RedisBackend(FakeRedis())
+    return RateLimiter(LIMIT, WINDOW, backend=backend)
+
+
+def test_allowed_then_limited_then_allowed_after_the_window(limiter, clock):
+    assert [limiter.allow("1.2.3.4") for _ in range(LIMIT)] == [True] * LIMIT
+    assert limiter.allow("1.2.3.4") is False
+    assert limiter.allow("5.6.7.8") is True       # other keys have their own budget
+    clock.now += WINDOW - 1
+    assert limiter.allow("1.2.3.4") is False      # still inside the same window
+    clock.now += 2 * WINDOW
+    assert [limiter.allow("1.2.3.4") for _ in range(LIMIT)] == [True] * LIMIT
+    assert limiter.stats["denied"] == 2 and limiter.stats["errors"] == 0
+
+
+def test_previous_window_is_weighted_by_its_overlap(limiter, clock):
+    for _ in range(LIMIT): limiter.allow("ip")
+    clock.now += WINDOW + WINDOW // 2             # half of the previous window still overlaps: 1.5 used
+    assert limiter.allow("ip") is True            # 1.5 + 0 < 3
+    assert limiter.allow("ip") is True            # 1.5 + 1 < 3
+    assert limiter.allow("ip") is False           # 1.5 + 2 >= 3
+
+
+def test_denied_requests_do_not_use_up_the_next_window(limiter, clock):
+    for _ in range(LIMIT + 5): limiter.allow("ip")
+    clock.now += WINDOW + WINDOW * 2 // 3         # a third of the previous window overlaps: 1 used
+    assert [limiter.allow("ip") for _ in range(3)] == [True, True, False]
+
+
+def test_backend_errors_fail_open(clock):
+    class Broken:
+        def hit(self, *args): raise ConnectionError("redis down")
+
+    limiter = RateLimiter(LIMIT, WINDOW, backend=Broken())
+    assert all(limiter.allow("ip") for _ in range(LIMIT + 2))
+    assert limiter.stats["errors"] == LIMIT + 2
+
+
+def test_only_shared_backends_are_blocking():
+    assert RateLimiter(LIMIT, WINDOW).blocking is False
+    assert RateLimiter(LIMIT, WINDOW, backend=RedisBackend(FakeRedis())).blocking is True
@@ -0,0 +1,60 @@
+# tests/test_single_flight.py
+# SingleFlight: one computation per key, synchronous registration through join()
+
+import asyncio
+
+from single_flight import SingleFlight
+
+
+def test_concurrent_callers_share_one_run():
+    async def go():
+        flight, runs = SingleFlight(), []
+
+        async def compute():
+            runs.append(1)
+            await asyncio.sleep(0.01)
+            return "value"
+
+        results = await asyncio.gather(*(flight.do("k", compute) for _ in range(5)))
+        return flight, runs, results
+
+    flight, runs, results = asyncio.run(go())
+    assert len(runs) == 1 and results == [("value", 5)] * 5
+    assert flight.stats == {"leaders": 1, "coalesced": 4, "in_flight": 0}
+
+
+def test_join_registers_before_the_caller_awaits():
+    async def go():
+        flight, started = SingleFlight(), []
+
+        async def compute(name):
+            started.append(name)
+            await asyncio.sleep(0.01)
+            return name
+
+        # Both join before either waiter is awaited or scheduled: only the first leads
+        first, first_joined = flight.join("k", lambda: compute("first"))
+        second, second_joined = flight.join("k", lambda: compute("second"))
+        assert (first_joined, second_joined) == (False, True)
+        results = await asyncio.gather(asyncio.ensure_future(second), asyncio.ensure_future(first))
+        return started, results
+
+    started, results = asyncio.run(go())
+    assert started == ["first"]
+    assert results == [("first", 2), ("first", 2)]
+
+
+def test_errors_reach_every_caller_and_the_key_is_released():
+    async def go():
+        flight = SingleFlight()
+
+        async def boom():
+            await asyncio.sleep(0.01)
+            raise ValueError("scan failed")
+
+        outcomes = await asyncio.gather(flight.do("k", boom), flight.do("k", boom), return_exceptions=True)
+        return flight, outcomes
+
+    flight, outcomes = asyncio.run(go())
+    assert all(isinstance(o, ValueError) for o in outcomes)
+    assert not flight.in_flight("k")
@@ -0,0 +1,88 @@
+# tests/test_text_analysis.py
+# Lexicon text analyzer against reference values on benchmarks/fixtures/content_corpus.json
+
+import os
+import json
+
+import pytest
+
+import text_analysis
+
+CORPUS = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "benchmarks", "fixtures", "content_corpus.json")
+
+# Reference: TextBlob 0.20.1's offline pattern pipeline (PatternTagger + PatternAnalyzer + the
+# pattern sentence tokenizer, as in benchmarks/bench_text_analysis.py::_pattern_reference).
+# The NLTK-backed pipeline (TEXT_ANALYZER=textblob) needs corpora that are not installed
+# offline, so it is not the reference here. id -> (density, polarity, sentence_count)
+REFERENCE = {
+    "saas_landing": (0.5949, 0.1050, 7),
+    "local_plumber": (0.5758, 0.2833, 6),
+    "ecommerce_store": (0.4154, 0.3786, 7),
+    "law_firm": (0.5342, 0.2667, 6),
+    "negative_review": (0.4912, -0.3500, 6),
+    "startup_about": (0.5323, 0.0236, 5),
+    "consultant_bio": (0.4918, 0.2875, 4),
+    "restaurant_menu": (0.5370, 0.3667, 5),
+    "nonprofit": (0.4717, 0.2238, 5),
+    "nav_heavy_fragment": (0.9643, 0.0000, 1),
+    "fintech_faq": (0.5000, 0.1600, 11),
+    "mixed_sentiment": (0.3968, 0.2071, 5),
+}
+
+# The lexicon tagger tokenizes hyphenated/contracted words slightly differently and guesses
+# unknown words by suffix, so density may drift per text; sentiment uses the same lexicon and rules
+DENSITY_TOLERANCE = 0.04
+MEAN_DENSITY_TOLERANCE = 0.02
+POLARITY_TOLERANCE = 0.005
+
+
+def _corpus() -> dict:
+    with open(CORPUS, encoding="utf-8") as f:
+        return {entry["id"]: entry["text"] for entry in json.load(f)["texts"]}
+
+
+@pytest.fixture
+def lexicon_analyzer(monkeypatch):
+    monkeypatch.setattr(text_analysis, "TEXT_ANALYZER", "lexicon")
+    text_analysis._analyze_cached.cache_clear()
+    yield text_analysis.analyze_text
+    text_analysis._analyze_cached.cache_clear()
+
+
+def test_corpus_has_a_reference_for_every_text():
+    assert set(_corpus()) == set(REFERENCE)
+
+
+@pytest.mark.parametrize("text_id", sorted(REFERENCE))
+def test_density_sentiment_and_sentences_match_reference(lexicon_analyzer, text_id):
+    density, polarity, sentences = REFERENCE[text_id]
+    result = lexicon_analyzer(_corpus()[text_id])
+    assert result["density"] == pytest.approx(density, abs=DENSITY_TOLERANCE)
+    assert result["polarity"] == pytest.approx(polarity, abs=POLARITY_TOLERANCE)
+    assert result["sentence_count"] == sentences
+    assert result["meaningful_count"] <= result["word_count"]
+
+
+def test_mean_density_matches_reference(lexicon_analyzer):
+    texts = _corpus()
+    diffs = [lexicon_analyzer(texts[text_id])["density"] - REFERENCE[text_id][0] for text_id in REFERENCE]
+    assert abs(sum(diffs) / len(diffs)) <= MEAN_DENSITY_TOLERANCE
+
+
+def test_missing_lexicons_raise_and_are_not_cached_empty(monkeypatch):
+    monkeypatch.setattr(text_analysis, "_tag_lexicon", None)
+    monkeypatch.setattr(text_analysis, "_load_error", None)
+    monkeypatch.setattr(text_analysis.importlib.util, "find_spec", lambda name: None)
+    with pytest.raises(text_analysis.LexiconUnavailable):
+        text_analysis.load_lexicons()
+    assert text_analysis._tag_lexicon is None
+    with pytest.raises(text_analysis.LexiconUnavailable):
+        text_analysis.load_lexicons()  # the failure is remembered, not retried or papered over
+
+
+def test_lexicon_analyzer_falls_back_to_textblob(monkeypatch):
+    monkeypatch.setattr(text_analysis, "_tag_lexicon", None)
+    monkeypatch.setattr(text_analysis, "_load_error", text_analysis.LexiconUnavailable("missing"))
+    fallback = {"word_count": 2, "meaningful_count": 1, "density": 0.5, "sentence_count": 1, "polarity": 0.0}
+    monkeypatch.setattr(text_analysis, "_analyze_textblob", lambda text: fallback)
+    assert text_analysis._analyze_lexicon("Hello world.") is fallback
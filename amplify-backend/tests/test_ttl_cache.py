@@ -0,0 +1,97 @@
+# tests/test_ttl_cache.py
+# TTLCache: LRU eviction order, TTL expiry, the byte bound and the sweep (clock is faked)
+
+import pytest
+
+import ttl_cache
+from ttl_cache import TTLCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(ttl_cache.time, "monotonic", fake)
+    return fake
+
+
+def test_evicts_least_recently_used_first(clock):
+    cache = TTLCache(maxsize=3, ttl=60)
+    for key in "abc": cache.set(key, key.upper())
+    assert cache.get("a") == "A"          # a is now the most recent
+    cache.set("d", "D")                   # evicts b, the least recent
+    assert "b" not in cache
+    assert [k for k in "acd" if k in cache] == ["a", "c", "d"]
+    cache.set("c", "C2")                  # overwrite refreshes recency
+    cache.set("e", "E")                   # evicts a
+    assert "a" not in cache and cache.get("c") == "C2"
+    assert cache.evictions == 2
+    assert len(cache) == 3
+
+
+def test_entries_expire_after_ttl(clock):
+    cache = TTLCache(maxsize=10, ttl=60)
+    cache.set("default", 1)
+    cache.set("short", 2, ttl=5)
+    clock.now += 5
+    assert cache.get("short") is None
+    assert cache.get("default") == 1
+    clock.now += 55
+    assert cache.get("default", "gone") == "gone"
+    assert cache.expirations == 2
+    assert cache.stats["hits"] == 1 and cache.stats["misses"] == 2
+    assert len(cache) == 0
+
+
+def test_byte_bound_evicts_oldest_until_under_limit(clock):
+    cache = TTLCache(maxsize=100, ttl=60, max_bytes=100, sizeof=len)
+    cache.set("a", "x" * 40)
+    cache.set("b", "x" * 40)
+    assert cache.stats["bytes"] == 80
+    cache.set("c", "x" * 40)              # 120 > 100: a goes
+    assert "a" not in cache and "b" in cache and "c" in cache
+    assert cache.stats["bytes"] == 80
+    cache.set("b", "x" * 10)              # replacing an entry releases its old size
+    assert cache.stats["bytes"] == 50
+    cache.set("big", "x" * 500)           # larger than the bound on its own: kept, everything else evicted
+    assert len(cache) == 1 and cache.get("big") is not None
+    assert cache.stats["bytes"] == 500
+
+
+def test_pop_and_clear_release_bytes(clock):
+    cache = TTLCache(maxsize=10, ttl=60, max_bytes=1000, sizeof=len)
+    cache.set("a", "xxxx")
+    assert cache.pop("a") == "xxxx" and cache.pop("a", "none") == "none"
+    cache.set("b", "yy")
+    cache.clear()
+    assert len(cache) == 0 and cache.stats["bytes"] == 0
+
+
+def test_sweep_drops_every_expired_entry(clock):
+    cache = TTLCache(maxsize=10, ttl=60, sweep_interval=30)
+    cache.set("old1", 1, ttl=10)
+    cache.set("old2", 2, ttl=10)
+    cache.set("fresh", 3, ttl=100)
+    clock.now += 20
+    assert len(cache) == 3                # expired entries linger until read or swept
+    assert cache.sweep() == 2
+    assert len(cache) == 1 and cache.expirations == 2
+
+
+def test_sweep_is_piggybacked_on_writes_once_per_interval(clock):
+    cache = TTLCache(maxsize=10, ttl=10, sweep_interval=30)
+    cache.set("a", 1)
+    clock.now += 20                       # a expired, but no sweep is due yet
+    cache.set("b", 2)
+    assert len(cache) == 2
+    clock.now += 15                       # 35 s after construction: the next write sweeps
+    cache.set("c", 3)
+    assert "a" not in cache._data and "b" not in cache._data
+    assert len(cache) == 1
@@ -0,0 +1,93 @@
+# tests/test_write_behind.py
+# WriteBehindBuffer against the harness FakePostgREST: outage -> rows spilled, recovery -> replayed
+
+import json
+import asyncio
+import urllib.request
+
+import pytest
+
+from harness import FakePostgREST
+from write_behind import WriteBehindBuffer
+
+
+def _inserter(fake):
+    def insert(rows: list):
+        req = urllib.request.Request(f"{fake.url}/rest/v1/scan_logs", data=json.dumps(rows).encode(),
+                                     headers={"Content-Type": "application/json"})
+        urllib.request.urlopen(req, timeout=5).read()
+    return insert
+
+
+def _spilled(path) -> list:
+    if not path.exists(): return []
+    return [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+
+
+@pytest.fixture
+def fake():
+    with FakePostgREST() as db:
+        yield db
+
+
+def test_failed_flush_spills_and_recovery_replays(fake, tmp_path):
+    spill = tmp_path / "scan_logs.spill.jsonl"
+
+    async def go():
+        buffer = WriteBehindBuffer(_inserter(fake), batch_size=4, interval=60, spill_path=str(spill))
+        fake.down = True
+        for i in range(10): buffer.add({"url": f"https://site{i}.example", "final_score": i})
+        assert await buffer.flush() is False
+        assert [row["url"] for row in _spilled(spill)] == [f"https://site{i}.example" for i in range(10)]
+        assert buffer.stats["pending"] == 0 and buffer.stats["spill_rows"] == 10
+        assert buffer.counters["spilled"] == 10 and "scan_logs" not in fake.tables
+
+        fake.down = False
+        buffer.add({"url": "https://site10.example", "final_score": 10})
+        assert await buffer.flush() is True
+        return buffer
+
+    buffer = asyncio.run(go())
+    stored = [row["url"] for row in fake.tables["scan_logs"]]
+    assert sorted(stored) == sorted(f"https://site{i}.example" for i in range(11))
+    assert not spill.exists() and buffer.stats["spill_rows"] == 0
+    assert buffer.counters["replayed"] == 10 and buffer.counters["spill_dropped"] == 0
+
+
+def test_close_lets_the_flusher_finish_and_spills_the_rest(fake, tmp_path):
+    spill = tmp_path / "scan_logs.spill.jsonl"
+
+    async def go():
+        buffer = WriteBehindBuffer(_inserter(fake), batch_size=2, interval=60, spill_path=str(spill))
+        flusher = asyncio.create_task(buffer.run())
+        await asyncio.sleep(0)
+        for i in range(3): buffer.add({"url": f"https://ok{i}.example"})
+        await buffer.close()
+        assert flusher.done()
+        fake.down = True
+        buffer.add({"url": "https://late.example"})
+        await buffer.close()
+
+    asyncio.run(go())
+    assert sorted(row["url"] for row in fake.tables["scan_logs"]) == [f"https://ok{i}.example" for i in range(3)]
+    assert [row["url"] for row in _spilled(spill)] == ["https://late.example"]
+
+
+def test_leftover_spill_file_is_counted_and_replayed_on_start(fake, tmp_path):
+    spill = tmp_path / "scan_logs.spill.jsonl"
+    spill.write_text("".join(json.dumps({"url": f"https://old{i}.example"}) + "\n" for i in range(3)) + '{"url": "torn', encoding="utf-8")
+
+    async def go():
+        buffer = WriteBehindBuffer(_inserter(fake), batch_size=50, interval=0.05, spill_path=str(spill))
+        flusher = asyncio.create_task(buffer.run())
+        for _ in range(100):
+            await asyncio.sleep(0.02)
+            if buffer.counters["replayed"]: break
+        await buffer.close()
+        await flusher
+        return buffer
+
+    buffer = asyncio.run(go())
+    assert sorted(row["url"] for row in fake.tables["scan_logs"]) == [f"https://old{i}.example" for i in range(3)]
+    assert buffer.counters["replayed"] == 3 and buffer.counters["spill_dropped"] == 1  # the torn last line
+    assert not spill.exists()
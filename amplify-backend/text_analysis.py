@@ -0,0 +1,222 @@
+# text_analysis.py
+# Pluggable NLP backend for content scoring: POS density, sentence count, sentiment
+# "lexicon" (default): one regex tokenization pass + lookup-table tagger + sentiment lexicon
+# "textblob": the original TextBlob pipeline (needs the NLTK corpora)
+# Select with TEXT_ANALYZER=lexicon|textblob. Results are memoized per text.
+# The lexicon backend reads TextBlob's bundled data files; when they cannot be loaded it says so
+# and falls back to the TextBlob pipeline instead of scoring every page with empty lexicons.
+
+import os
+import re
+import threading
+import importlib.util
+from functools import lru_cache
+from xml.etree import ElementTree
+
+TEXT_ANALYZER = os.getenv("TEXT_ANALYZER", "lexicon")
+
+# Nouns and verbs count as "information-carrying" words
+MEANINGFUL_TAGS = {'NN', 'NNS', 'NNP', 'NNPS', 'VB', 'VBD', 'VBG', 'VBN', 'VBP', 'VBZ'}
+
+# Words (with inner hyphens/apostrophes/periods as in "e.g." or "state-of-the-art"),
+# standalone "n't" contractions are split below; sentence punctuation is kept as tokens.
+TOKEN_RE = re.compile(r"[A-Za-z0-9]+(?:[-'’.][A-Za-z0-9]+)*|[.!?]+")
+NEGATIONS = {"no", "not", "n't", "never"}
+
+
+def analyze_text(text: str) -> dict:
+    """
+    Returns {'word_count', 'meaningful_count', 'density', 'sentence_count', 'polarity'}
+    for `text` using the configured backend. Same text => cached result.
+    """
+    return _analyze_cached(TEXT_ANALYZER, text)
+
+
+@lru_cache(maxsize=256)
+def _analyze_cached(backend: str, text: str) -> dict:
+    return ANALYZERS.get(backend, _analyze_lexicon)(text)
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# LEXICON BACKEND
+# ═══════════════════════════════════════════════════════════════════════════
+
+_load_lock = threading.Lock()
+_tag_lexicon = None         # word -> Penn tag (Brill lexicon shipped with TextBlob/pattern)
+_sentiment_lexicon = None   # word -> (polarity, subjectivity, intensity), all senses averaged
+_sentiment_modifiers = None # words with an adverb sense ("very", "really", "terribly")
+_load_error = None          # LexiconUnavailable from the failed load, re-raised without retrying
+
+
+class LexiconUnavailable(RuntimeError):
+    """TextBlob's lexicon files are missing or unreadable."""
+
+
+def _data_path(filename: str) -> str:
+    """Locates TextBlob's bundled data files without importing textblob (which pulls in NLTK)."""
+    spec = importlib.util.find_spec("textblob")
+    if spec is None or not spec.submodule_search_locations:
+        raise LexiconUnavailable(f"textblob is not installed, {filename} ships with it")
+    return os.path.join(list(spec.submodule_search_locations)[0], "en", filename)
+
+
+def load_lexicons():
+    """Loads both lexicons once per process (safe to call repeatedly); raises LexiconUnavailable."""
+    global _tag_lexicon, _sentiment_lexicon, _sentiment_modifiers, _load_error
+    if _tag_lexicon is not None: return
+    with _load_lock:
+        if _tag_lexicon is not None: return
+        if _load_error is not None: raise _load_error
+        tags, sentiment, modifiers = {}, {}, set()
+        try:
+            with open(_data_path("en-lexicon.txt"), encoding="utf-8") as f:
+                for line in f:
+                    if line.startswith(";;;"): continue
+                    parts = line.split()
+                    if len(parts) >= 2: tags[parts[0]] = parts[1]
+
+            senses = {}
+            for w in ElementTree.parse(_data_path("en-sentiment.xml")).getroot().findall("word"):
+                form = w.attrib.get("form")
+                if not form: continue
+                psi = (float(w.attrib.get("polarity", 0.0)), float(w.attrib.get("subjectivity", 0.0)), float(w.attrib.get("intensity", 1.0)))
+                senses.setdefault(form, {}).setdefault(w.attrib.get("pos"), []).append(psi)
+            adverbs = {}
+            for form, by_pos in senses.items():
+                by_pos = {pos: tuple(sum(v) / len(v) for v in zip(*psis)) for pos, psis in by_pos.items()}
+                if "RB" in by_pos: modifiers.add(form)
+                sentiment[form] = tuple(sum(v) / len(v) for v in zip(*by_pos.values()))
+                # "terrible" -> "terribly" (same mapping pattern applies, after all words load)
+                if "JJ" in by_pos:
+                    stem = form[:-1] + "i" if form.endswith("y") else form
+                    stem = stem[:-2] if stem.endswith("le") else stem
+                    adverbs[stem + "ly"] = by_pos["JJ"]
+            sentiment.update(adverbs)
+            modifiers.update(adverbs)
+        except Exception as e:
+            _load_error = e if isinstance(e, LexiconUnavailable) else LexiconUnavailable(f"lexicon load failed: {e}")
+            print(f"   ❌ Lexicon text analyzer unavailable ({_load_error}), using the TextBlob pipeline")
+            raise _load_error
+        _sentiment_lexicon, _sentiment_modifiers = sentiment, modifiers
+        _tag_lexicon = tags
+
+
+def _tokenize(text: str) -> list:
+    tokens = []
+    for tok in TOKEN_RE.findall(text):
+        if tok[0] in ".!?":
+            tokens.append(tok)
+            continue
+        tok = tok.rstrip(".").replace("’", "'") or tok
+        low = tok.lower()
+        if low.endswith("n't") and len(tok) > 3:
+            tokens.append(tok[:-3]); tokens.append("n't")
+        elif low.endswith(("'s", "'m", "'d")) and len(tok) > 2:
+            tokens.append(tok[:-2]); tokens.append(tok[-2:])
+        elif low.endswith(("'re", "'ve", "'ll")) and len(tok) > 3:
+            tokens.append(tok[:-3]); tokens.append(tok[-3:])
+        else:
+            tokens.append(tok)
+    return tokens
+
+
+def _guess_tag(word: str, sentence_start: bool) -> str:
+    """Tag for words missing from the lexicon (same defaults as pattern: NN / NNP / CD)."""
+    if word[0].isdigit(): return "CD"
+    if word[0].isupper() and not sentence_start: return "NNP"
+    low = word.lower()
+    if low.endswith("ing"): return "VBG"
+    if low.endswith("ed"): return "VBN"
+    if low.endswith("ly"): return "RB"
+    if low.endswith(("able", "ible", "ful", "ous", "ive", "ical", "less")): return "JJ"
+    if low.endswith("s") and not low.endswith("ss"): return "NNS"
+    return "NN"
+
+
+def _analyze_lexicon(text: str) -> dict:
+    try:
+        load_lexicons()
+    except LexiconUnavailable:
+        return _analyze_textblob(text)  # logged once by load_lexicons
+    tags, lexicon, modifiers = _tag_lexicon, _sentiment_lexicon, _sentiment_modifiers
+
+    word_count = meaningful = sentences = 0
+    sentence_start = True
+    pending_words = False
+    # Sentiment assessments: [polarity, intensity, negated] per known word (pattern's rules)
+    assessments = []
+    modifier = negation = None
+
+    for tok in _tokenize(text):
+        if tok[0] in ".!?":
+            if pending_words:
+                sentences += 1
+                pending_words = False
+            if "!" in tok and assessments:
+                assessments[-1][0] = max(-1.0, min(assessments[-1][0] * 1.25, 1.0))
+            sentence_start = True
+            continue
+
+        word_count += 1
+        pending_words = True
+        tag = tags.get(tok) or tags.get(tok.lower()) or _guess_tag(tok, sentence_start)
+        if tag in MEANINGFUL_TAGS: meaningful += 1
+        sentence_start = False
+
+        w = tok.lower()
+        if w in lexicon:
+            p, _, i = lexicon[w]
+            if modifier is None:
+                assessments.append([p, i, 1])
+            else:
+                assessments[-1][0] = max(-1.0, min(p * assessments[-1][1], 1.0))
+                assessments[-1][1] = i
+            if negation is not None:
+                assessments[-1][1] = 1.0 / assessments[-1][1] if assessments[-1][1] else 1.0
+                assessments[-1][2] = -1
+            modifier = w if w in modifiers else None
+            negation = w if w in NEGATIONS else None
+        else:
+            if w in NEGATIONS:
+                negation = w
+            elif negation and len(w.strip("'")) > 1:
+                negation = None
+            if negation is not None and modifier is not None and modifier.endswith("ly") and assessments:
+                assessments[-1][2] = -1
+                negation = None
+            elif modifier and len(w) > 2:
+                modifier = None
+
+    if pending_words: sentences += 1
+    polarity = sum(p * -0.5 if n < 0 else p for p, _, n in assessments) / (len(assessments) or 1)
+    return {
+        "word_count": word_count,
+        "meaningful_count": meaningful,
+        "density": meaningful / (word_count or 1),
+        "sentence_count": sentences,
+        "polarity": polarity,
+    }
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# TEXTBLOB BACKEND (reference implementation)
+# ═══════════════════════════════════════════════════════════════════════════
+
+def _analyze_textblob(text: str) -> dict:
+    from textblob import TextBlob
+    blob = TextBlob(text)
+    meaningful = sum(1 for word, tag in blob.tags if tag in MEANINGFUL_TAGS)
+    word_count = len(blob.words)
+    return {
+        "word_count": word_count,
+        "meaningful_count": meaningful,
+        "density": meaningful / (word_count or 1),
+        "sentence_count": len(blob.sentences),
+        "polarity": blob.sentiment.polarity,
+    }
+
+
+ANALYZERS = {
+    "lexicon": _analyze_lexicon,
+    "textblob": _analyze_textblob,
+}
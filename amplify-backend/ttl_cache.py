@@ -0,0 +1,120 @@
+# ttl_cache.py
+# Bounded in-process LRU cache with per-entry time-to-live
+# O(1) get/set/evict (OrderedDict), bounded by entry count and approximate bytes.
+# Expired entries are dropped lazily on read and by a periodic sweep piggybacked on writes.
+# Used for the scan-result cache (tier 1 in front of Supabase) and the persona cache.
+
+import time
+import threading
+from collections import OrderedDict
+
+
+def approx_size(value) -> int:
+    """Rough footprint of a JSON-like value: string/bytes lengths plus a fixed cost per container/scalar."""
+    if isinstance(value, (str, bytes, bytearray)): return len(value)
+    if isinstance(value, dict): return 64 + sum(approx_size(k) + approx_size(v) for k, v in value.items())
+    if isinstance(value, (list, tuple, set)): return 56 + sum(approx_size(v) for v in value)
+    return 16
+
+
+class TTLCache:
+    """
+    Usage:
+        cache = TTLCache(maxsize=1000, ttl=3600, max_bytes=8_000_000)
+        cache.set(key, value)            # default ttl
+        cache.set(key, value, ttl=60)    # per-entry ttl
+        value = cache.get(key)           # None when missing or expired
+
+    Least recently used entries are evicted once `maxsize` entries or `max_bytes`
+    (sum of `sizeof(value)`) is exceeded. Every `sweep_interval` seconds the next
+    write also drops all expired entries.
+    """
+
+    def __init__(self, maxsize: int = 1000, ttl: float = 3600, max_bytes: int = None,
+                 sweep_interval: float = 60, sizeof=approx_size):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.sweep_interval = sweep_interval
+        self.sizeof = sizeof
+        self._data = OrderedDict()  # key -> (expires_at, size, value)
+        self._bytes = 0
+        self._next_sweep = time.monotonic() + sweep_interval
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def get(self, key, default=None):
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                self.misses += 1
+                return default
+            if entry[0] <= time.monotonic():
+                self._remove(key)
+                self.expirations += 1
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return entry[2]
+
+    def set(self, key, value, ttl: float = None):
+        size = self.sizeof(value) if self.max_bytes else 0
+        now = time.monotonic()
+        with self._lock:
+            if key in self._data: self._remove(key)
+            self._data[key] = (now + (self.ttl if ttl is None else ttl), size, value)
+            self._bytes += size
+            if now >= self._next_sweep: self._sweep(now)
+            while len(self._data) > self.maxsize or (self.max_bytes and self._bytes > self.max_bytes and len(self._data) > 1):
+                oldest = next(iter(self._data))
+                self._remove(oldest)
+                self.evictions += 1
+
+    def pop(self, key, default=None):
+        with self._lock:
+            if key not in self._data: return default
+            return self._remove(key)[2]
+
+    def sweep(self) -> int:
+        """Drops every expired entry now. Returns how many were removed."""
+        with self._lock:
+            return self._sweep(time.monotonic())
+
+    def _sweep(self, now: float) -> int:
+        expired = [k for k, entry in self._data.items() if entry[0] <= now]
+        for k in expired: self._remove(k)
+        self.expirations += len(expired)
+        self._next_sweep = now + self.sweep_interval
+        return len(expired)
+
+    def _remove(self, key):
+        entry = self._data.pop(key)
+        self._bytes -= entry[1]
+        return entry
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self._bytes = 0
+
+    def __contains__(self, key):
+        entry = self._data.get(key)
+        return entry is not None and entry[0] > time.monotonic()
+
+    def __len__(self):
+        return len(self._data)
+
+    @property
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._data), "maxsize": self.maxsize,
+            "bytes": self._bytes, "max_bytes": self.max_bytes,
+            "hits": self.hits, "misses": self.misses,
+            "evictions": self.evictions, "expirations": self.expirations,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+        }
@@ -0,0 +1,206 @@
+# write_behind.py
+# Write-behind telemetry sink for analytics rows: callers append to an in-memory ring buffer
+# without waiting, a background task inserts them in batches every `batch_size` rows or
+# `interval` seconds. When a batch fails (database unreachable) it is spilled to a local
+# append-only JSONL file and retried with exponential backoff; once a flush succeeds again the
+# spill file is replayed. Rows are only lost when the ring or the spill file is full (counted).
+
+import os
+import json
+import time
+import asyncio
+import threading
+from collections import deque
+
+
+class WriteBehindBuffer:
+    """
+    Usage:
+        buffer = WriteBehindBuffer(flush_rows=insert_many)   # insert_many(rows) blocks, raises on failure
+        buffer.add({"url": ..., ...})                         # never blocks, never raises
+        asyncio.create_task(buffer.run())                     # in the app lifespan
+        await buffer.close()                                  # stops run(), final flush on shutdown
+
+    WRITE_BEHIND_BATCH (default 50) rows or WRITE_BEHIND_INTERVAL (default 5 s) trigger a
+    flush. The ring holds WRITE_BEHIND_MAX_ROWS (default 10000) rows, dropping the oldest.
+    Failed batches go to `spill_path` (WRITE_BEHIND_SPILL_PATH, default
+    .cache/write_behind.spill.jsonl; "off" keeps them in memory) up to
+    WRITE_BEHIND_SPILL_MAX_BYTES (default 50 MB).
+    """
+
+    def __init__(self, flush_rows, batch_size: int = None, interval: float = None, max_rows: int = None,
+                 max_backoff: float = 60.0, run_blocking=None, spill_path: str = None, spill_max_bytes: int = None):
+        self.flush_rows = flush_rows
+        self.batch_size = batch_size or int(os.getenv("WRITE_BEHIND_BATCH", "50"))
+        self.interval = interval or float(os.getenv("WRITE_BEHIND_INTERVAL", "5"))
+        self.max_rows = max_rows or int(os.getenv("WRITE_BEHIND_MAX_ROWS", "10000"))
+        self.max_backoff = max_backoff
+        self.run_blocking = run_blocking  # e.g. io_executor.run_io; defaults to the loop's executor
+        spill_path = spill_path or os.getenv("WRITE_BEHIND_SPILL_PATH", os.path.join(".cache", "write_behind.spill.jsonl"))
+        self.spill_path = None if not spill_path or spill_path.lower() == "off" else spill_path
+        self.spill_max_bytes = spill_max_bytes or int(os.getenv("WRITE_BEHIND_SPILL_MAX_BYTES", "50000000"))
+        self._rows = deque(maxlen=self.max_rows)
+        self._lock = threading.Lock()
+        self._spill_lock = threading.Lock()
+        self._wake = None
+        self._loop = None
+        self._runner = None
+        self._closing = False
+        self._backoff = 0.0
+        self._flush_times = deque(maxlen=256)
+        self._spill_count = 0  # run() adds the rows left on disk by a previous process
+        self.counters = {"queued": 0, "flushed": 0, "batches": 0, "failures": 0, "dropped": 0,
+                         "spilled": 0, "replayed": 0, "spill_dropped": 0}
+
+    def add(self, row: dict):
+        with self._lock:
+            if len(self._rows) == self.max_rows: self.counters["dropped"] += 1
+            self._rows.append(row)
+            self.counters["queued"] += 1
+            full = len(self._rows) >= self.batch_size
+        if full and self._wake is not None and self._backoff == 0:
+            self._loop.call_soon_threadsafe(self._wake.set)
+
+    def _take(self) -> list:
+        with self._lock:
+            return [self._rows.popleft() for _ in range(min(self.batch_size, len(self._rows)))]
+
+    async def _keep(self, batch: list):
+        """
+        Failed batch: spill it and everything queued behind it to disk (the ring then only holds
+        rows added since the last attempt), or put it back at the front of the ring when spilling is off.
+        """
+        if self.spill_path:
+            await self._blocking(self._spill, batch + self._take_all())
+            return
+        with self._lock:
+            room = self.max_rows - len(self._rows)
+            if room < len(batch):
+                self.counters["dropped"] += len(batch) - room
+                batch = batch[len(batch) - room:] if room > 0 else []
+            self._rows.extendleft(reversed(batch))
+
+    # --- SPILL FILE (blocking: called through _blocking, never on the event loop) ---
+
+    def _spill(self, batch: list, replay: bool = False):
+        lines = "".join(json.dumps(row, default=str) + "\n" for row in batch)
+        with self._spill_lock:
+            try:
+                size = os.path.getsize(self.spill_path) if os.path.exists(self.spill_path) else 0
+                if size + len(lines) > self.spill_max_bytes:
+                    self.counters["spill_dropped"] += len(batch)
+                    return
+                if os.path.dirname(self.spill_path): os.makedirs(os.path.dirname(self.spill_path), exist_ok=True)
+                with open(self.spill_path, "a", encoding="utf-8") as f:
+                    f.write(lines)
+                    f.flush()
+                    os.fsync(f.fileno())
+                self._spill_count += len(batch)
+                if not replay: self.counters["spilled"] += len(batch)
+            except OSError as e:
+                self.counters["spill_dropped"] += len(batch)
+                print(f"   ⚠️ Write-behind spill failed ({len(batch)} rows lost): {e}")
+
+    def _count_spill(self) -> int:
+        if not self.spill_path or not os.path.exists(self.spill_path): return 0
+        with open(self.spill_path, encoding="utf-8") as f:
+            return sum(1 for _ in f)
+
+    def _claim_spill(self) -> list:
+        """Moves the spill file's rows into memory (file removed); rows that fail again are re-spilled."""
+        with self._spill_lock:
+            if not self.spill_path or not os.path.exists(self.spill_path): return []
+            replay_path = self.spill_path + ".replay"
+            os.replace(self.spill_path, replay_path)
+            rows = []
+            with open(replay_path, encoding="utf-8") as f:
+                for line in f:
+                    try: rows.append(json.loads(line))
+                    except ValueError: self.counters["spill_dropped"] += 1  # torn last line after a crash
+            os.remove(replay_path)
+            self._spill_count = 0
+            return rows
+
+    # --- FLUSHING ---
+
+    async def _blocking(self, func, *args):
+        if self.run_blocking: return await self.run_blocking(func, *args)
+        return await asyncio.get_running_loop().run_in_executor(None, func, *args)
+
+    async def _write(self, batch: list):
+        t0 = time.monotonic()
+        await self._blocking(self.flush_rows, batch)
+        self._flush_times.append(time.monotonic() - t0)
+        self.counters["flushed"] += len(batch)
+        self.counters["batches"] += 1
+
+    async def flush(self) -> bool:
+        """Writes everything buffered, then replays the spill file. False on the first failure."""
+        while True:
+            batch = self._take()
+            if not batch: break
+            try:
+                await self._write(batch)
+            except Exception as e:
+                await self._keep(batch)
+                self.counters["failures"] += 1
+                print(f"   ⚠️ Write-behind flush failed ({len(batch)} rows kept): {e}")
+                return False
+        spilled = await self._blocking(self._claim_spill)
+        for i in range(0, len(spilled), self.batch_size):
+            batch = spilled[i:i + self.batch_size]
+            try:
+                await self._write(batch)
+            except Exception as e:
+                await self._blocking(self._spill, spilled[i:], True)
+                self.counters["failures"] += 1
+                print(f"   ⚠️ Write-behind replay failed ({len(spilled) - i} rows kept on disk): {e}")
+                return False
+            self.counters["replayed"] += len(batch)
+        return True
+
+    async def run(self):
+        self._loop = asyncio.get_running_loop()
+        self._wake = asyncio.Event()
+        self._runner = asyncio.current_task()
+        self._closing = False
+        self._spill_count += await self._blocking(self._count_spill)
+        while not self._closing:
+            try: await asyncio.wait_for(self._wake.wait(), self._backoff or self.interval)
+            except asyncio.TimeoutError: pass
+            self._wake.clear()
+            if self._closing: break
+            if await self.flush():
+                self._backoff = 0.0
+            else:
+                self._backoff = min(self.max_backoff, max(1.0, self._backoff * 2))
+
+    async def close(self, timeout: float = 5.0):
+        """Lets run() finish its in-flight flush and exit, then flushes the rest (spilling what fails)."""
+        self._closing = True
+        if self._wake is not None: self._wake.set()
+        try:
+            if self._runner is not None and not self._runner.done():
+                await asyncio.wait_for(asyncio.shield(self._runner), timeout)
+            await asyncio.wait_for(self.flush(), timeout)
+        except asyncio.TimeoutError: pass
+        pending = len(self._rows)
+        if pending and self.spill_path:
+            await self._blocking(self._spill, self._take_all())
+        elif pending:
+            print(f"   ⚠️ Write-behind closed with {pending} unsent rows")
+
+    def _take_all(self) -> list:
+        with self._lock:
+            rows = list(self._rows)
+            self._rows.clear()
+            return rows
+
+    @property
+    def stats(self) -> dict:
+        samples = sorted(self._flush_times)
+        pick = lambda pct: round(samples[min(len(samples) - 1, int(round(pct / 100 * (len(samples) - 1))))] * 1000, 1) if samples else 0.0
+        return {
+            **self.counters, "pending": len(self._rows), "spill_rows": self._spill_count,
+            "flush_ms": {"n": len(samples), "p50": pick(50), "p99": pick(99), "max": pick(100)},
+        }